@@ -0,0 +1,315 @@
+"""
+Background disk streaming for DAQ ring buffers.
+
+A writer thread drains each channel's ring buffer into the raw binary run
+format (one memory-mappable file per channel plus an index), so run length
+is limited by disk space rather than RAM. Samples are written straight
+from zero-copy ring buffer views in large batches; buffer fill levels,
+lag and any overruns are tracked so back-pressure is visible while the run
+is in progress.
+
+If a channel overruns, the lost samples keep their slots in the file
+(zero-filled, or holding partially overwritten data), so sample index and
+time stay aligned; the affected ranges are listed under 'gaps' in the run
+index metadata.
+"""
+
+import logging
+import threading
+import time
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .interfaces.ring_buffer import RingBufferReader
+
+# When channel files are forced to stable storage
+FSYNC_POLICIES = ("never", "close", "interval", "batch")
+
+
+class DiskStreamWriter:
+    """Drain per-channel ring buffer readers to a raw binary run on disk."""
+
+    def __init__(
+        self,
+        run_dir: Union[str, Path],
+        readers: Dict[str, RingBufferReader],
+        sample_rate: float,
+        time_origin: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        scaling: Optional[Dict[str, Tuple[float, float]]] = None,
+        batch_bytes: int = 8 * 1024 * 1024,
+        max_latency: float = 0.5,
+        fsync_policy: str = "close",
+        fsync_interval: float = 5.0,
+        index_interval: float = 1.0,
+        high_water: float = 0.75,
+    ):
+        """
+        Initialize disk stream writer.
+
+        Args:
+            run_dir: Run directory (created if missing)
+            readers: Channel name -> ring buffer reader to drain
+            sample_rate: Samples per second (stored in the run index)
+            time_origin: Timestamp of the first sample (default: now)
+            metadata: Run metadata stored in the index
+            scaling: Channel name -> (scale, offset) for channels of ADC
+                codes; stored in the index so readers see volts
+            batch_bytes: Minimum bytes per channel write; smaller amounts
+                wait up to ``max_latency`` seconds to accumulate. Capped at
+                a quarter of each ring buffer, so a full batch is written
+                long before the producer can wrap around
+            max_latency: Longest time samples may sit unwritten
+            fsync_policy: 'never', 'close' (at stop), 'interval' (every
+                ``fsync_interval`` seconds) or 'batch' (after every batch)
+            fsync_interval: Seconds between syncs for the 'interval' policy
+            index_interval: Seconds between index rewrites, which keep the
+                partial run readable while it is being written
+            high_water: Ring buffer fill fraction that triggers a
+                back-pressure warning
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown fsync policy {fsync_policy!r}; "
+                f"expected one of {FSYNC_POLICIES}"
+            )
+        self.run_dir = Path(run_dir)
+        self.readers = dict(readers)
+        self.sample_rate = float(sample_rate)
+        self.time_origin = time.time() if time_origin is None else time_origin
+        self.metadata = dict(metadata or {})
+        self.scaling = dict(scaling or {})
+        self.batch_bytes = int(batch_bytes)
+        self.max_latency = max_latency
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.index_interval = index_interval
+        self.high_water = high_water
+        self.logger = logging.getLogger(
+            f"EQFE.hardware.disk_streamer.{self.run_dir.name}"
+        )
+
+        self._writer = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._stats = {
+            name: {
+                "samples_written": 0,
+                "bytes_written": 0,
+                "batches": 0,
+                "write_seconds": 0.0,
+                "max_fill": 0.0,
+                "high_water_events": 0,
+            }
+            for name in self.readers
+        }
+        self._above_high_water = set()
+        self._fsyncs = 0
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        """Create the run and start the writer thread."""
+        from simulations.analysis.data_formats import RawRunWriter
+
+        self._writer = RawRunWriter(
+            self.run_dir,
+            sample_rate=self.sample_rate,
+            time_origin=self.time_origin,
+            metadata=self.metadata,
+        )
+        for name, reader in self.readers.items():
+            scale, offset = self.scaling.get(name, (None, 0.0))
+            self._writer.add_channel(
+                name, reader.ring.dtype, scale=scale, offset=offset
+            )
+        self._writer.flush()
+
+        self._stop.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name=f"disk-streamer-{self.run_dir.name}",
+            daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Streaming {len(self.readers)} channels to {self.run_dir}")
+
+    def stop(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Drain all remaining samples, close the run and stop the thread.
+
+        Call after the producer has stopped, so nothing is left behind.
+
+        Args:
+            timeout: Longest time to wait for the final drain
+
+        Returns:
+            Final statistics (see :meth:`stats`)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                self.logger.error("Disk writer did not finish draining in time")
+        if self._error is not None:
+            raise RuntimeError("Disk streaming failed") from self._error
+        return self.stats()
+
+    @property
+    def index_path(self) -> Path:
+        from simulations.analysis.data_formats import RAW_INDEX_NAME
+
+        return self.run_dir / RAW_INDEX_NAME
+
+    def _drain(self, name: str, reader: RingBufferReader, force: bool) -> int:
+        """Write one batch for a channel if enough samples (or time) accrued."""
+        stats = self._stats[name]
+        lost_before = reader.samples_lost
+        available = reader.available()
+        self._fill_gap(name, reader, reader.samples_lost - lost_before)
+
+        fill = available / reader.ring.capacity
+        if fill > stats["max_fill"]:
+            stats["max_fill"] = fill
+        if fill >= self.high_water and name not in self._above_high_water:
+            self._above_high_water.add(name)
+            stats["high_water_events"] += 1
+            self.logger.warning(
+                f"{name}: ring buffer {fill:.0%} full; disk writes are "
+                "falling behind acquisition"
+            )
+        elif fill < self.high_water / 2:
+            self._above_high_water.discard(name)
+
+        batch = self._batch_samples(reader)
+        if available == 0 or (available < batch and not force):
+            return 0
+
+        start = time.perf_counter()
+        n_written = 0
+        # Write straight from the ring buffer memory
+        lost_before = reader.samples_lost
+        with reader.view() as views:
+            # Samples skipped when the view caught up with the producer
+            skipped = reader.samples_lost - lost_before
+            self._fill_gap(name, reader, skipped)
+            for view in views:
+                self._writer.append(name, view)
+                n_written += len(view)
+        # Samples overwritten while they were being written
+        torn = reader.samples_lost - lost_before - skipped
+        if torn:
+            self._record_gap(
+                name, stats["samples_written"], torn
+            )
+        stats["write_seconds"] += time.perf_counter() - start
+        stats["samples_written"] += n_written
+        stats["bytes_written"] += n_written * reader.ring.dtype.itemsize
+        stats["batches"] += 1
+        return n_written
+
+    def _batch_samples(self, reader: RingBufferReader) -> int:
+        """Samples per full batch of a channel."""
+        batch = self.batch_bytes // reader.ring.dtype.itemsize
+        return max(min(batch, reader.ring.capacity // 4), 1)
+
+    def _record_gap(self, name: str, first_sample: int, n_samples: int) -> None:
+        gaps = self._writer.metadata.setdefault("gaps", {})
+        gaps.setdefault(name, []).append([first_sample, n_samples])
+        self.logger.error(
+            f"{name}: {n_samples} samples lost at sample {first_sample} "
+            "(ring buffer overrun)"
+        )
+
+    def _fill_gap(
+        self, name: str, reader: RingBufferReader, n_samples: int
+    ) -> None:
+        """Write placeholders for samples skipped by an overrun."""
+        if n_samples <= 0:
+            return
+        stats = self._stats[name]
+        self._record_gap(name, stats["samples_written"], n_samples)
+        block = np.zeros(
+            min(n_samples, self._batch_samples(reader)), dtype=reader.ring.dtype
+        )
+        remaining = n_samples
+        while remaining:
+            n = min(remaining, len(block))
+            self._writer.append(name, block[:n])
+            remaining -= n
+        stats["samples_written"] += n_samples
+        stats["bytes_written"] += n_samples * reader.ring.dtype.itemsize
+
+    def _run(self) -> None:
+        last_flush = last_index = last_sync = time.perf_counter()
+        try:
+            while True:
+                stopping = self._stop.is_set()
+                now = time.perf_counter()
+                force = stopping or now - last_flush >= self.max_latency
+                written = sum(
+                    self._drain(name, reader, force)
+                    for name, reader in self.readers.items()
+                )
+                if force:
+                    last_flush = now
+
+                if written and self.fsync_policy == "batch":
+                    self._sync()
+                elif (
+                    self.fsync_policy == "interval"
+                    and now - last_sync >= self.fsync_interval
+                ):
+                    self._sync()
+                    last_sync = now
+                elif now - last_index >= self.index_interval:
+                    self._writer.flush()
+                    last_index = now
+
+                if stopping:
+                    break
+                if not written:
+                    self._stop.wait(min(self.max_latency / 10, 0.01))
+        except BaseException as e:  # Surfaced to the caller by stop()
+            self._error = e
+            self.logger.error(f"Disk streaming failed: {e}")
+        finally:
+            if self.fsync_policy != "never" and self._error is None:
+                self._sync()
+            self._writer.close()
+
+    def _sync(self) -> None:
+        self._writer.sync()
+        self._fsyncs += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Streaming statistics.
+
+        Returns:
+            Dictionary with per-channel 'channels' statistics (samples and
+            bytes written, batches, write time, maximum buffer fill,
+            high-water events, current lag and lost samples), plus totals,
+            elapsed time, average throughput and the number of fsyncs
+        """
+        elapsed = (
+            time.perf_counter() - self._started_at if self._started_at else 0.0
+        )
+        channels = {}
+        for name, reader in self.readers.items():
+            channels[name] = dict(
+                self._stats[name],
+                lag_samples=reader.ring.write_index - reader.cursor,
+                samples_lost=reader.samples_lost,
+                overruns=reader.overruns,
+            )
+        total_bytes = sum(c["bytes_written"] for c in channels.values())
+        return {
+            "channels": channels,
+            "bytes_written": total_bytes,
+            "samples_lost": sum(c["samples_lost"] for c in channels.values()),
+            "elapsed_seconds": elapsed,
+            "throughput_mb_s": total_bytes / elapsed / 1e6 if elapsed else 0.0,
+            "fsyncs": self._fsyncs,
+        }
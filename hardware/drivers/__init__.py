@@ -3,9 +3,11 @@
 from .oscilloscope import OscilloscopeDriver
 from .signal_generator import SignalGeneratorDriver
 from .temperature_control import TemperatureControlDriver
+from .events import InstrumentEvent
 
 __all__ = [
     "OscilloscopeDriver",
     "SignalGeneratorDriver",
-    "TemperatureControlDriver"
+    "TemperatureControlDriver",
+    "InstrumentEvent"
 ]
@@ -0,0 +1,231 @@
+"""
+Instrument event waiting for EQFE drivers.
+
+Drivers wait for instrument conditions (trigger armed and fired, setpoint
+reached) by checking a status query. :class:`InstrumentEvent` wraps such
+a check: waiters sleep until either the instrument raises a service
+request (SRQ) or the poll interval elapses, then re-check. With SRQ the
+wake-up follows the instrument immediately and polling only guards
+against lost requests; without it the event falls back to plain polling.
+
+Waits can block the calling thread or be awaited from asyncio, where the
+check runs in a worker thread only for the duration of the status query,
+so many instruments can wait concurrently without tying up a thread each.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class WaitStats:
+    """Latency metrics of an instrument event."""
+    waits: int = 0
+    timeouts: int = 0
+    polls: int = 0  # Condition checks (status queries)
+    notifications: int = 0  # Service requests received
+    total_wait: float = 0.0  # seconds
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+    total_poll_time: float = 0.0  # Time spent in status queries
+    srq_wakeups: int = 0  # Waits ended by a service request
+    total_wake_latency: float = 0.0  # Service request -> wait returned
+    max_wake_latency: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters plus mean latencies."""
+        return {
+            'waits': self.waits,
+            'timeouts': self.timeouts,
+            'polls': self.polls,
+            'notifications': self.notifications,
+            'mean_wait': self.total_wait / self.waits if self.waits else 0.0,
+            'max_wait': self.max_wait,
+            'last_wait': self.last_wait,
+            'mean_poll_time': (
+                self.total_poll_time / self.polls if self.polls else 0.0
+            ),
+            'srq_wakeups': self.srq_wakeups,
+            'mean_wake_latency': (
+                self.total_wake_latency / self.srq_wakeups
+                if self.srq_wakeups else 0.0
+            ),
+            'max_wake_latency': self.max_wake_latency
+        }
+
+
+class InstrumentEvent:
+    """Condition on an instrument, woken by service request or polling."""
+
+    def __init__(
+        self,
+        name: str,
+        check: Callable[[], bool],
+        poll_interval: float = 0.01,
+        srq_poll_interval: float = 1.0,
+    ):
+        """
+        Initialize instrument event.
+
+        Args:
+            name: Event name (used in logs)
+            check: Blocking status query; True once the condition holds
+            poll_interval: Seconds between checks without SRQ
+            srq_poll_interval: Seconds between safety checks while SRQ
+                notifications are enabled
+        """
+        self.name = name
+        self.check = check
+        self.poll_interval = poll_interval
+        self.srq_poll_interval = srq_poll_interval
+        self.srq_enabled = False
+        self.stats = WaitStats()
+        self.logger = logging.getLogger("EQFE.drivers.events")
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._notified_at: Optional[float] = None
+
+    @property
+    def interval(self) -> float:
+        """Current time between checks."""
+        return self.srq_poll_interval if self.srq_enabled else self.poll_interval
+
+    def notify(self) -> None:
+        """
+        Wake all waiters to re-check the condition.
+
+        Safe to call from any thread, e.g. a VISA service request handler.
+        """
+        with self._lock:
+            self._notified_at = time.perf_counter()
+            self.stats.notifications += 1
+            waiters = list(self._async_waiters)
+        self._wakeup.set()
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until the condition holds.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        start = time.perf_counter()
+        deadline = start + timeout
+        while True:
+            # Cleared before checking so a request during the check wakes us
+            self._wakeup.clear()
+            if self._poll():
+                return self._finish(start, True)
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return self._finish(start, False)
+            self._wakeup.wait(min(self.interval, remaining))
+
+    async def wait_async(self, timeout: float) -> bool:
+        """
+        Wait for the condition without holding a thread while idle.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        waiter = (loop, asyncio.Event())
+        with self._lock:
+            self._async_waiters.append(waiter)
+        start = time.perf_counter()
+        deadline = start + timeout
+        try:
+            while True:
+                waiter[1].clear()
+                if await loop.run_in_executor(None, self._poll):
+                    return self._finish(start, True)
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return self._finish(start, False)
+                try:
+                    await asyncio.wait_for(
+                        waiter[1].wait(), min(self.interval, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._async_waiters.remove(waiter)
+
+    def _poll(self) -> bool:
+        """Run the status check once, timing it."""
+        start = time.perf_counter()
+        try:
+            return bool(self.check())
+        finally:
+            with self._lock:
+                self.stats.polls += 1
+                self.stats.total_poll_time += time.perf_counter() - start
+
+    def _finish(self, start: float, satisfied: bool) -> bool:
+        """Record metrics of a finished wait."""
+        now = time.perf_counter()
+        elapsed = now - start
+        with self._lock:
+            stats = self.stats
+            stats.waits += 1
+            stats.total_wait += elapsed
+            stats.max_wait = max(stats.max_wait, elapsed)
+            stats.last_wait = elapsed
+            if not satisfied:
+                stats.timeouts += 1
+            elif self._notified_at is not None and self._notified_at >= start:
+                latency = now - self._notified_at
+                stats.srq_wakeups += 1
+                stats.total_wake_latency += latency
+                stats.max_wake_latency = max(stats.max_wake_latency, latency)
+        if not satisfied:
+            self.logger.warning(f"{self.name}: timed out after {elapsed:.3f} s")
+        return satisfied
+
+
+def enable_srq(instrument: Any, event: InstrumentEvent) -> bool:
+    """
+    Route an instrument's VISA service requests to an event.
+
+    Args:
+        instrument: Open pyvisa resource
+        event: Event to notify on each service request
+
+    Returns:
+        True if service requests are enabled; False if the resource or
+        interface does not support them (the event keeps polling)
+    """
+    try:
+        from pyvisa import constants
+
+        def handler(*args):
+            try:
+                instrument.read_stb()  # Clears the request
+            except Exception:
+                pass
+            event.notify()
+            return constants.StatusCode.success
+
+        event_type = constants.EventType.service_request
+        instrument.install_handler(event_type, handler)
+        instrument.enable_event(event_type, constants.EventMechanism.handler)
+    except Exception as e:
+        event.logger.info(f"{event.name}: service requests unavailable ({e}); polling")
+        return False
+    event.srq_enabled = True
+    return True
@@ -5,12 +5,16 @@ Provides SCPI/VISA interface for digital oscilloscopes
 supporting high-speed quantum measurement applications.
 """
 
+import asyncio
 import numpy as np
 import logging
 import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Tuple
 
+from .events import InstrumentEvent, enable_srq
+from .visa import open_resource
+
 
 class OscilloscopeDriver(ABC):
     """Abstract base class for oscilloscope drivers."""
@@ -87,12 +91,28 @@ class KeysightOscilloscopeDriver(OscilloscopeDriver):
         super().__init__(device_address, config)
         self.instrument = None
         
+        # Binary transfer format: WORD (16 bit) or BYTE (8 bit) sample codes
+        self.waveform_format = config.get('waveform_format', 'WORD').upper()
+        if self.waveform_format not in ("WORD", "BYTE"):
+            raise ValueError(f"Unsupported waveform format: {self.waveform_format}")
+            
+        # Cached instrument state, valid until settings change
+        self._scpi_state: Dict[str, str] = {}  # Setting header -> value
+        self._preambles: Dict[int, Dict[str, float]] = {}
+        self._time_axes: Dict[Tuple[int, float, float, float], np.ndarray] = {}
+        
+        # Trigger wait: service request when available, polling otherwise
+        self.use_srq = config.get('use_srq', True)
+        self.trigger_timeout = config.get('trigger_timeout', 10.0)  # seconds
+        self.trigger_event = InstrumentEvent(
+            "trigger", self._is_triggered,
+            poll_interval=config.get('trigger_poll_interval', 0.01)
+        )
+        
     def connect(self) -> bool:
         """Connect to Keysight oscilloscope via VISA."""
         try:
-            import pyvisa
-            rm = pyvisa.ResourceManager()
-            self.instrument = rm.open_resource(self.device_address)
+            self.instrument = open_resource(self.device_address)
             
             # Configure communication
             self.instrument.timeout = 10000  # 10 second timeout
@@ -106,8 +126,13 @@ class KeysightOscilloscopeDriver(OscilloscopeDriver):
             # Reset to known state
             self.instrument.write("*RST")
             self.instrument.write("*CLS")
+            self.invalidate_waveform_cache()
             time.sleep(1)
             
+            # Request service on operation complete (ESE OPC -> SRE ESB)
+            if self.use_srq and enable_srq(self.instrument, self.trigger_event):
+                self.instrument.write("*ESE 1;*SRE 32")
+            
             self.is_connected = True
             return True
             
@@ -149,6 +174,7 @@ class KeysightOscilloscopeDriver(OscilloscopeDriver):
                 self.instrument.write(f":CHAN{channel}:IMP FIFT")
             else:
                 self.instrument.write(f":CHAN{channel}:IMP ONEM")
+            self.invalidate_waveform_cache(channel)
                 
             self.logger.info(f"Configured CH{channel}: {voltage_range}V, {coupling}, {impedance}Ω")
             return True
@@ -169,6 +195,7 @@ class KeysightOscilloscopeDriver(OscilloscopeDriver):
             # Update sample rate based on timebase
             self.sample_rate = min(self.max_sample_rate, 10 / timebase)
             self.instrument.write(f":ACQ:SRAT {self.sample_rate}")
+            self._preambles.clear()
             
             self.logger.info(f"Set timebase: {timebase:.2e} s/div, "
                            f"sample rate: {self.sample_rate:.2e} Sa/s")
@@ -205,74 +232,181 @@ class KeysightOscilloscopeDriver(OscilloscopeDriver):
             self.logger.error(f"Failed to set trigger: {e}")
             return False
             
-    def acquire_waveform(self, channels: List[int]) -> Dict[str, np.ndarray]:
-        """Acquire waveform data from specified channels."""
+    def acquire_waveform(
+        self,
+        channels: List[int],
+        out: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Acquire waveform data from specified channels.
+
+        All channels are read out from one trigger as binary WORD/BYTE
+        blocks. Waveform format and preambles are cached between calls, so
+        a repeated acquisition only sends the trigger and data queries.
+
+        Args:
+            channels: Channel numbers to read
+            out: Optional 'CH{n}' -> float64 buffers to fill with the
+                voltages (e.g. reused across calls); new arrays otherwise
+
+        Returns:
+            'CH{n}' -> time, voltage, sample rate and record length. The
+            time axis is shared between calls and channels and read-only.
+        """
         try:
             if not self.is_connected:
                 raise RuntimeError("Oscilloscope not connected")
                 
-            waveforms = {}
+            self._arm()
+            if not self.trigger_event.wait(self.trigger_timeout):
+                raise TimeoutError("Trigger timeout")
+            return self._read_waveforms(channels, out)
             
-            # Set single trigger mode
-            self.instrument.write(":SING")
+        except Exception as e:
+            self.logger.error(f"Failed to acquire waveform: {e}")
+            return {}
             
-            # Wait for trigger
-            timeout = 10  # seconds
-            start_time = time.time()
-            while True:
-                status = self.instrument.query(":OPER:COND?")
-                if int(status) & 8:  # Trigger bit
-                    break
-                if time.time() - start_time > timeout:
-                    raise TimeoutError("Trigger timeout")
-                time.sleep(0.01)
-                
-            # Acquire data from each channel
-            for channel in channels:
-                # Select channel as data source
-                self.instrument.write(f":WAV:SOUR CHAN{channel}")
-                
-                # Set data format
-                self.instrument.write(":WAV:FORM REAL")
-                self.instrument.write(":WAV:MODE RAW")
-                
-                # Get waveform preamble
-                preamble = self.instrument.query(":WAV:PRE?")
-                preamble_parts = preamble.split(',')
-                
-                # Extract scaling information
-                xinc = float(preamble_parts[4])  # X increment
-                xorig = float(preamble_parts[5])  # X origin
-                yinc = float(preamble_parts[7])  # Y increment
-                yorig = float(preamble_parts[8])  # Y origin
-                yref = float(preamble_parts[9])  # Y reference
-                
-                # Get raw data
-                raw_data = self.instrument.query_binary_values(
-                    ":WAV:DATA?", datatype='f', is_big_endian=True
-                )
-                
-                # Convert to numpy array and apply scaling
-                data_array = np.array(raw_data)
-                voltage = (data_array - yref) * yinc + yorig
-                
-                # Create time array
-                time_array = np.arange(len(voltage)) * xinc + xorig
-                
-                waveforms[f"CH{channel}"] = {
-                    'time': time_array,
-                    'voltage': voltage,
-                    'sample_rate': 1.0 / xinc,
-                    'record_length': len(voltage)
-                }
+    async def acquire_waveform_async(
+        self,
+        channels: List[int],
+        out: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Acquire waveforms without holding a thread while waiting for trigger.
+
+        Same as :meth:`acquire_waveform`; several instruments can be armed
+        and awaited concurrently, e.g. with ``asyncio.gather``.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if not self.is_connected:
+                raise RuntimeError("Oscilloscope not connected")
                 
-            self.logger.info(f"Acquired waveforms from channels: {channels}")
-            return waveforms
+            await loop.run_in_executor(None, self._arm)
+            if not await self.trigger_event.wait_async(self.trigger_timeout):
+                raise TimeoutError("Trigger timeout")
+            return await loop.run_in_executor(None, self._read_waveforms, channels, out)
             
         except Exception as e:
             self.logger.error(f"Failed to acquire waveform: {e}")
             return {}
             
+    def _arm(self) -> None:
+        """Start a single acquisition."""
+        if self.trigger_event.srq_enabled:
+            # Clear status so operation complete raises a fresh request
+            self.instrument.write("*CLS;:SING;*OPC")
+        else:
+            self.instrument.write(":SING")
+            
+    def _is_triggered(self) -> bool:
+        """Query the trigger bit of the operation status register."""
+        return bool(int(self.instrument.query(":OPER:COND?")) & 8)
+        
+    def _read_waveforms(
+        self, channels: List[int], out: Optional[Dict[str, np.ndarray]]
+    ) -> Dict[str, np.ndarray]:
+        """Read out and scale the acquired waveforms of ``channels``."""
+        waveforms = {}
+        
+        # Data format is only sent when it differs from the cached state
+        self._write_setting(":WAV:FORM", self.waveform_format)
+        self._write_setting(":WAV:MODE", "RAW")
+        self._write_setting(":WAV:UNS", "0")
+        self._write_setting(":WAV:BYT", "LSBF")
+            
+        for channel in channels:
+            name = f"CH{channel}"
+            preamble = self._get_preamble(channel)
+            
+            # Select source and request data in one message
+            self.instrument.write(f":WAV:SOUR CHAN{channel};:WAV:DATA?")
+            self._scpi_state[":WAV:SOUR"] = f"CHAN{channel}"
+            codes = self._read_block()
+            
+            if len(codes) != preamble['points']:
+                # Record length changed on the instrument side
+                self.invalidate_waveform_cache(channel)
+                preamble = self._get_preamble(channel)
+                
+            # Scale codes to volts in place (two passes, no temporaries)
+            voltage = out.get(name) if out else None
+            if voltage is None or len(voltage) != len(codes):
+                voltage = np.empty(len(codes))
+            np.multiply(codes, preamble['yinc'], out=voltage)
+            voltage += preamble['yorig'] - preamble['yref'] * preamble['yinc']
+            
+            waveforms[name] = {
+                'time': self._time_axis(preamble, len(codes)),
+                'voltage': voltage,
+                'sample_rate': 1.0 / preamble['xinc'],
+                'record_length': len(voltage)
+            }
+            
+        self.logger.info(f"Acquired waveforms from channels: {channels}")
+        return waveforms
+        
+    def invalidate_waveform_cache(self, channel: Optional[int] = None) -> None:
+        """
+        Forget cached waveform state.
+
+        Call after changing instrument settings outside this driver.
+
+        Args:
+            channel: Channel whose preamble to drop (default: all cached
+                state, including the waveform format)
+        """
+        if channel is None:
+            self._scpi_state.clear()
+            self._preambles.clear()
+        else:
+            self._preambles.pop(channel, None)
+            
+    def _write_setting(self, header: str, value: str) -> None:
+        """Send a setting command unless the instrument already has it."""
+        if self._scpi_state.get(header) != value:
+            self.instrument.write(f"{header} {value}")
+            self._scpi_state[header] = value
+            
+    def _get_preamble(self, channel: int) -> Dict[str, float]:
+        """Waveform preamble of a channel (queried once, then cached)."""
+        if channel not in self._preambles:
+            self._write_setting(":WAV:SOUR", f"CHAN{channel}")
+            parts = self.instrument.query(":WAV:PRE?").split(',')
+            self._preambles[channel] = {
+                'points': int(float(parts[2])),
+                'xinc': float(parts[4]),  # X increment
+                'xorig': float(parts[5]),  # X origin
+                'xref': float(parts[6]),  # X reference
+                'yinc': float(parts[7]),  # Y increment
+                'yorig': float(parts[8]),  # Y origin
+                'yref': float(parts[9])  # Y reference
+            }
+        return self._preambles[channel]
+        
+    def _time_axis(self, preamble: Dict[str, float], points: int) -> np.ndarray:
+        """Read-only time axis, shared by all waveforms with the same scale."""
+        key = (points, preamble['xinc'], preamble['xorig'], preamble['xref'])
+        axis = self._time_axes.get(key)
+        if axis is None:
+            if len(self._time_axes) >= 8:
+                self._time_axes.clear()
+            axis = (np.arange(points) - preamble['xref']) * preamble['xinc'] + preamble['xorig']
+            axis.setflags(write=False)
+            self._time_axes[key] = axis
+        return axis
+        
+    def _read_block(self) -> np.ndarray:
+        """Read an IEEE 488.2 definite-length block of sample codes."""
+        header = self.instrument.read_bytes(2)
+        if header[:1] != b'#' or header[1:2] == b'0':
+            raise ValueError(f"Expected definite-length block, got {header!r}")
+        n_bytes = int(self.instrument.read_bytes(int(header[1:2])))
+        # Block plus trailing newline, viewed as codes without copying
+        data = self.instrument.read_bytes(n_bytes + 1)
+        dtype = '<i2' if self.waveform_format == "WORD" else 'i1'
+        return np.frombuffer(data, dtype=dtype, count=n_bytes // np.dtype(dtype).itemsize)
+            
     def get_measurement(self, channel: int, measurement_type: str) -> float:
         """Get automated measurement from channel."""
         try:
@@ -322,7 +456,8 @@ class KeysightOscilloscopeDriver(OscilloscopeDriver):
                 'trigger_source': self.trigger_source,
                 'trigger_level': self.trigger_level,
                 'acquisition_state': self.instrument.query(":RUN?").strip(),
-                'trigger_status': self.instrument.query(":TRIG:STAT?").strip()
+                'trigger_status': self.instrument.query(":TRIG:STAT?").strip(),
+                'trigger_wait': self.trigger_event.stats.summary()
             }
             
             return status
@@ -11,6 +11,8 @@ import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 
+from .visa import open_resource
+
 
 class SignalGeneratorDriver(ABC):
     """Abstract base class for signal generator drivers."""
@@ -95,9 +97,7 @@ class KeysightSignalGeneratorDriver(SignalGeneratorDriver):
     def connect(self) -> bool:
         """Connect to Keysight signal generator via VISA."""
         try:
-            import pyvisa
-            rm = pyvisa.ResourceManager()
-            self.instrument = rm.open_resource(self.device_address)
+            self.instrument = open_resource(self.device_address)
             
             # Configure communication
             self.instrument.timeout = 10000  # 10 second timeout
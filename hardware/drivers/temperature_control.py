@@ -6,10 +6,12 @@ supporting cryogenic and high-temperature applications.
 """
 
 import logging
-import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 
+from .events import InstrumentEvent
+from .visa import open_resource
+
 
 class TemperatureControlDriver(ABC):
     """Abstract base class for temperature control drivers."""
@@ -86,12 +88,18 @@ class LakeShoreTemperatureDriver(TemperatureControlDriver):
         self.instrument = None
         self.control_enabled = False
         
+        # Settling: consecutive in-band readings, one per poll interval
+        self.stable_readings = config.get('stable_readings', 10)
+        self._stable_count = 0
+        self.settle_event = InstrumentEvent(
+            "temperature settle", self._check_stable,
+            poll_interval=config.get('settle_poll_interval', 1.0)
+        )
+        
     def connect(self) -> bool:
         """Connect to Lake Shore temperature controller."""
         try:
-            import pyvisa
-            rm = pyvisa.ResourceManager()
-            self.instrument = rm.open_resource(self.device_address)
+            self.instrument = open_resource(self.device_address)
             
             # Configure communication
             self.instrument.timeout = 5000  # 5 second timeout
@@ -245,7 +253,8 @@ class LakeShoreTemperatureDriver(TemperatureControlDriver):
                 'at_setpoint': at_setpoint,
                 'temperature_range': self.temperature_range,
                 'stability': self.stability,
-                'pid_parameters': self.pid_parameters.copy()
+                'pid_parameters': self.pid_parameters.copy(),
+                'settle_wait': self.settle_event.stats.summary()
             }
             
             return status
@@ -295,27 +304,43 @@ class LakeShoreTemperatureDriver(TemperatureControlDriver):
         """Wait for temperature to stabilize at setpoint."""
         try:
             self.logger.info(f"Waiting for temperature to stabilize at {self.setpoint:.2f} K")
+            self._stable_count = 0
             
-            start_time = time.time()
-            stable_count = 0
-            required_stable_readings = 10  # Number of consecutive stable readings
+            if self.settle_event.wait(timeout):
+                self.logger.info("Temperature stabilized")
+                return True
+            self.logger.warning("Temperature stabilization timeout")
+            return False
             
-            while time.time() - start_time < timeout:
-                current_temp = self.get_temperature()
-                
-                if abs(current_temp - self.setpoint) < self.stability:
-                    stable_count += 1
-                    if stable_count >= required_stable_readings:
-                        self.logger.info("Temperature stabilized")
-                        return True
-                else:
-                    stable_count = 0
-                    
-                time.sleep(1)  # Check every second
-                
+        except Exception as e:
+            self.logger.error(f"Error waiting for stable temperature: {e}")
+            return False
+            
+    async def wait_for_stable_temperature_async(self, timeout: float = 600) -> bool:
+        """
+        Wait for temperature to stabilize without blocking a thread.
+
+        Several controllers can settle concurrently, e.g. with
+        ``asyncio.gather``; a thread is only used for each reading.
+        """
+        try:
+            self.logger.info(f"Waiting for temperature to stabilize at {self.setpoint:.2f} K")
+            self._stable_count = 0
+            
+            if await self.settle_event.wait_async(timeout):
+                self.logger.info("Temperature stabilized")
+                return True
             self.logger.warning("Temperature stabilization timeout")
             return False
             
         except Exception as e:
             self.logger.error(f"Error waiting for stable temperature: {e}")
             return False
+            
+    def _check_stable(self) -> bool:
+        """Take one reading; True after enough consecutive in-band readings."""
+        if abs(self.get_temperature() - self.setpoint) < self.stability:
+            self._stable_count += 1
+        else:
+            self._stable_count = 0
+        return self._stable_count >= self.stable_readings
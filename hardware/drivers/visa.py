@@ -0,0 +1,27 @@
+"""
+VISA resource access for EQFE drivers.
+
+Addresses starting with ``SIM::`` are served by the in-process instrument
+simulator (:mod:`hardware.instrument_simulator`); all others are opened
+through pyvisa.
+"""
+
+from typing import Any
+
+
+def open_resource(address: str) -> Any:
+    """
+    Open a message-based instrument session.
+
+    Args:
+        address: VISA resource address, or ``SIM::<kind>::<name>``
+
+    Returns:
+        pyvisa resource (or a simulated session with the same interface)
+    """
+    if address.startswith("SIM::"):
+        from ..instrument_simulator import default_simulator
+        return default_simulator().open_resource(address)
+
+    import pyvisa
+    return pyvisa.ResourceManager().open_resource(address)
@@ -7,11 +7,13 @@ multiple hardware devices in quantum field experiments.
 
 import logging
 import time
-import asyncio
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+import numpy as np
+
 from .interfaces import (
     QuantumSensorInterface, 
     FieldGeneratorInterface,
@@ -23,6 +25,7 @@ from .drivers import (
     TemperatureControlDriver
 )
 from .calibration import SensorCalibration, FieldCalibration
+from .orchestration import DeviceOrchestrator, run_sync
 
 
 class ExperimentState(Enum):
@@ -55,6 +58,10 @@ class ExperimentConfig:
     # Calibration settings
     auto_calibrate: bool = True
     calibration_interval: float = 3600.0  # seconds
+    
+    # Storage (raw binary run per DAQ, readable with np.memmap)
+    output_directory: Optional[str] = None
+    fsync_policy: str = "close"  # never, close, interval or batch
 
 
 class HardwareManager:
@@ -91,47 +98,68 @@ class HardwareManager:
         
         # Data storage
         self.measurement_data = {}
+        self.acquisition_start_times: Dict[str, float] = {}  # Unix time per DAQ
+        self.stream_stats: Dict[str, Dict[str, Any]] = {}
+        self.disk_streamers: Dict[str, Any] = {}
+        
+        # Real-time processing (see configure_processing)
+        self.processing: Dict[str, Dict[str, Any]] = {}
+        self.pipelines: Dict[str, Any] = {}
+        self.processing_stats: Dict[str, Dict[str, Any]] = {}
+        self.analysis_results: Dict[str, Dict[str, Any]] = {}
         self.experiment_log = []
         
+        # Concurrent device I/O (bounded thread pool, per-device timeouts)
+        self.orchestrator = DeviceOrchestrator(
+            max_workers=config.get('max_workers', 8),
+            default_timeout=config.get('device_timeout', 30.0),
+            queue_timeout=config.get('queue_timeout')
+        )
+        self.status_timeout = config.get('status_timeout', 5.0)
+        
     def initialize_hardware(self) -> bool:
         """Initialize and connect to all configured hardware devices."""
+        return run_sync(self.initialize_hardware_async())
+        
+    async def initialize_hardware_async(self) -> bool:
+        """
+        Initialize and connect to all configured devices concurrently.
+        
+        Each device's bring-up is bounded by its ``timeout`` setting
+        (default: ``device_timeout``); the first failure cancels devices
+        that have not started connecting yet.
+        """
         try:
             self.logger.info("Starting hardware initialization")
             self.state = ExperimentState.INITIALIZING
-            
-            # Initialize quantum sensors
-            sensor_configs = self.config.get('quantum_sensors', {})
-            for sensor_id, sensor_config in sensor_configs.items():
-                success = self._initialize_sensor(sensor_id, sensor_config)
-                if not success:
-                    self.logger.error(f"Failed to initialize sensor {sensor_id}")
-                    return False
-                    
-            # Initialize field generators
-            field_configs = self.config.get('field_generators', {})
-            for field_id, field_config in field_configs.items():
-                success = self._initialize_field_generator(field_id, field_config)
-                if not success:
-                    self.logger.error(f"Failed to initialize field generator {field_id}")
-                    return False
+            start = time.perf_counter()
+            
+            calls = {}
+            for category, initialize in (
+                ('quantum_sensors', self._initialize_sensor),
+                ('field_generators', self._initialize_field_generator),
+                ('data_acquisition', self._initialize_daq),
+                ('drivers', self._initialize_driver),
+            ):
+                for device_id, device_config in self.config.get(category, {}).items():
+                    calls[f"{category}.{device_id}"] = (
+                        initialize,
+                        (device_id, device_config),
+                        device_config.get('timeout')
+                    )
                     
-            # Initialize data acquisition systems
-            daq_configs = self.config.get('data_acquisition', {})
-            for daq_id, daq_config in daq_configs.items():
-                success = self._initialize_daq(daq_id, daq_config)
-                if not success:
-                    self.logger.error(f"Failed to initialize DAQ {daq_id}")
-                    return False
-                    
-            # Initialize device drivers
-            driver_configs = self.config.get('drivers', {})
-            for driver_id, driver_config in driver_configs.items():
-                success = self._initialize_driver(driver_id, driver_config)
-                if not success:
-                    self.logger.error(f"Failed to initialize driver {driver_id}")
-                    return False
-                    
-            self.logger.info("Hardware initialization complete")
+            results = await self.orchestrator.gather(calls, fail_fast=True)
+            failed = [r for r in results.values() if not r.success]
+            for result in failed:
+                reason = f": {result.error}" if result.error else ""
+                self.logger.error(f"Failed to initialize {result.device_id}{reason}")
+            if failed:
+                return False
+                
+            self.logger.info(
+                f"Hardware initialization complete "
+                f"({len(calls)} devices in {time.perf_counter() - start:.2f} s)"
+            )
             self.state = ExperimentState.IDLE
             return True
             
@@ -201,6 +229,16 @@ class HardwareManager:
             
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status."""
+        return run_sync(self.get_system_status_async())
+        
+    async def get_system_status_async(self) -> Dict[str, Any]:
+        """
+        Get comprehensive system status, polling all devices concurrently.
+        
+        A device that does not answer within ``status_timeout`` seconds is
+        reported as disconnected; while that query is still running, later
+        polls report the device as busy rather than querying it again.
+        """
         try:
             status = {
                 'state': self.state.value,
@@ -216,26 +254,50 @@ class HardwareManager:
                 'system_health': 'healthy'
             }
             
-            # Get sensor status
-            for sensor_id, sensor in self.quantum_sensors.items():
-                if hasattr(sensor, 'get_status'):
-                    status['quantum_sensors'][sensor_id] = sensor.get_status()
-                    
-            # Get field generator status
-            for field_id, field in self.field_generators.items():
-                if hasattr(field, 'get_field_status'):
-                    status['field_generators'][field_id] = field.get_field_status()
-                    
-            # Get DAQ status
-            for daq_id, daq in self.data_acquisition.items():
-                if hasattr(daq, 'get_acquisition_status'):
-                    status['data_acquisition'][daq_id] = daq.get_acquisition_status()
-                    
-            # Get driver status
-            for driver_id, driver in self.drivers.items():
-                if hasattr(driver, 'get_status'):
-                    status['drivers'][driver_id] = driver.get_status()
+            # Status query of each device type
+            calls = {}
+            for category, devices, method in (
+                ('quantum_sensors', self.quantum_sensors, 'get_status'),
+                ('field_generators', self.field_generators, 'get_field_status'),
+                ('data_acquisition', self.data_acquisition, 'get_acquisition_status'),
+                ('drivers', self.drivers, 'get_status'),
+            ):
+                for device_id, device in devices.items():
+                    if hasattr(device, method):
+                        calls[f"{category}.{device_id}"] = (
+                            getattr(device, method), (), self.status_timeout
+                        )
+                        
+            results = await self.orchestrator.gather(calls)
+            for key, result in results.items():
+                category, device_id = key.split('.', 1)
+                if result.success:
+                    status[category][device_id] = result.value
+                else:
+                    status[category][device_id] = {
+                        'connected': False,
+                        'busy': result.busy,
+                        'error': result.error or 'status query failed'
+                    }
                     
+            # Disk streaming statistics (live during a run, final afterwards)
+            status['disk_streaming'] = dict(self.stream_stats)
+            for daq_id, streamer in list(self.disk_streamers.items()):
+                status['disk_streaming'][daq_id] = streamer.stats()
+                
+            # Real-time processing latency and latest S(t)
+            status['processing'] = {}
+            for daq_id, pipeline in list(self.pipelines.items()):
+                processing = pipeline.stats()
+                estimate = pipeline.latest.get('chsh')
+                if estimate is not None:
+                    processing['chsh'] = {
+                        'time': float(estimate['times'][-1]),
+                        'value': float(estimate['chsh_values'][-1]),
+                        'error': float(estimate['chsh_errors'][-1]),
+                    }
+                status['processing'][daq_id] = processing
+                
             # Check overall system health
             unhealthy_devices = []
             for category in ['quantum_sensors', 'field_generators', 'data_acquisition', 'drivers']:
@@ -259,39 +321,102 @@ class HardwareManager:
             
     def shutdown_hardware(self) -> bool:
         """Safely shutdown all hardware devices."""
+        return run_sync(self.shutdown_hardware_async())
+        
+    async def shutdown_hardware_async(self) -> bool:
+        """
+        Disconnect all devices concurrently.
+        
+        Every device is disconnected even if others fail or time out.
+        
+        Returns:
+            True if all devices disconnected cleanly
+        """
         try:
             self.logger.info("Starting hardware shutdown")
-            self.state = ExperimentState.STOPPING
             
             # Stop any running experiments
             if self.state == ExperimentState.RUNNING:
                 self._emergency_stop()
                 
+            self.state = ExperimentState.STOPPING
+            
             # Disconnect all devices
-            for sensor in self.quantum_sensors.values():
-                if hasattr(sensor, 'disconnect'):
-                    sensor.disconnect()
-                    
-            for field in self.field_generators.values():
-                if hasattr(field, 'disconnect'):
-                    field.disconnect()
-                    
-            for daq in self.data_acquisition.values():
-                if hasattr(daq, 'disconnect'):
-                    daq.disconnect()
-                    
-            for driver in self.drivers.values():
-                if hasattr(driver, 'disconnect'):
-                    driver.disconnect()
-                    
+            calls = {}
+            for category, devices in (
+                ('quantum_sensors', self.quantum_sensors),
+                ('field_generators', self.field_generators),
+                ('data_acquisition', self.data_acquisition),
+                ('drivers', self.drivers),
+            ):
+                for device_id, device in devices.items():
+                    if hasattr(device, 'disconnect'):
+                        calls[f"{category}.{device_id}"] = (
+                            device.disconnect,
+                            (),
+                            self._device_timeout(category, device_id)
+                        )
+                        
+            results = await self.orchestrator.gather(calls)
+            failed = [r.device_id for r in results.values() if not r.success]
+            if failed:
+                self.logger.warning(f"Devices not disconnected cleanly: {failed}")
+                
+            self.orchestrator.shutdown()
             self.logger.info("Hardware shutdown complete")
             self.state = ExperimentState.IDLE
-            return True
+            return not failed
             
         except Exception as e:
             self.logger.error(f"Hardware shutdown failed: {e}")
             return False
             
+    def save_raw_runs(self, output_directory: str) -> Dict[str, str]:
+        """
+        Write collected DAQ data in the raw binary run format.
+        
+        Each DAQ gets its own run directory with one little-endian file per
+        channel and an index sidecar, which the analysis tools open with
+        np.memmap without copying. Timestamps start when the DAQ started
+        acquiring.
+        
+        Args:
+            output_directory: Directory receiving one run per DAQ
+            
+        Returns:
+            Mapping of DAQ id to written index file
+        """
+        from simulations.analysis.data_formats import RAW_INDEX_NAME, RawRunWriter
+        
+        written = {}
+        for daq_id, channel_data in self.measurement_data.items():
+            if not channel_data or daq_id in self.stream_stats:
+                # Empty, or already streamed to disk during acquisition
+                continue
+                
+            daq = self.data_acquisition.get(daq_id)
+            metadata = {
+                'daq_id': daq_id,
+                'experiment': asdict(self.current_experiment)
+                if self.current_experiment else {},
+            }
+            writer = RawRunWriter(
+                Path(output_directory) / daq_id,
+                sample_rate=getattr(daq, 'sample_rate', 1.0),
+                time_origin=self.acquisition_start_times.get(daq_id, time.time()),
+                metadata=metadata
+            )
+            with writer:
+                for channel_id, samples in channel_data.items():
+                    name = f"ch{channel_id}"
+                    writer.add_channel(name, np.asarray(samples).dtype)
+                    writer.append(name, samples)
+                    
+            written[daq_id] = str(writer.run_dir / RAW_INDEX_NAME)
+            self.logger.info(f"Saved raw run for {daq_id}: {writer.run_dir}")
+            
+        return written
+        
     def _initialize_sensor(self, sensor_id: str, config: Dict[str, Any]) -> bool:
         """Initialize a quantum sensor."""
         try:
@@ -412,23 +537,49 @@ class HardwareManager:
             self.logger.error(f"Driver initialization error: {e}")
             return False
             
+    def _device_timeout(self, category: str, device_id: str) -> Optional[float]:
+        """Configured timeout of a device (None: orchestrator default)."""
+        return self.config.get(category, {}).get(device_id, {}).get('timeout')
+        
     def _perform_calibration(self) -> bool:
         """Perform system calibration."""
+        return run_sync(self._perform_calibration_async())
+        
+    async def _perform_calibration_async(self) -> bool:
+        """
+        Calibrate quantum sensors and field generators concurrently.
+        
+        Field generators are calibrated against their entry in the
+        ``field_references`` calibration setting (reference field in
+        Tesla); generators without a reference are left as they are. The
+        first failure cancels calibrations that have not started yet.
+        """
         try:
             self.logger.info("Starting system calibration")
             self.state = ExperimentState.CALIBRATING
             
-            # Calibrate quantum sensors
+            calls = {}
             for sensor_id, sensor in self.quantum_sensors.items():
                 if hasattr(sensor, 'calibrate'):
-                    if not sensor.calibrate():
-                        self.logger.error(f"Sensor calibration failed: {sensor_id}")
-                        return False
-                        
-            # Calibrate field generators
+                    calls[f"quantum_sensors.{sensor_id}"] = (
+                        sensor.calibrate,
+                        (),
+                        self._device_timeout('quantum_sensors', sensor_id)
+                    )
+            references = self.field_calibration.field_references
             for field_id, field in self.field_generators.items():
-                # Field calibration would be implemented here
-                pass
+                if field_id in references:
+                    calls[f"field_generators.{field_id}"] = (
+                        self._calibrate_field_generator,
+                        (field, references[field_id]),
+                        self._device_timeout('field_generators', field_id)
+                    )
+                    
+            results = await self.orchestrator.gather(calls, fail_fast=True)
+            failed = [r.device_id for r in results.values() if not r.success]
+            if failed:
+                self.logger.error(f"Calibration failed: {failed}")
+                return False
                 
             self.last_calibration_time = time.time()
             self.logger.info("System calibration complete")
@@ -438,6 +589,13 @@ class HardwareManager:
             self.logger.error(f"Calibration failed: {e}")
             return False
             
+    def _calibrate_field_generator(self, field, reference_field: float) -> bool:
+        """Calibrate one field generator against a reference field."""
+        result = self.field_calibration.calibrate_electromagnetic_field(
+            field, reference_field
+        )
+        return result.success
+        
     def _setup_environment(self, config: ExperimentConfig) -> bool:
         """Setup environmental conditions."""
         try:
@@ -503,10 +661,19 @@ class HardwareManager:
             
     def _run_measurement_sequence(self, config: ExperimentConfig) -> bool:
         """Run the main measurement sequence."""
+        self.stream_stats = {}
         try:
+            # Stream DAQ ring buffers to disk while acquiring
+            if config.output_directory:
+                self._start_disk_streaming(config)
+                
+            # Process DAQ blocks as they arrive
+            self._start_processing()
+                
             # Start data acquisition
             for daq_id, daq in self.data_acquisition.items():
                 if hasattr(daq, 'start_acquisition'):
+                    self.acquisition_start_times[daq_id] = time.time()
                     if not daq.start_acquisition():
                         return False
                         
@@ -524,9 +691,19 @@ class HardwareManager:
                 if hasattr(daq, 'stop_acquisition'):
                     daq.stop_acquisition()
                     
+            # Process the last blocks
+            for daq_id, pipeline in self.pipelines.items():
+                self.processing_stats[daq_id] = self._stop_pipeline(pipeline)
+                
             # Collect data
+            while self.disk_streamers:
+                daq_id, streamer = self.disk_streamers.popitem()
+                self.stream_stats[daq_id] = self._stop_streamer(streamer)
+                self.measurement_data[daq_id] = self._load_streamed_run(
+                    streamer.run_dir
+                )
             for daq_id, daq in self.data_acquisition.items():
-                if hasattr(daq, 'get_data'):
+                if daq_id not in self.stream_stats and hasattr(daq, 'get_data'):
                     self.measurement_data[daq_id] = daq.get_data()
                     
             return True
@@ -535,17 +712,149 @@ class HardwareManager:
             self.logger.error(f"Measurement sequence failed: {e}")
             return False
             
+        finally:
+            while self.disk_streamers:
+                daq_id, streamer = self.disk_streamers.popitem()
+                try:
+                    self.stream_stats[daq_id] = self._stop_streamer(streamer)
+                except Exception as e:
+                    self.logger.error(f"Disk streaming for {daq_id} failed: {e}")
+            for daq_id, pipeline in self.pipelines.items():
+                if daq_id not in self.processing_stats:
+                    try:
+                        self.processing_stats[daq_id] = self._stop_pipeline(pipeline)
+                    except Exception as e:
+                        self.logger.error(f"Processing for {daq_id} failed: {e}")
+                        
+    def configure_processing(
+        self,
+        daq_id: str,
+        stage_factory: Callable[[], List[Any]],
+        queue_size: int = 8,
+        poll_interval: float = 0.05,
+        on_result: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """
+        Process a DAQ's samples in real time during measurements.
+        
+        Each measurement builds a fresh pipeline from ``stage_factory``
+        (e.g. ``lambda: chsh_pipeline(...)`` from
+        :mod:`hardware.processing_pipeline`), feeds it volts read from the
+        DAQ ring buffers every ``poll_interval`` seconds, and stores the
+        final stage results in ``analysis_results[daq_id]``. Live results
+        and latency are reported by :meth:`get_system_status`.
+        
+        Args:
+            daq_id: DAQ to process
+            stage_factory: Returns the pipeline stages, in order
+            queue_size: Blocks queued in front of each stage
+            poll_interval: Seconds between ring buffer reads
+            on_result: Called with each processed block
+        """
+        self.processing[daq_id] = {
+            'stage_factory': stage_factory,
+            'queue_size': queue_size,
+            'poll_interval': poll_interval,
+            'on_result': on_result,
+        }
+        
+    def _start_processing(self) -> None:
+        """Start the configured processing pipelines."""
+        from .processing_pipeline import ProcessingPipeline
+        
+        self.pipelines = {}
+        self.processing_stats = {}
+        for daq_id, settings in self.processing.items():
+            daq = self.data_acquisition.get(daq_id)
+            if daq is None or not hasattr(daq, 'add_consumer'):
+                self.logger.warning(f"Cannot process {daq_id}: no streaming DAQ")
+                continue
+                
+            pipeline = ProcessingPipeline(
+                settings['stage_factory'](),
+                queue_size=settings['queue_size'],
+                on_result=settings['on_result']
+            )
+            pipeline.start(
+                daq.add_consumer("pipeline"),
+                sample_rate=getattr(daq, 'sample_rate', 1.0),
+                convert=getattr(daq, 'to_volts', None),
+                poll_interval=settings['poll_interval']
+            )
+            self.pipelines[daq_id] = pipeline
+            
+    @staticmethod
+    def _stop_pipeline(pipeline) -> Dict[str, Any]:
+        try:
+            return pipeline.stop()
+        finally:
+            for reader in pipeline.readers.values():
+                reader.close()
+                
+    @staticmethod
+    def _stop_streamer(streamer) -> Dict[str, Any]:
+        try:
+            return streamer.stop()
+        finally:
+            for reader in streamer.readers.values():
+                reader.close()
+                    
+    def _start_disk_streaming(self, config: ExperimentConfig) -> None:
+        """Start one disk writer per DAQ exposing ring buffer consumers."""
+        from .disk_streamer import DiskStreamWriter
+        
+        for daq_id, daq in self.data_acquisition.items():
+            if not hasattr(daq, 'add_consumer'):
+                continue
+            readers = daq.add_consumer("disk")
+            if not readers:
+                continue
+                
+            # Store raw ADC codes; the run index carries the volts scaling
+            channels = getattr(daq, 'channels', {})
+            streamer = DiskStreamWriter(
+                Path(config.output_directory) / daq_id,
+                {f"ch{ch}": reader for ch, reader in readers.items()},
+                sample_rate=getattr(daq, 'sample_rate', 1.0),
+                metadata={'daq_id': daq_id, 'experiment': asdict(config)},
+                scaling={
+                    f"ch{ch}": (cfg['scale'], cfg['offset'])
+                    for ch, cfg in channels.items() if 'scale' in cfg
+                },
+                fsync_policy=config.fsync_policy
+            )
+            streamer.start()
+            self.disk_streamers[daq_id] = streamer
+        
+    @staticmethod
+    def _load_streamed_run(run_dir: Path) -> Dict[str, np.ndarray]:
+        """Memory-map a streamed run as channel id -> samples (lazy volts)."""
+        from simulations.analysis.data_formats import read_raw_run
+        
+        fields = read_raw_run(run_dir).environmental_fields
+        return {name[len("ch"):]: samples for name, samples in fields.items()}
+        
     def _process_measurement_data(self) -> bool:
         """Process and store measurement data."""
         try:
-            # Basic data processing
             self.logger.info("Processing measurement data")
             
-            # TODO: Implement data processing algorithms
-            # - Correlation analysis
-            # - Noise filtering
-            # - Statistical analysis
-            
+            # Final results of the real-time pipelines
+            self.analysis_results = {}
+            while self.pipelines:
+                daq_id, pipeline = self.pipelines.popitem()
+                self.analysis_results[daq_id] = pipeline.results()
+                latency = self.processing_stats.get(daq_id, {}).get('latency', {})
+                if latency:
+                    self.logger.info(
+                        f"{daq_id}: processing latency "
+                        f"{latency['mean'] * 1e3:.1f} ms mean, "
+                        f"{latency['max'] * 1e3:.1f} ms max"
+                    )
+                    
+            if self.current_experiment and self.current_experiment.output_directory:
+                self.save_raw_runs(self.current_experiment.output_directory)
+                
             return True
             
         except Exception as e:
@@ -0,0 +1,548 @@
+"""
+Simulated SCPI instruments for driver testing and load testing.
+
+Drivers open instruments through :func:`hardware.drivers.visa.open_resource`;
+addresses of the form ``SIM::<kind>::<name>`` (kinds: ``scope``,
+``siggen``, ``tempctl``) are served in-process by the models in this
+module instead of VISA, so the full driver stack and
+``HardwareManager.run_experiment`` run on any machine without hardware.
+
+Each simulated session behaves like a pyvisa message-based resource
+(``write``, ``read``, ``query``, ``read_bytes``, ``close``) over a link
+with configurable latency, jitter and throughput, plus injected I/O
+errors, timeouts and disconnects. An instrument handles one transaction
+at a time, as a real device does, while different instruments run
+concurrently.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+Response = Union[str, bytes, None]
+
+
+class SimulatedVisaError(IOError):
+    """I/O error of a simulated session (mirrors pyvisa's VisaIOError)."""
+
+
+@dataclass
+class LinkProfile:
+    """Timing and fault model of the link to a simulated instrument."""
+    latency: float = 0.0  # seconds per write or read
+    jitter: float = 0.0  # extra latency, uniform in [0, jitter]
+    throughput: float = float('inf')  # bytes per second
+    error_rate: float = 0.0  # probability that a transfer fails
+    timeout_rate: float = 0.0  # probability that a query gets no response
+    disconnect_after: Optional[int] = None  # transfers before the link drops
+    seed: Optional[int] = None
+
+
+@dataclass
+class LinkStats:
+    """Traffic counters of a simulated instrument."""
+    writes: int = 0
+    reads: int = 0
+    bytes_written: int = 0
+    bytes_read: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    busy_time: float = 0.0  # seconds spent transferring
+
+
+class SimulatedInstrument:
+    """SCPI instrument model with IEEE 488.2 common commands."""
+
+    idn = "EQFE,SIM-INSTRUMENT,0,1.0"
+    defaults: Dict[str, str] = {}
+
+    def __init__(self, profile: Optional[LinkProfile] = None):
+        """
+        Initialize simulated instrument.
+
+        Args:
+            profile: Link timing and fault model (default: ideal link)
+        """
+        self.profile = profile or LinkProfile()
+        self.stats = LinkStats()
+        self.lock = threading.Lock()
+        self.rng = np.random.default_rng(self.profile.seed)
+        self.logger = logging.getLogger("EQFE.hardware.simulator")
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore power-on settings (``*RST``)."""
+        self.settings: Dict[str, str] = dict(self.defaults)
+        self.errors: List[str] = []
+        self.esr = 0  # Standard event status register
+        self.ese = 0
+        self.sre = 0
+        self.opc_pending = False
+
+    def execute(self, message: str) -> List[Response]:
+        """
+        Execute a program message.
+
+        Args:
+            message: One or more ``;``-separated commands
+
+        Returns:
+            Responses of the queries in the message
+        """
+        responses = []
+        for command in message.split(';'):
+            command = command.strip()
+            if not command:
+                continue
+            header, _, argument = command.partition(' ')
+            header = header.upper()
+            if ':' in header and not header.startswith(':'):
+                header = ':' + header  # Leading colon is optional
+            try:
+                response = self.handle(header, argument.strip())
+            except (KeyError, ValueError, IndexError) as e:
+                self.errors.append(f'-113,"Undefined header {header}: {e}"')
+                continue
+            if response is not None:
+                responses.append(response)
+        return responses
+
+    def handle(self, header: str, argument: str) -> Response:
+        """Execute one command; returns the response of a query."""
+        if header == "*IDN?":
+            return self.idn
+        if header == "*RST":
+            self.reset()
+        elif header == "*CLS":
+            self.esr = 0
+            self.errors.clear()
+        elif header == "*ESE":
+            self.ese = int(argument)
+        elif header == "*SRE":
+            self.sre = int(argument)
+        elif header == "*ESR?":
+            esr, self.esr = self.esr, 0
+            return str(esr)
+        elif header == "*STB?":
+            return str(self.status_byte())
+        elif header == "*OPC":
+            self.opc_pending = True
+            self.update()
+        elif header == "*OPC?":
+            return "1"
+        elif header == ":SYST:ERR?":
+            return self.errors.pop(0) if self.errors else '+0,"No error"'
+        elif header.endswith('?'):
+            # Generic query of a stored setting (KeyError if unknown)
+            return self.settings[header[:-1]]
+        else:
+            self.settings[header] = argument
+        return None
+
+    def update(self) -> None:
+        """Advance simulated time-dependent state (called per transfer)."""
+        if self.opc_pending and self.operation_complete():
+            self.opc_pending = False
+            self.esr |= 1
+
+    def operation_complete(self) -> bool:
+        """True when pending operations (e.g. an acquisition) are done."""
+        return True
+
+    def status_byte(self) -> int:
+        """Status byte with the event summary bit."""
+        self.update()
+        esb = 32 if self.esr & self.ese else 0
+        return esb | (64 if esb & self.sre else 0)
+
+
+class SimulatedOscilloscope(SimulatedInstrument):
+    """Keysight-style oscilloscope serving WORD/BYTE waveform blocks."""
+
+    idn = "KEYSIGHT TECHNOLOGIES,SIM-DSOX,0,1.0"
+    defaults = {
+        ':WAV:FORM': 'WORD',
+        ':WAV:SOUR': 'CHAN1',
+        ':RUN': '0',
+        ':TRIG:STAT': 'STOP',
+    }
+
+    def __init__(
+        self,
+        profile: Optional[LinkProfile] = None,
+        points: int = 10000,
+        trigger_delay: float = 1e-3,
+        signal_frequency: float = 1e6,
+        noise: float = 0.01,
+    ):
+        """
+        Initialize simulated oscilloscope.
+
+        Args:
+            profile: Link timing and fault model
+            points: Record length of each waveform
+            trigger_delay: Seconds from ``:SING`` to the trigger
+            signal_frequency: Frequency of the simulated input sine (Hz)
+            noise: RMS noise relative to the channel range
+        """
+        self.points = points
+        self.trigger_delay = trigger_delay
+        self.signal_frequency = signal_frequency
+        self.noise = noise
+        self._records: Dict[tuple, np.ndarray] = {}  # Noisy source records
+        self._codes: Dict[tuple, np.ndarray] = {}  # Their encoded samples
+        super().__init__(profile)
+
+    def reset(self) -> None:
+        super().reset()
+        self.sample_rate = 1e9
+        self.ranges: Dict[int, float] = {}
+        self.armed_at: Optional[float] = None
+        self.acquired: Dict[int, Tuple[tuple, slice]] = {}
+
+    def operation_complete(self) -> bool:
+        return self.triggered()
+
+    def triggered(self) -> bool:
+        """True once the armed acquisition has triggered."""
+        return (
+            self.armed_at is not None
+            and time.perf_counter() - self.armed_at >= self.trigger_delay
+        )
+
+    def handle(self, header: str, argument: str) -> Response:
+        if header == ":SING":
+            self.armed_at = time.perf_counter()
+            self.acquired = {}
+        elif header == ":OPER:COND?":
+            return "8" if self.triggered() else "0"
+        elif header == ":ACQ:SRAT":
+            self.sample_rate = float(argument)
+        elif header.startswith(":CHAN") and header.endswith(":RANG"):
+            self.ranges[int(header[5:-5])] = float(argument)
+        elif header == ":WAV:PRE?":
+            return ",".join(str(v) for v in self._preamble(self._source()))
+        elif header == ":WAV:DATA?":
+            return self._block(self._source())
+        elif header.startswith(":MEAS:") and header.endswith('?'):
+            return self._measure(header)
+        else:
+            return super().handle(header, argument)
+        return None
+
+    def _source(self) -> int:
+        return int(self.settings[':WAV:SOUR'][4:])
+
+    def _preamble(self, channel: int) -> Tuple[Any, ...]:
+        """format, type, points, count, xinc, xorig, xref, yinc, yorig, yref"""
+        word = self.settings[':WAV:FORM'] == 'WORD'
+        yinc = self.ranges.get(channel, 8.0) / (65536 if word else 256)
+        x_origin = -self.points / (2 * self.sample_rate)
+        return (1 if word else 0, 2, self.points, 1,
+                1.0 / self.sample_rate, x_origin, 0, yinc, 0.0, 0)
+
+    def _acquisition(self, channel: int) -> Tuple[tuple, slice]:
+        """
+        Record key and sample window of the channel's current acquisition.
+
+        Each trigger picks a random window of a fixed noisy record twice
+        the record length, so repeated acquisitions cost no synthesis.
+        """
+        if channel not in self.acquired:
+            key = (channel, self.ranges.get(channel, 8.0), self.sample_rate, self.points)
+            if key not in self._records:
+                t = np.arange(2 * self.points) / self.sample_rate
+                full_scale = key[1]
+                self._records[key] = (
+                    0.4 * full_scale * np.sin(2 * np.pi * self.signal_frequency * t)
+                    + self.rng.normal(0, self.noise * full_scale, len(t))
+                )
+            start = int(self.rng.integers(0, self.points))
+            self.acquired[channel] = (key, slice(start, start + self.points))
+        return self.acquired[channel]
+
+    def _voltages(self, channel: int) -> np.ndarray:
+        """Waveform of the current acquisition."""
+        key, window = self._acquisition(channel)
+        return self._records[key][window]
+
+    def _block(self, channel: int) -> bytes:
+        """IEEE 488.2 definite-length block of the channel's sample codes."""
+        if not self.triggered():
+            raise ValueError("no acquisition")
+        key, window = self._acquisition(channel)
+        word = self.settings[':WAV:FORM'] == 'WORD'
+        order = '>' if self.settings.get(':WAV:BYT', 'MSBF') == 'MSBF' else '<'
+        dtype = f'{order}i2' if word else 'i1'
+        if (key, dtype) not in self._codes:
+            limit = 32767 if word else 127
+            codes = np.round(self._records[key] / self._preamble(channel)[7])
+            self._codes[(key, dtype)] = np.clip(codes, -limit - 1, limit).astype(dtype)
+        body = self._codes[(key, dtype)][window].tobytes()
+        length = str(len(body)).encode()
+        return b"#" + str(len(length)).encode() + length + body
+
+    def _measure(self, header: str) -> str:
+        if header == ":MEAS:FREQ?":
+            return repr(self.signal_frequency)
+        if header == ":MEAS:PER?":
+            return repr(1.0 / self.signal_frequency)
+        channel = int(self.settings.get(':MEAS:SOUR', 'CHAN1')[4:])
+        v = self._voltages(channel)
+        values = {
+            ':MEAS:VPP?': v.max() - v.min(),
+            ':MEAS:VAMP?': v.max() - v.min(),
+            ':MEAS:VRMS?': np.sqrt(np.mean(v ** 2)),
+            ':MEAS:VAV?': v.mean(),
+            ':MEAS:VMAX?': v.max(),
+            ':MEAS:VMIN?': v.min(),
+        }
+        return repr(float(values.get(header, 9.9e37)))  # 9.9E37: no result
+
+
+class SimulatedSignalGenerator(SimulatedInstrument):
+    """Keysight-style two-channel function generator."""
+
+    idn = "KEYSIGHT TECHNOLOGIES,SIM-33600,0,1.0"
+    defaults = {
+        f':SOUR{ch}:{key}': value
+        for ch in (1, 2)
+        for key, value in (('FREQ', '1000.0'), ('POW', '0.1'), ('PHAS', '0.0'),
+                           ('FUNC', 'SIN'))
+    }
+
+    def handle(self, header: str, argument: str) -> Response:
+        if header.startswith(":OUTP"):
+            if header.endswith('?'):
+                return "1" if self.settings.get(header[:-1]) in ("ON", "1") else "0"
+            self.settings[header] = argument.upper()
+            return None
+        return super().handle(header, argument)
+
+
+class SimulatedTemperatureController(SimulatedInstrument):
+    """Lake Shore-style controller with a first-order thermal response."""
+
+    idn = "LSCI,SIM-MODEL336,0,1.0"
+
+    def __init__(
+        self,
+        profile: Optional[LinkProfile] = None,
+        temperature: float = 300.0,
+        time_constant: float = 1.0,
+        noise: float = 0.001,
+    ):
+        """
+        Initialize simulated temperature controller.
+
+        Args:
+            profile: Link timing and fault model
+            temperature: Initial sample temperature (K)
+            time_constant: Thermal time constant of the closed loop (s)
+            noise: RMS reading noise (K)
+        """
+        self.initial_temperature = temperature
+        self.time_constant = time_constant
+        self.noise = noise
+        super().__init__(profile)
+
+    def reset(self) -> None:
+        super().reset()
+        self.setpoint = self.initial_temperature
+        self.control = False
+        self._temperature = self.initial_temperature
+        self._updated = time.perf_counter()
+
+    def temperature(self) -> float:
+        """Advance the thermal model and return the true temperature."""
+        now = time.perf_counter()
+        if self.control:
+            decay = np.exp(-(now - self._updated) / self.time_constant)
+            self._temperature = self.setpoint + (self._temperature - self.setpoint) * decay
+        self._updated = now
+        return self._temperature
+
+    def handle(self, header: str, argument: str) -> Response:
+        if header == "KRDG?":
+            return f"{self.temperature() + self.rng.normal(0, self.noise):+.4f}"
+        if header == "HTR?":
+            error = self.setpoint - self.temperature()
+            return f"{np.clip(50 + 10 * error, 0, 100) if self.control else 0:.2f}"
+        if header == "SETP":
+            self.temperature()
+            self.setpoint = float(argument.split(',')[1])
+        elif header == "CSET":
+            self.temperature()
+            self.control = argument.split(',')[3] != "0"
+        return super().handle(header, argument)
+
+
+class SimulatedResource:
+    """Session to a simulated instrument with pyvisa's message interface."""
+
+    def __init__(self, resource_name: str, instrument: SimulatedInstrument):
+        self.resource_name = resource_name
+        self.instrument = instrument
+        self.timeout = 2000  # milliseconds, as in pyvisa
+        self.write_termination = '\n'
+        self.read_termination = '\n'
+        self._output = bytearray()
+        self._closed = False
+
+    def write(self, message: str) -> int:
+        """Send a program message."""
+        data = (message + self.write_termination).encode()
+        with self.instrument.lock:
+            self._transfer(len(data), writing=True)
+            responses = self.instrument.execute(message)
+            for response in responses:
+                if isinstance(response, str):
+                    response = response.encode()
+                self._output += response + self.read_termination.encode()
+        return len(data)
+
+    def read(self) -> str:
+        """Read one response message."""
+        terminator = self.read_termination.encode()
+        with self.instrument.lock:
+            end = self._output.find(terminator)
+            if end < 0:
+                self._timeout()
+            message = bytes(self._output[:end])
+            del self._output[:end + len(terminator)]
+            self._transfer(end + len(terminator), writing=False)
+        return message.decode()
+
+    def read_bytes(self, count: int, *args: Any, **kwargs: Any) -> bytes:
+        """Read exactly ``count`` bytes of the pending response."""
+        with self.instrument.lock:
+            if len(self._output) < count:
+                self._timeout()
+            data = bytes(self._output[:count])
+            del self._output[:count]
+            self._transfer(count, writing=False)
+        return data
+
+    def query(self, message: str) -> str:
+        """Send a query and read its response."""
+        self.write(message)
+        profile = self.instrument.profile
+        if profile.timeout_rate and self.instrument.rng.random() < profile.timeout_rate:
+            # Response lost: the read waits out the session timeout
+            with self.instrument.lock:
+                self._output.clear()
+                self._timeout()
+        return self.read()
+
+    def clear(self) -> None:
+        """Discard pending output (device clear)."""
+        with self.instrument.lock:
+            self._output.clear()
+
+    def close(self) -> None:
+        self._closed = True
+
+    def _transfer(self, n_bytes: int, writing: bool) -> None:
+        """Apply link latency, throughput and faults to one transfer."""
+        instrument = self.instrument
+        profile, stats = instrument.profile, instrument.stats
+        if self._closed:
+            raise SimulatedVisaError(f"{self.resource_name}: session closed")
+        transfers = stats.writes + stats.reads
+        if profile.disconnect_after is not None and transfers >= profile.disconnect_after:
+            stats.errors += 1
+            raise SimulatedVisaError(f"{self.resource_name}: connection lost")
+
+        delay = profile.latency + n_bytes / profile.throughput
+        if profile.jitter:
+            delay += instrument.rng.uniform(0, profile.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        stats.busy_time += delay
+        if writing:
+            stats.writes += 1
+            stats.bytes_written += n_bytes
+        else:
+            stats.reads += 1
+            stats.bytes_read += n_bytes
+        instrument.update()
+
+        if profile.error_rate and instrument.rng.random() < profile.error_rate:
+            stats.errors += 1
+            raise SimulatedVisaError(f"{self.resource_name}: I/O error (injected)")
+
+    def _timeout(self) -> None:
+        """Wait out the session timeout and fail, as a VISA read does."""
+        self.instrument.stats.timeouts += 1
+        time.sleep(self.timeout / 1000)
+        raise SimulatedVisaError(f"{self.resource_name}: timeout expired")
+
+
+class InstrumentSimulator:
+    """Registry of simulated instruments, addressed as ``SIM::<kind>::<name>``."""
+
+    kinds: Dict[str, Type[SimulatedInstrument]] = {
+        'scope': SimulatedOscilloscope,
+        'siggen': SimulatedSignalGenerator,
+        'tempctl': SimulatedTemperatureController,
+    }
+
+    def __init__(self, profile: Optional[LinkProfile] = None):
+        """
+        Initialize simulator.
+
+        Args:
+            profile: Link model of instruments created on first use
+        """
+        self.profile = profile or LinkProfile()
+        self.instruments: Dict[str, SimulatedInstrument] = {}
+        self._lock = threading.Lock()
+
+    def add(self, address: str, instrument: SimulatedInstrument) -> SimulatedInstrument:
+        """Register (or replace) the instrument at ``address``."""
+        with self._lock:
+            self.instruments[address] = instrument
+        return instrument
+
+    def get(self, address: str) -> SimulatedInstrument:
+        """Instrument at ``address``, created from its kind on first use."""
+        with self._lock:
+            if address not in self.instruments:
+                parts = address.split('::')
+                if len(parts) < 3 or parts[0] != 'SIM' or parts[1] not in self.kinds:
+                    raise SimulatedVisaError(f"No simulated instrument at {address}")
+                self.instruments[address] = self.kinds[parts[1]](
+                    LinkProfile(**asdict(self.profile))
+                )
+            return self.instruments[address]
+
+    def open_resource(self, address: str) -> SimulatedResource:
+        """Open a session to a simulated instrument."""
+        return SimulatedResource(address, self.get(address))
+
+    def list_resources(self) -> Tuple[str, ...]:
+        return tuple(self.instruments)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Traffic counters per instrument address."""
+        return {address: asdict(inst.stats) for address, inst in self.instruments.items()}
+
+    def clear(self) -> None:
+        """Remove all instruments."""
+        with self._lock:
+            self.instruments.clear()
+
+
+_default_simulator: Optional[InstrumentSimulator] = None
+
+
+def default_simulator() -> InstrumentSimulator:
+    """Process-wide simulator serving ``SIM::`` addresses."""
+    global _default_simulator
+    if _default_simulator is None:
+        _default_simulator = InstrumentSimulator()
+    return _default_simulator
@@ -3,9 +3,16 @@
 from .quantum_sensors import QuantumSensorInterface
 from .field_generators import FieldGeneratorInterface
 from .data_acquisition import DataAcquisitionInterface
+from .ring_buffer import RingBuffer, RingBufferReader
+from .coincidence import CoincidenceEngine
+from .photon_correlation import G2Correlator
 
 __all__ = [
     "QuantumSensorInterface",
     "FieldGeneratorInterface",
-    "DataAcquisitionInterface"
+    "DataAcquisitionInterface",
+    "RingBuffer",
+    "RingBufferReader",
+    "CoincidenceEngine",
+    "G2Correlator"
 ]
@@ -7,11 +7,13 @@ oscilloscopes, and real-time data processing units.
 
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 import threading
 import time
 
+from .ring_buffer import RingBuffer, RingBufferReader
+
 
 class DataAcquisitionInterface(ABC):
     """Abstract base class for data acquisition interfaces."""
@@ -26,6 +28,7 @@ class DataAcquisitionInterface(ABC):
         """
         self.device_id = device_id
         self.config = config
+        self.is_connected = False
         self.is_acquiring = False
         self.logger = logging.getLogger(f"EQFE.hardware.{device_id}")
         
@@ -84,7 +87,18 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
         self.buffer_size = config.get('buffer_size', 1024*1024)  # 1M samples
         
         self.channels = {}
-        self.data_buffer = {}
+        # Per-channel ring buffers of raw ADC codes (single producer: the
+        # acquisition thread); converted to volts only when read
+        self.sample_dtype = np.dtype(
+            np.int8 if self.resolution <= 8
+            else np.int16 if self.resolution <= 16
+            else np.int32
+        )
+        self.data_buffer: Dict[str, RingBuffer] = {}
+        # get_data cursors, created on first use so that runs consumed only
+        # by other readers (disk streaming, pipelines) do not overrun them
+        self._default_readers: Dict[str, RingBufferReader] = {}
+        self._acquisition_start: Dict[str, int] = {}  # Sample index per channel
         self.acquisition_thread = None
         self._stop_acquisition = threading.Event()
         
@@ -93,6 +107,7 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
         try:
             self.logger.info(f"Connecting to digitizer {self.device_id}")
             # TODO: Implement actual hardware connection
+            self.is_connected = True
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to digitizer: {e}")
@@ -104,25 +119,38 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
             if self.is_acquiring:
                 self.stop_acquisition()
             self.logger.info(f"Disconnecting digitizer {self.device_id}")
+            self.is_connected = False
             return True
         except Exception as e:
             self.logger.error(f"Failed to disconnect digitizer: {e}")
             return False
             
     def configure_channels(self, channel_config: Dict[str, Any]) -> bool:
-        """Configure digitizer channels."""
+        """
+        Configure digitizer channels.
+        
+        Each channel's ADC codes span +/- ``voltage_range`` around
+        ``offset``; the resulting volts-per-code ``scale`` is stored with
+        the channel configuration.
+        """
         try:
             for channel_id, config in channel_config.items():
                 if int(channel_id) >= self.num_channels:
                     raise ValueError(f"Channel {channel_id} exceeds available channels")
                     
+                voltage_range = config.get('voltage_range', 1.0)  # Volts
                 self.channels[channel_id] = {
                     'enabled': config.get('enabled', True),
-                    'voltage_range': config.get('voltage_range', 1.0),  # Volts
+                    'voltage_range': voltage_range,
                     'coupling': config.get('coupling', 'DC'),
                     'impedance': config.get('impedance', 50),  # Ohms
-                    'offset': config.get('offset', 0.0)
+                    'offset': config.get('offset', 0.0),
+                    'scale': voltage_range / 2 ** (self.resolution - 1)
                 }
+                if channel_id not in self.data_buffer:
+                    self.data_buffer[channel_id] = RingBuffer(
+                        self.buffer_size, dtype=self.sample_dtype
+                    )
                 
             self.logger.info(f"Configured {len(self.channels)} channels")
             return True
@@ -142,6 +170,11 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
                 raise ValueError("No channels configured")
                 
             self.logger.info("Starting high-speed acquisition")
+            # get_data returns samples of this acquisition onwards
+            for channel_id, ring in self.data_buffer.items():
+                self._acquisition_start[channel_id] = ring.write_index
+            for reader in self._default_readers.values():
+                reader.skip_to_latest()
             self.is_acquiring = True
             self._stop_acquisition.clear()
             
@@ -177,17 +210,75 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
             self.logger.error(f"Failed to stop acquisition: {e}")
             return False
             
-    def get_data(self) -> Dict[str, np.ndarray]:
-        """Get most recent acquired data."""
-        if not self.data_buffer:
-            return {}
-            
-        # Return copy of current buffer
-        return {ch: data.copy() for ch, data in self.data_buffer.items()}
+    def get_data(self, raw: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Get all samples acquired since the previous call.
+
+        The first call returns the samples of the current (or last)
+        acquisition. Samples are only lost if the caller falls more than
+        ``buffer_size`` samples behind; such losses are reported in the
+        acquisition status.
+
+        Args:
+            raw: Return the integer ADC codes instead of volts (see
+                :meth:`to_volts`)
+        """
+        for ch, ring in self.data_buffer.items():
+            if ch not in self._default_readers:
+                self._default_readers[ch] = ring.add_reader(
+                    "get_data", start=self._acquisition_start.get(ch, 0)
+                )
+        codes = {
+            ch: reader.read() for ch, reader in self._default_readers.items()
+        }
+        if raw:
+            return codes
+        return {ch: self.to_volts(ch, data) for ch, data in codes.items()}
+
+    def to_volts(self, channel_id: str, codes: np.ndarray) -> np.ndarray:
+        """
+        Convert a channel's ADC codes to volts.
+
+        Args:
+            channel_id: Channel the codes were acquired on
+            codes: Integer ADC codes
+
+        Returns:
+            Float64 voltages (``codes * scale + offset``)
+        """
+        config = self.channels[channel_id]
+        volts = np.asarray(codes, dtype=np.float64)
+        volts *= config['scale']
+        volts += config['offset']
+        return volts
+
+    def add_consumer(
+        self, name: Optional[str] = None, from_oldest: bool = False
+    ) -> Dict[str, RingBufferReader]:
+        """
+        Register an additional consumer of all configured channels.
+
+        Each consumer has its own read cursors and overrun counters, so it
+        can read at its own pace without affecting :meth:`get_data` or
+        other consumers.
+
+        Args:
+            name: Consumer name (for status reporting)
+            from_oldest: Start at the oldest retained samples instead of
+                only seeing new ones
+
+        Returns:
+            Channel id -> ring buffer reader
+        """
+        return {
+            ch: ring.add_reader(name, from_oldest=from_oldest)
+            for ch, ring in self.data_buffer.items()
+        }
         
     def get_acquisition_status(self) -> Dict[str, Any]:
         """Get digitizer acquisition status."""
         return {
+            'connected': self.is_connected,
             'acquiring': self.is_acquiring,
             'sample_rate': self.sample_rate,
             'resolution': self.resolution,
@@ -195,10 +286,38 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
             'active_channels': len([ch for ch, cfg in self.channels.items() 
                                   if cfg.get('enabled', False)]),
             'buffer_size': self.buffer_size,
-            'data_available': len(self.data_buffer) > 0,
+            'data_available': any(
+                ring.write_index > self._get_data_cursor(ch)
+                for ch, ring in self.data_buffer.items()
+            ),
+            'samples_acquired': {
+                ch: ring.write_index for ch, ring in self.data_buffer.items()
+            },
+            'consumer_lag': {
+                ch: {
+                    reader.name: ring.write_index - reader.cursor
+                    for reader in ring.readers
+                }
+                for ch, ring in self.data_buffer.items()
+            },
+            'overruns': {
+                ch: {
+                    reader.name: reader.samples_lost
+                    for reader in ring.readers
+                    if reader.samples_lost
+                }
+                for ch, ring in self.data_buffer.items()
+            },
             'memory_usage': self._get_memory_usage()
         }
         
+    def _get_data_cursor(self, channel_id: str) -> int:
+        """Sample index the next :meth:`get_data` call starts from."""
+        reader = self._default_readers.get(channel_id)
+        if reader is not None:
+            return reader.cursor
+        return self._acquisition_start.get(channel_id, 0)
+        
     def _acquisition_loop(self):
         """Main acquisition loop running in separate thread."""
         while not self._stop_acquisition.is_set():
@@ -209,7 +328,7 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
                     if config.get('enabled', False):
                         # Generate simulated data
                         data = self._simulate_channel_data(channel_id, 1000)
-                        self.data_buffer[channel_id] = data
+                        self.data_buffer[channel_id].write(data)
                         
                 time.sleep(0.001)  # 1ms acquisition cycle
                 
@@ -218,7 +337,7 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
                 break
                 
     def _simulate_channel_data(self, channel_id: str, num_samples: int) -> np.ndarray:
-        """Simulate channel data for testing."""
+        """Simulate channel data (as ADC codes) for testing."""
         config = self.channels[channel_id]
         voltage_range = config.get('voltage_range', 1.0)
         
@@ -227,12 +346,16 @@ class HighSpeedDigitizer(DataAcquisitionInterface):
         signal = voltage_range * 0.1 * np.sin(2 * np.pi * 1e6 * 
                                              np.arange(num_samples) / self.sample_rate)
         
-        return signal + noise
+        # Quantize relative to the channel offset, clipping at full scale
+        full_scale = 2 ** (self.resolution - 1)
+        codes = np.rint((signal + noise) / config['scale'])
+        np.clip(codes, -full_scale, full_scale - 1, out=codes)
+        return codes.astype(self.sample_dtype)
         
     def _get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
-        total_samples = sum(len(data) for data in self.data_buffer.values())
-        return total_samples * 8 / (1024 * 1024)  # 8 bytes per float64
+        """Get ring buffer memory in MB (at the ADC sample width)."""
+        total_bytes = sum(ring.nbytes for ring in self.data_buffer.values())
+        return total_bytes / (1024 * 1024)
 
 
 class OscilloscopeInterface(DataAcquisitionInterface):
@@ -253,6 +376,7 @@ class OscilloscopeInterface(DataAcquisitionInterface):
         try:
             self.logger.info(f"Connecting to oscilloscope {self.device_id}")
             # TODO: Implement actual SCPI/VISA connection
+            self.is_connected = True
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to oscilloscope: {e}")
@@ -262,6 +386,7 @@ class OscilloscopeInterface(DataAcquisitionInterface):
         """Disconnect from oscilloscope."""
         try:
             self.logger.info(f"Disconnecting oscilloscope {self.device_id}")
+            self.is_connected = False
             return True
         except Exception as e:
             self.logger.error(f"Failed to disconnect oscilloscope: {e}")
@@ -307,6 +432,7 @@ class OscilloscopeInterface(DataAcquisitionInterface):
     def get_acquisition_status(self) -> Dict[str, Any]:
         """Get oscilloscope status."""
         return {
+            'connected': self.is_connected,
             'acquiring': self.is_acquiring,
             'bandwidth': self.bandwidth,
             'max_sample_rate': self.max_sample_rate,
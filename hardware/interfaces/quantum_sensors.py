@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 
+from .coincidence import CoincidenceEngine
+
 
 class QuantumSensorInterface(ABC):
     """Abstract base class for quantum sensor interfaces."""
@@ -69,6 +71,7 @@ class SinglePhotonDetector(QuantumSensorInterface):
         self.detection_efficiency = config.get('efficiency', 0.85)
         self.dark_count_rate = config.get('dark_count_rate', 100)  # Hz
         self.timing_resolution = config.get('timing_resolution', 50e-12)  # seconds
+        self.coincidence_window = config.get('coincidence_window', 1e-9)  # seconds
         
     def connect(self) -> bool:
         """Connect to SPAD array."""
@@ -116,6 +119,18 @@ class SinglePhotonDetector(QuantumSensorInterface):
             'measurement_duration': duration,
             'detector_id': self.device_id
         }
+
+    def coincidence_engine(self, bin_width: float = 1.0) -> CoincidenceEngine:
+        """
+        Create a coincidence counter for this detector's time tags.
+
+        Args:
+            bin_width: Analysis bin width in seconds
+
+        Returns:
+            Engine using the configured coincidence window
+        """
+        return CoincidenceEngine(self.coincidence_window, bin_width)
         
     def get_status(self) -> Dict[str, Any]:
         """Get SPAD status metrics."""
@@ -0,0 +1,283 @@
+"""
+Lock-free single-producer / multi-consumer ring buffer for sample streams.
+
+The producer (an acquisition thread) writes into a preallocated array and
+publishes a monotonically increasing write index; each consumer keeps its
+own read cursor. Neither side takes a lock on the data path. A consumer
+that falls more than one buffer behind loses the overwritten samples, and
+every such loss is counted in its overrun counters rather than dropped
+silently.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class RingBufferReader:
+    """Read cursor of one consumer on a :class:`RingBuffer`."""
+
+    def __init__(self, ring: "RingBuffer", cursor: int, name: str):
+        self.ring = ring
+        self.cursor = cursor
+        self.name = name
+        self.overruns = 0  # Number of times samples were lost
+        self.samples_lost = 0
+        self.samples_read = 0
+
+    def _record_loss(self, lost: int) -> None:
+        if lost > 0:
+            self.overruns += 1
+            self.samples_lost += lost
+
+    def _catch_up(self) -> int:
+        """Skip samples already overwritten; return the current write index."""
+        write_index = self.ring.write_index
+        oldest = write_index - self.ring.capacity
+        if self.cursor < oldest:
+            self._record_loss(oldest - self.cursor)
+            self.cursor = oldest
+        return write_index
+
+    def available(self) -> int:
+        """Number of unread samples (after accounting for any overrun)."""
+        return self._catch_up() - self.cursor
+
+    @contextmanager
+    def view(
+        self, max_samples: Optional[int] = None
+    ) -> Iterator[List[np.ndarray]]:
+        """
+        Zero-copy access to the next unread samples.
+
+        Yields one or two array views (two when the range wraps around the
+        end of the buffer) and advances the cursor on exit. If the producer
+        overwrote part of the range while the views were in use, the
+        overwritten samples are reported as an overrun.
+
+        Args:
+            max_samples: Upper limit on the number of samples
+
+        Yields:
+            List of read-only array views, in sample order
+        """
+        write_index = self._catch_up()
+        start = self.cursor
+        stop = write_index
+        if max_samples is not None:
+            stop = min(stop, start + max_samples)
+
+        views = self.ring._segments(start, stop)
+        try:
+            yield views
+        finally:
+            # Samples before this index were (or are being) overwritten
+            oldest = self.ring.claim_index - self.ring.capacity
+            self._record_loss(min(oldest, stop) - start)
+            self.cursor = stop
+            self.samples_read += stop - start
+
+    def read(self, max_samples: Optional[int] = None) -> np.ndarray:
+        """
+        Copy out the next unread samples.
+
+        Samples overwritten during the copy are discarded from the result
+        and counted as an overrun, so the returned array is always
+        consistent.
+
+        Args:
+            max_samples: Upper limit on the number of samples
+
+        Returns:
+            Array of samples in acquisition order
+        """
+        write_index = self._catch_up()
+        start = self.cursor
+        stop = write_index
+        if max_samples is not None:
+            stop = min(stop, start + max_samples)
+
+        segments = self.ring._segments(start, stop)
+        data = (
+            np.concatenate(segments)
+            if len(segments) > 1
+            else segments[0].copy()
+        )
+
+        oldest = self.ring.claim_index - self.ring.capacity
+        torn = min(max(oldest - start, 0), stop - start)
+        self._record_loss(torn)
+        self.cursor = stop
+        self.samples_read += stop - start - torn
+        return data[torn:]
+
+    def skip_to(self, index: int) -> int:
+        """
+        Move the cursor forward to absolute sample ``index``.
+
+        Skipped samples are counted as lost. Used to keep readers of
+        parallel channels on the same sample.
+
+        Returns:
+            Number of samples skipped
+        """
+        skipped = max(int(index) - self.cursor, 0)
+        self._record_loss(skipped)
+        self.cursor += skipped
+        return skipped
+
+    def skip_to_latest(self) -> int:
+        """Discard all unread samples (not counted as lost); return how many."""
+        write_index = self.ring.write_index
+        skipped = write_index - max(self.cursor, write_index - self.ring.capacity)
+        self.cursor = write_index
+        return skipped
+
+    def close(self) -> None:
+        """Detach from the ring buffer."""
+        self.ring.remove_reader(self)
+
+
+class RingBuffer:
+    """
+    Preallocated single-producer / multi-consumer sample ring buffer.
+
+    Only one thread may call :meth:`write` (or :meth:`acquire_write` /
+    :meth:`commit`); any number of :class:`RingBufferReader` consumers may
+    read concurrently. ``write_index`` counts all samples ever published;
+    ``claim_index`` additionally includes samples the producer is writing
+    right now, so readers can detect ranges overwritten during a read.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Number of samples held
+            dtype: Sample dtype
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(self.capacity, dtype=self.dtype)
+        self.write_index = 0
+        self.claim_index = 0
+        self._readers: List[RingBufferReader] = []
+        self._readers_lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the preallocated storage."""
+        return self._data.nbytes
+
+    @property
+    def readers(self) -> Tuple[RingBufferReader, ...]:
+        return tuple(self._readers)
+
+    def add_reader(
+        self,
+        name: Optional[str] = None,
+        from_oldest: bool = False,
+        start: Optional[int] = None,
+    ) -> RingBufferReader:
+        """
+        Register a consumer.
+
+        Args:
+            name: Consumer name (for status reporting)
+            from_oldest: Start at the oldest retained sample instead of
+                only seeing samples written from now on
+            start: Absolute sample index to start at instead; samples
+                before it that are already overwritten count as lost on
+                the first read
+
+        Returns:
+            Reader with its own cursor
+        """
+        write_index = self.write_index
+        if start is not None:
+            cursor = min(int(start), write_index)
+        elif from_oldest:
+            cursor = max(write_index - self.capacity, 0)
+        else:
+            cursor = write_index
+        reader = RingBufferReader(
+            self, cursor, name or f"reader{len(self._readers)}"
+        )
+        with self._readers_lock:
+            self._readers.append(reader)
+        return reader
+
+    def remove_reader(self, reader: RingBufferReader) -> None:
+        with self._readers_lock:
+            if reader in self._readers:
+                self._readers.remove(reader)
+
+    def _segments(self, start: int, stop: int) -> List[np.ndarray]:
+        """Views of absolute sample range [start, stop) (at most two)."""
+        if stop <= start:
+            return [self._data[:0]]
+        lo = start % self.capacity
+        hi = lo + (stop - start)
+        if hi <= self.capacity:
+            segments = [self._data[lo:hi]]
+        else:
+            segments = [self._data[lo:], self._data[: hi - self.capacity]]
+        for segment in segments:
+            segment.flags.writeable = False
+        return segments
+
+    def acquire_write(self, n_samples: int) -> List[np.ndarray]:
+        """
+        Writable views for the next ``n_samples`` (producer only).
+
+        Fill the views in place (e.g. from a DMA transfer) and then call
+        :meth:`commit` to publish them to readers.
+        """
+        n_samples = min(int(n_samples), self.capacity)
+        self.claim_index = self.write_index + n_samples
+        lo = self.write_index % self.capacity
+        hi = lo + n_samples
+        if hi <= self.capacity:
+            return [self._data[lo:hi]]
+        return [self._data[lo:], self._data[: hi - self.capacity]]
+
+    def commit(self, n_samples: int) -> None:
+        """Publish samples filled through :meth:`acquire_write`."""
+        self.write_index += int(n_samples)
+        self.claim_index = self.write_index
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Append samples (producer only).
+
+        Blocks larger than the capacity keep only their newest samples.
+
+        Returns:
+            Number of samples written
+        """
+        samples = np.asarray(samples)
+        n = len(samples)
+        if n > self.capacity:
+            # Older samples would be overwritten immediately
+            self.write_index += n - self.capacity
+            self.claim_index = self.write_index
+            samples = samples[-self.capacity :]
+            n = self.capacity
+        offset = 0
+        for view in self.acquire_write(n):
+            view[...] = samples[offset : offset + len(view)]
+            offset += len(view)
+        self.commit(n)
+        return n
+
+    def latest(self, n_samples: int) -> np.ndarray:
+        """Copy of the newest ``n_samples`` (without moving any cursor)."""
+        stop = self.write_index
+        start = max(stop - min(n_samples, self.capacity), 0)
+        segments = self._segments(start, stop)
+        return np.concatenate(segments) if len(segments) > 1 else segments[0].copy()
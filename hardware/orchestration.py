@@ -0,0 +1,252 @@
+"""
+Concurrent device orchestration for EQFE experiments.
+
+Driver calls block on instrument I/O, so bringing up, polling or shutting
+down a rig one device at a time takes the sum of all device latencies.
+:class:`DeviceOrchestrator` runs such blocking calls in a bounded thread
+pool and awaits them concurrently with asyncio, giving each call its own
+timeout; a whole group of calls then takes as long as its slowest device.
+
+A timeout starts when the call starts running, so time spent queued
+behind other calls is not counted against it. A call that times out keeps
+running in its thread (blocking I/O cannot be interrupted); until it
+returns, further calls for the same device are answered as busy instead of
+queueing another call behind the hung one.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class DeviceResult:
+    """Outcome of one device call."""
+    device_id: str
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0  # seconds
+    timed_out: bool = False
+    cancelled: bool = False
+    busy: bool = False  # A previous call for the device is still running
+
+
+# Device id -> (blocking callable, args, timeout or None for the default)
+DeviceCalls = Dict[str, Tuple[Callable[..., Any], tuple, Optional[float]]]
+
+
+class DeviceOrchestrator:
+    """Run blocking device calls concurrently in a bounded thread pool."""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        default_timeout: float = 30.0,
+        queue_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize orchestrator.
+
+        Args:
+            max_workers: Thread pool size (upper bound on concurrent device
+                calls; further calls queue)
+            default_timeout: Per-call timeout in seconds, counted from when
+                the call starts running
+            queue_timeout: Longest time a call may wait for a free thread
+                (default: ``default_timeout``)
+        """
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.queue_timeout = (
+            default_timeout if queue_timeout is None else queue_timeout
+        )
+        self.logger = logging.getLogger("EQFE.hardware.orchestration")
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Dict[str, Future] = {}  # Device id -> running call
+        self._in_flight_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="device"
+            )
+        return self._executor
+
+    async def call(
+        self,
+        device_id: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> DeviceResult:
+        """
+        Run one blocking call in the thread pool.
+
+        The timeout applies to the time the call runs. A call still queued
+        after ``queue_timeout`` seconds, or cancelled while queued, never
+        runs. A
+        call already running in a thread cannot be interrupted; it is
+        abandoned, finishes in the background, and the device is reported
+        busy until it does.
+
+        Args:
+            device_id: Device the call is for (used in results and logs)
+            func: Blocking callable; a False return counts as failure
+            *args: Arguments for ``func``
+            timeout: Timeout in seconds (default: ``default_timeout``)
+
+        Returns:
+            Device result (exceptions are captured, not raised)
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        with self._in_flight_lock:
+            previous = self._in_flight.get(device_id)
+        if previous is not None and not previous.done():
+            self.logger.warning(f"{device_id}: previous call still running")
+            return DeviceResult(
+                device_id, False, error="busy: previous call still running",
+                elapsed=time.perf_counter() - start, busy=True
+            )
+
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+        gate = threading.Lock()
+        state = {'running': False, 'abandoned': False}
+
+        def run():
+            with gate:
+                if state['abandoned']:
+                    return None
+                state['running'] = True
+            loop.call_soon_threadsafe(started.set)
+            return func(*args)
+
+        def abandon() -> bool:
+            """Stop a queued call from running; False if it already started."""
+            with gate:
+                state['abandoned'] = not state['running']
+            if state['abandoned']:
+                future.cancel()
+                self._release(device_id, future)
+            return state['abandoned']
+
+        future = self.executor.submit(run)
+        with self._in_flight_lock:
+            self._in_flight[device_id] = future
+        future.add_done_callback(lambda f: self._release(device_id, f))
+        try:
+            try:
+                await asyncio.wait_for(started.wait(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                if abandon():
+                    self.logger.error(
+                        f"{device_id}: not started within "
+                        f"{self.queue_timeout:.1f} s (thread pool busy)"
+                    )
+                    return DeviceResult(
+                        device_id, False,
+                        error=f"not started within {self.queue_timeout} s",
+                        elapsed=time.perf_counter() - start, timed_out=True
+                    )
+            value = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.CancelledError:
+            abandon()
+            raise
+        except asyncio.TimeoutError:
+            self.logger.error(f"{device_id}: no response within {timeout:.1f} s")
+            return DeviceResult(
+                device_id, False, error=f"timed out after {timeout} s",
+                elapsed=time.perf_counter() - start, timed_out=True
+            )
+        except Exception as e:
+            self.logger.error(f"{device_id}: {e}")
+            return DeviceResult(
+                device_id, False, error=str(e),
+                elapsed=time.perf_counter() - start
+            )
+        return DeviceResult(
+            device_id, value is not False, value=value,
+            elapsed=time.perf_counter() - start
+        )
+
+    def _release(self, device_id: str, future: Future) -> None:
+        """Forget a finished (or abandoned) call of a device."""
+        with self._in_flight_lock:
+            if self._in_flight.get(device_id) is future:
+                del self._in_flight[device_id]
+
+    async def gather(
+        self, calls: DeviceCalls, fail_fast: bool = False
+    ) -> Dict[str, DeviceResult]:
+        """
+        Run calls for many devices concurrently.
+
+        Args:
+            calls: Device id -> (callable, args, timeout)
+            fail_fast: Cancel the remaining calls as soon as one fails
+
+        Returns:
+            Device id -> result, for every device in ``calls``
+        """
+        tasks = {
+            device_id: asyncio.ensure_future(
+                self.call(device_id, func, *args, timeout=timeout)
+            )
+            for device_id, (func, args, timeout) in calls.items()
+        }
+        if not tasks:
+            return {}
+
+        pending = set(tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if fail_fast and any(not t.result().success for t in done):
+                    break
+        finally:
+            # Reached on fail-fast and when the caller itself is cancelled
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+        return {
+            device_id: (
+                DeviceResult(device_id, False, error="cancelled", cancelled=True)
+                if task.cancelled() else task.result()
+            )
+            for device_id, task in tasks.items()
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Release the thread pool (a new one is created on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+def run_sync(coro) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Raises:
+        RuntimeError: If called from a running event loop; await the
+            ``*_async`` method instead
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    coro.close()
+    raise RuntimeError(
+        "Called from a running event loop; await the async variant instead"
+    )
@@ -0,0 +1,665 @@
+"""
+Real-time processing pipeline for DAQ sample blocks.
+
+Blocks read from DAQ ring buffers pass through a chain of stages (filtering,
+decimation, coincidence counting, CHSH estimation, live environmental
+correlation), each running in its own worker thread. Stages are connected
+by bounded queues: a slow stage back-pressures the reader instead of
+growing memory, and the reader's ring buffer then absorbs (and counts) any
+overrun. NumPy releases the GIL in the heavy kernels, so stages overlap.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .interfaces.ring_buffer import RingBufferReader
+
+# Ends the stream when passed through the stage queues
+_END = None
+
+
+@dataclass
+class DataBlock:
+    """A block of simultaneous channel samples travelling through the pipeline."""
+    sequence: int
+    first_sample: int  # Stream index of the first sample (at sample_rate)
+    sample_rate: float
+    channels: Dict[str, np.ndarray]
+    acquired_at: float  # time.perf_counter() when read from the DAQ
+    results: Dict[str, Any] = field(default_factory=dict)
+
+
+class PipelineStage:
+    """
+    Base class of pipeline stages.
+
+    A stage sees every block in order and may keep state across blocks
+    (filter memory, partial windows). Each stage runs in its own thread,
+    so it needs no locking.
+    """
+
+    name = "stage"
+
+    def process(self, block: DataBlock) -> Optional[DataBlock]:
+        """Process one block; return it (possibly modified) or None to drop it."""
+        raise NotImplementedError
+
+    def finish(self) -> Dict[str, Any]:
+        """Final results once the stream has ended."""
+        return {}
+
+
+class LowPassFilter(PipelineStage):
+    """Butterworth low-pass filter with filter state carried across blocks."""
+
+    name = "filter"
+
+    def __init__(
+        self,
+        cutoff: float,
+        order: int = 4,
+        channels: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initialize filter.
+
+        Args:
+            cutoff: Cutoff frequency in Hz
+            order: Filter order
+            channels: Channels to filter (default: all)
+        """
+        self.cutoff = cutoff
+        self.order = order
+        self.channels = channels
+        self._sos = None
+        self._state: Dict[str, np.ndarray] = {}
+
+    def process(self, block: DataBlock) -> DataBlock:
+        from scipy import signal
+
+        if self._sos is None:
+            self._sos = signal.butter(
+                self.order, self.cutoff, fs=block.sample_rate, output="sos"
+            )
+        for name in self.channels or list(block.channels):
+            samples = np.asarray(block.channels[name], dtype=float)
+            if not len(samples):
+                continue
+            if name not in self._state:
+                # Start in steady state at the first sample (no turn-on transient)
+                self._state[name] = signal.sosfilt_zi(self._sos) * samples[0]
+            block.channels[name], self._state[name] = signal.sosfilt(
+                self._sos, samples, zi=self._state[name]
+            )
+        return block
+
+
+class Decimator(PipelineStage):
+    """Block-average decimation of all channels by an integer factor."""
+
+    name = "decimate"
+
+    def __init__(self, factor: int):
+        """
+        Initialize decimator.
+
+        Args:
+            factor: Number of input samples averaged into each output sample;
+                samples left over at the end of a block carry to the next
+        """
+        if factor < 1:
+            raise ValueError("factor must be at least 1")
+        self.factor = factor
+        self._tail: Dict[str, np.ndarray] = {}
+
+    def process(self, block: DataBlock) -> DataBlock:
+        f = self.factor
+        carried = 0
+        for name, samples in block.channels.items():
+            samples = np.asarray(samples, dtype=float)
+            tail = self._tail.get(name)
+            if tail is not None and len(tail):
+                carried = len(tail)
+                samples = np.concatenate([tail, samples])
+            n_used = len(samples) // f * f
+            self._tail[name] = samples[n_used:]
+            block.channels[name] = samples[:n_used].reshape(-1, f).mean(axis=1)
+
+        block.first_sample = (block.first_sample - carried) // f
+        block.sample_rate /= f
+        return block
+
+
+class CoincidenceCounter(PipelineStage):
+    """
+    Gated coincidence counting of analog detector pulses.
+
+    Each detector channel registers a click on a rising crossing of
+    ``threshold``. Samples are grouped into gates of ``gate_samples``; a
+    side (A or B) has an event in a gate when exactly one of its '+' and
+    '-' detectors clicked, and a coincidence when both sides do. Analyzer
+    settings are logic levels sampled at the start of each gate.
+    Coincidences accumulate per analysis window of ``window_samples`` in the
+    dense [window, setting, outcome] layout of
+    ``CHSHAnalyzer.analyze_count_array``; field channels are averaged over
+    the same windows so they pair with the CHSH series.
+    """
+
+    name = "coincidences"
+
+    def __init__(
+        self,
+        detectors: Dict[str, str],
+        settings: Dict[str, str],
+        window_samples: int,
+        gate_samples: int = 1,
+        threshold: float = 0.5,
+        setting_threshold: float = 0.5,
+        fields: Sequence[str] = (),
+    ):
+        """
+        Initialize coincidence counter.
+
+        Args:
+            detectors: Channel of each detector 'A+', 'A-', 'B+' and 'B-'
+            settings: Logic-level channel of each analyzer setting 'A', 'B'
+                (high selects setting 1)
+            window_samples: Samples per analysis window (a multiple of
+                ``gate_samples``)
+            gate_samples: Coincidence gate width in samples
+            threshold: Detector click threshold (volts)
+            setting_threshold: Setting logic threshold (volts)
+            fields: Environmental field channels averaged per window
+        """
+        missing = {"A+", "A-", "B+", "B-"} - set(detectors)
+        missing |= {"A", "B"} - set(settings)
+        if missing:
+            raise ValueError(f"Missing channel roles: {sorted(missing)}")
+        if window_samples % gate_samples:
+            raise ValueError("window_samples must be a multiple of gate_samples")
+
+        self.detectors = [detectors[r] for r in ("A+", "A-", "B+", "B-")]
+        self.settings = [settings["A"], settings["B"]]
+        self.fields = list(fields)
+        self.gate_samples = gate_samples
+        self.gates_per_window = window_samples // gate_samples
+        self.window_samples = window_samples
+        self.threshold = threshold
+        self.setting_threshold = setting_threshold
+
+        self._previous: Dict[str, float] = {}
+        self._carry = np.empty((6 + len(self.fields), 0))
+        self._n_gates = 0
+        self._window = 0  # Index of the window being accumulated
+        self._counts = np.zeros((4, 4), dtype=np.int64)
+        self._field_sums = np.zeros(len(self.fields))
+
+    def _clicks(self, name: str, samples: np.ndarray) -> np.ndarray:
+        """Rising threshold crossings, continuing from the previous block."""
+        previous = np.empty(len(samples))
+        previous[0] = self._previous.get(name, samples[0])
+        previous[1:] = samples[:-1]
+        self._previous[name] = samples[-1]
+        return (samples > self.threshold) & (previous <= self.threshold)
+
+    def process(self, block: DataBlock) -> DataBlock:
+        n = len(block.channels[self.detectors[0]])
+        if n:
+            rows = [self._clicks(ch, np.asarray(block.channels[ch])) for ch in self.detectors]
+            rows += [
+                np.asarray(block.channels[ch]) > self.setting_threshold
+                for ch in self.settings
+            ]
+            rows += [np.asarray(block.channels[ch], dtype=float) for ch in self.fields]
+            data = np.concatenate([self._carry, np.vstack(rows)], axis=1)
+        else:
+            data = self._carry
+
+        g = self.gate_samples
+        n_gates = data.shape[1] // g
+        self._carry = data[:, n_gates * g :]
+        gates = data[:, : n_gates * g].reshape(len(data), n_gates, g)
+
+        clicked = gates[:4].any(axis=2)
+        a_event = clicked[0] != clicked[1]
+        b_event = clicked[2] != clicked[3]
+        coincident = a_event & b_event
+        setting = 2 * (gates[4, :, 0] > 0) + (gates[5, :, 0] > 0)
+        outcome = 2 * clicked[1] + clicked[3]  # pp, pm, mp, mm
+
+        # Window of each gate, relative to the window being accumulated
+        window = (self._n_gates + np.arange(n_gates)) // self.gates_per_window
+        relative = window - self._window
+        self._n_gates += n_gates
+        n_windows = self._n_gates // self.gates_per_window - self._window + 1
+
+        counts = np.bincount(
+            (relative * 16 + setting * 4 + outcome)[coincident],
+            minlength=n_windows * 16,
+        ).reshape(n_windows, 4, 4)
+        counts[0] += self._counts
+        field_sums = np.array(
+            [
+                np.bincount(relative, weights=gates[6 + i].sum(axis=1), minlength=n_windows)
+                for i in range(len(self.fields))
+            ]
+        ).reshape(len(self.fields), n_windows)
+        field_sums[:, 0] += self._field_sums
+
+        # All windows but the last are complete
+        first = self._window
+        self._window += n_windows - 1
+        self._counts = counts[-1]
+        self._field_sums = field_sums[:, -1]
+
+        complete = np.arange(first, self._window)
+        block.results[self.name] = {
+            "window_index": complete,
+            "times": (complete + 0.5) * self.window_samples / block.sample_rate,
+            "counts": counts[:-1],
+            "fields": {
+                name: field_sums[i, :-1] / self.window_samples
+                for i, name in enumerate(self.fields)
+            },
+        }
+        return block
+
+
+class CHSHEstimator(PipelineStage):
+    """CHSH parameter S(t) of each completed coincidence window."""
+
+    name = "chsh"
+
+    def __init__(self, analyzer=None):
+        """
+        Initialize estimator.
+
+        Args:
+            analyzer: CHSHAnalyzer to use (default: a new one)
+        """
+        if analyzer is None:
+            from simulations.analysis.experimental_analysis import CHSHAnalyzer
+
+            analyzer = CHSHAnalyzer()
+        self.analyzer = analyzer
+        self._history: Dict[str, List[np.ndarray]] = {
+            "times": [], "chsh_values": [], "chsh_errors": []
+        }
+
+    def process(self, block: DataBlock) -> DataBlock:
+        windows = block.results.get(CoincidenceCounter.name)
+        if windows is None or not len(windows["counts"]):
+            return block
+
+        analysis = self.analyzer.analyze_count_array(windows["counts"])
+        estimate = {
+            "times": windows["times"],
+            "chsh_values": analysis["chsh_values"],
+            "chsh_errors": analysis["chsh_errors"],
+            "correlations": analysis["correlations"],
+        }
+        for key, values in self._history.items():
+            values.append(estimate[key])
+        block.results[self.name] = estimate
+        return block
+
+    def finish(self) -> Dict[str, Any]:
+        return {
+            key: np.concatenate(values) if values else np.empty(0)
+            for key, values in self._history.items()
+        }
+
+
+class LiveCorrelation(PipelineStage):
+    """
+    Live CHSH / environmental-field statistics.
+
+    Feeds each block's S(t) windows and window-averaged fields to a
+    ``StreamingAnalyzer`` (running Bell test, rolling field variance and
+    online correlation). At the end of the stream the full series is also
+    run through ``EnvironmentalCorrelationAnalyzer``.
+    """
+
+    name = "correlation"
+
+    def __init__(self, window_size: int = 100, alpha: float = 0.001):
+        """
+        Initialize live correlation stage.
+
+        Args:
+            window_size: Rolling field variance window (in CHSH windows)
+            alpha: Significance level
+        """
+        from simulations.analysis.streaming_analysis import StreamingAnalyzer
+
+        # Import now rather than while the first block waits
+        import scipy.stats  # noqa: F401
+
+        self.window_size = window_size
+        self.analyzer = StreamingAnalyzer(window_size=window_size, alpha=alpha)
+        self._chsh: List[np.ndarray] = []
+        self._fields: Dict[str, List[np.ndarray]] = {}
+
+    def process(self, block: DataBlock) -> DataBlock:
+        from simulations.analysis.experimental_analysis import ExperimentalData
+
+        estimate = block.results.get(CHSHEstimator.name)
+        if estimate is None:
+            return block
+
+        fields = block.results[CoincidenceCounter.name]["fields"]
+        self._chsh.append(estimate["chsh_values"])
+        for name, values in fields.items():
+            self._fields.setdefault(name, []).append(values)
+
+        chunk = ExperimentalData(
+            timestamps=estimate["times"],
+            chsh_values=estimate["chsh_values"],
+            correlations={},
+            environmental_fields=fields,
+            detector_counts={},
+            analyzer_settings={},
+        )
+        block.results[self.name] = self.analyzer.update(chunk)
+        return block
+
+    def finish(self) -> Dict[str, Any]:
+        from simulations.analysis.experimental_analysis import (
+            EnvironmentalCorrelationAnalyzer,
+        )
+
+        chsh = np.concatenate(self._chsh) if self._chsh else np.empty(0)
+        correlations = {}
+        if len(chsh) >= max(self.window_size, 3):
+            analyzer = EnvironmentalCorrelationAnalyzer()
+            for name, values in self._fields.items():
+                variance = analyzer.calculate_field_variance(
+                    np.concatenate(values), self.window_size
+                )
+                correlations[name] = analyzer.correlation_analysis(chsh, variance)
+        return {
+            "summary": self.analyzer.summary(),
+            "field_correlations": correlations,
+        }
+
+
+def chsh_pipeline(
+    detectors: Dict[str, str],
+    settings: Dict[str, str],
+    window_samples: int,
+    gate_samples: int = 1,
+    fields: Sequence[str] = (),
+    decimation: int = 1,
+    cutoff: Optional[float] = None,
+    threshold: float = 0.5,
+    variance_window: int = 100,
+) -> List[PipelineStage]:
+    """
+    Standard stage chain from raw DAQ channels to live S(t) and correlations.
+
+    Args:
+        detectors, settings, window_samples, gate_samples, fields, threshold:
+            See :class:`CoincidenceCounter` (in samples after decimation)
+        decimation: Decimation factor applied first (1: none)
+        cutoff: Low-pass cutoff in Hz applied before decimation (None: none)
+        variance_window: Rolling field variance window (in CHSH windows)
+
+    Returns:
+        Pipeline stages in order
+    """
+    stages: List[PipelineStage] = []
+    if cutoff is not None:
+        stages.append(LowPassFilter(cutoff))
+    if decimation > 1:
+        stages.append(Decimator(decimation))
+    stages += [
+        CoincidenceCounter(
+            detectors, settings, window_samples, gate_samples,
+            threshold=threshold, fields=fields
+        ),
+        CHSHEstimator(),
+        LiveCorrelation(window_size=variance_window),
+    ]
+    return stages
+
+
+class ProcessingPipeline:
+    """Run pipeline stages in worker threads connected by bounded queues."""
+
+    def __init__(
+        self,
+        stages: Sequence[PipelineStage],
+        queue_size: int = 8,
+        on_result: Optional[Callable[[DataBlock], None]] = None,
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in processing order
+            queue_size: Capacity (in blocks) of the queue in front of each
+                stage; a full queue blocks the upstream stage
+            on_result: Called with every block leaving the last stage (from
+                the pipeline thread; keep it short)
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = list(stages)
+        self.on_result = on_result
+        self.logger = logging.getLogger("EQFE.hardware.pipeline")
+
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in self.stages]
+        self._threads: List[threading.Thread] = []
+        self._source: Optional[threading.Thread] = None
+        self._stop_source = threading.Event()
+        self._errors: List[BaseException] = []
+        self._sequence = 0
+        self._submitted = 0
+        self.readers: Dict[str, RingBufferReader] = {}
+
+        self.latest: Dict[str, Any] = {}
+        self.samples_lost = 0
+        self._stage_stats = [
+            {"blocks": 0, "busy_seconds": 0.0, "max_queue": 0}
+            for _ in self.stages
+        ]
+        self._latency = {"blocks": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+
+    def start(
+        self,
+        readers: Optional[Dict[str, RingBufferReader]] = None,
+        sample_rate: float = 1.0,
+        convert: Optional[Callable[[str, np.ndarray], np.ndarray]] = None,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """
+        Start the stage threads and, optionally, a reader feeding them.
+
+        Args:
+            readers: Channel -> ring buffer reader to feed from (None: feed
+                blocks with :meth:`submit`)
+            sample_rate: Sample rate of the readers' channels
+            convert: Conversion of raw samples, called as
+                ``convert(channel, samples)`` (e.g. ADC codes to volts)
+            poll_interval: Seconds between reads from the ring buffers
+        """
+        for i in range(len(self.stages)):
+            thread = threading.Thread(
+                target=self._run_stage, args=(i,),
+                name=f"pipeline-{self.stages[i].name}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        if readers:
+            self.readers = dict(readers)
+            self._stop_source.clear()
+            self._source = threading.Thread(
+                target=self._run_source,
+                args=(self.readers, sample_rate, convert, poll_interval),
+                name="pipeline-source", daemon=True
+            )
+            self._source.start()
+
+    def submit(self, block: DataBlock, timeout: Optional[float] = None) -> None:
+        """Queue a block for the first stage (blocks while the queue is full)."""
+        self._queues[0].put(block, timeout=timeout)
+        self._submitted += 1
+
+    def stop(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Read the remaining samples, drain every stage and stop the threads.
+
+        Returns:
+            Pipeline statistics (see :meth:`stats`)
+
+        Raises:
+            RuntimeError: If a stage failed
+        """
+        if self._source is not None:
+            self._stop_source.set()
+            self._source.join(timeout)
+            self._source = None
+        self._queues[0].put(_END)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if self._errors:
+            raise RuntimeError("Processing pipeline failed") from self._errors[0]
+        return self.stats()
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """Final results of each stage (after :meth:`stop`), by stage name."""
+        return {stage.name: stage.finish() for stage in self.stages}
+
+    def _run_source(self, readers, sample_rate, convert, poll_interval) -> None:
+        lost = {name: reader.samples_lost for name, reader in readers.items()}
+        while True:
+            stopping = self._stop_source.is_set()
+            # Channels are written one after another, so after an overrun
+            # each reader catches up to a different sample; move them all
+            # to the newest cursor so blocks hold simultaneous samples
+            for reader in readers.values():
+                reader.available()
+            start = max(reader.cursor for reader in readers.values())
+            for reader in readers.values():
+                reader.skip_to(start)
+            n = min(reader.ring.write_index - start for reader in readers.values())
+            if n > 0:
+                channels = {
+                    name: reader.read(max_samples=n)
+                    for name, reader in readers.items()
+                }
+                acquired_at = time.perf_counter()
+                for name, reader in readers.items():
+                    if reader.samples_lost != lost[name]:
+                        self.samples_lost += reader.samples_lost - lost[name]
+                        lost[name] = reader.samples_lost
+                        self.logger.warning(
+                            f"Channel {name}: pipeline fell behind acquisition; "
+                            f"{self.samples_lost} samples lost so far"
+                        )
+
+                stops = {reader.cursor for reader in readers.values()}
+                if stops != {start + n}:
+                    # Overrun during the read; realign on the next poll
+                    self.samples_lost += sum(len(c) for c in channels.values())
+                    continue
+                # Samples overwritten during the copy are dropped from the
+                # front, so every channel keeps the same newest samples
+                m = min(len(samples) for samples in channels.values())
+                for name in channels:
+                    self.samples_lost += len(channels[name]) - m
+                    channels[name] = channels[name][len(channels[name]) - m :]
+                    if convert is not None:
+                        channels[name] = convert(name, channels[name])
+
+                self.submit(
+                    DataBlock(
+                        sequence=self._sequence,
+                        first_sample=start + n - m,
+                        sample_rate=sample_rate,
+                        channels=channels,
+                        acquired_at=acquired_at,
+                    )
+                )
+                self._sequence += 1
+            if stopping:
+                break
+            self._stop_source.wait(poll_interval)
+
+    def _run_stage(self, i: int) -> None:
+        stage = self.stages[i]
+        inbox = self._queues[i]
+        outbox = self._queues[i + 1] if i + 1 < len(self.stages) else None
+        stats = self._stage_stats[i]
+        while True:
+            stats["max_queue"] = max(stats["max_queue"], inbox.qsize())
+            block = inbox.get()
+            if block is _END:
+                if outbox is not None:
+                    outbox.put(_END)
+                return
+            if self._errors:
+                continue  # Keep draining so upstream stages never block
+
+            start = time.perf_counter()
+            try:
+                block = stage.process(block)
+            except Exception as e:
+                self.logger.error(f"Pipeline stage {stage.name} failed: {e}")
+                self._errors.append(e)
+                continue
+            stats["blocks"] += 1
+            stats["busy_seconds"] += time.perf_counter() - start
+
+            if block is None:
+                continue
+            if outbox is not None:
+                outbox.put(block)
+            else:
+                self._complete(block)
+
+    def _complete(self, block: DataBlock) -> None:
+        latency = time.perf_counter() - block.acquired_at
+        self._latency["blocks"] += 1
+        self._latency["total"] += latency
+        self._latency["max"] = max(self._latency["max"], latency)
+        self._latency["last"] = latency
+        self.latest.update(block.results)
+        if self.on_result is not None:
+            self.on_result(block)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Pipeline statistics.
+
+        Returns:
+            Dictionary with per-stage 'stages' statistics (blocks, busy
+            time, current and maximum queue depth), 'blocks_submitted',
+            acquisition-to-result 'latency' (mean, max and last, seconds)
+            and 'samples_lost'
+        """
+        blocks = self._latency["blocks"]
+        return {
+            "stages": {
+                stage.name: dict(stats, queue=q.qsize())
+                for stage, stats, q in zip(
+                    self.stages, self._stage_stats, self._queues
+                )
+            },
+            "blocks_submitted": self._submitted,
+            "blocks_completed": blocks,
+            "latency": {
+                "mean": self._latency["total"] / blocks if blocks else 0.0,
+                "max": self._latency["max"],
+                "last": self._latency["last"],
+            },
+            "samples_lost": self.samples_lost,
+        }
@@ -10,27 +10,46 @@ Usage:
 
 Options:
     --data-file PATH        Path to experimental data file
+    --campaign PATTERN...   Analyze many runs (globs or manifest files) in parallel
+    --workers N             Worker processes for campaign mode
     --output-dir PATH       Output directory for results
     --config-file PATH      Analysis configuration file
     --validation-level STR  Validation strictness (basic/standard/strict)
     --generate-plots        Generate analysis plots
+    --plot-mode STR         Report plots: render now, defer, or skip
+    --render-plots DIR      Render deferred plots of an existing report
+    --time-range T0 T1      Analyze only samples with T0 <= timestamp < T1
+    --stream                Analyze CSV/JSON Lines incrementally in chunks
+    --follow                Keep reading a growing file (with --stream)
+    --live-report           Auto-refreshing HTML report (with --stream)
+    --report-name NAME      Update an existing report in place
     --export-results        Export results to multiple formats
+    --results-store PATH    Append results to a shared HDF5 results store
 """
 
 import argparse
+import dataclasses
+import glob
+import hashlib
+import html
+import io
 import json
 import os
 import sys
+import time
 from pathlib import Path
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+
+# pandas, matplotlib, seaborn and SciPy are imported where they are used so
+# that --help and light commands start quickly
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add package path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -51,6 +70,33 @@ try:
         ExperimentalData,
         comprehensive_analysis,
     )
+    from simulations.analysis.streaming_analysis import StreamingAnalyzer
+    from simulations.analysis.decimation import lttb_decimate, minmax_decimate
+    from simulations.analysis.result_cache import (
+        ResultCache,
+        cache_key,
+        code_version,
+        fingerprint_data,
+    )
+    from simulations.analysis.report_builder import (
+        ReportBuilder,
+        svg_histogram,
+        svg_line_chart,
+        svg_scatter,
+    )
+    from simulations.analysis.results_store import (
+        RESULTS_STORE_FILE,
+        append_results,
+    )
+    from simulations.analysis.data_formats import (
+        RAW_INDEX_NAME,
+        materialize,
+        read_arrow,
+        read_hdf5,
+        read_parquet,
+        read_raw_run,
+        select_time_range,
+    )
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print(
@@ -59,20 +105,41 @@ except ImportError as e:
     sys.exit(1)
 
 
+def _report_code_version() -> str:
+    """Hash of this script, so report-stage cache entries follow its code."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
 class ExperimentalDataLoader:
     """Load and validate experimental data from various formats."""
 
     def __init__(self):
-        self.supported_formats = [".csv", ".json", ".hdf5", ".npz"]
-
-    def load_data(self, file_path: str) -> ExperimentalData:
+        self.supported_formats = [
+            ".csv",
+            ".json",
+            ".jsonl",
+            ".hdf5",
+            ".h5",
+            ".npz",
+            ".parquet",
+            ".arrow",
+        ]
+
+    def load_data(
+        self,
+        file_path: str,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> ExperimentalData:
         """
         Load experimental data from file.
 
         Parameters:
         -----------
         file_path : str
-            Path to data file
+            Path to data file, or to a raw run directory/index
+        time_range : tuple, optional
+            (t_start, t_stop) in seconds; load only this part of the run.
+            HDF5, Parquet and Arrow files read just the requested range.
 
         Returns:
         --------
@@ -85,21 +152,48 @@ class ExperimentalDataLoader:
 
         suffix = file_path.suffix.lower()
 
+        if file_path.is_dir() or file_path.name == RAW_INDEX_NAME:
+            return read_raw_run(file_path, time_range=time_range)
+        elif suffix in (".hdf5", ".h5"):
+            return self._load_hdf5(file_path, time_range)
+        elif suffix == ".parquet":
+            return read_parquet(file_path, time_range=time_range)
+        elif suffix == ".arrow":
+            return read_arrow(file_path, time_range=time_range)
+
         if suffix == ".csv":
-            return self._load_csv(file_path)
+            data = self._load_csv(file_path)
         elif suffix == ".json":
-            return self._load_json(file_path)
-        elif suffix == ".hdf5":
-            return self._load_hdf5(file_path)
+            data = self._load_json(file_path)
+        elif suffix == ".jsonl":
+            import pandas as pd
+
+            data = self._frame_to_data(
+                pd.read_json(file_path, lines=True),
+                {"source_file": str(file_path), "format": "jsonl"},
+            )
         elif suffix == ".npz":
-            return self._load_npz(file_path)
+            data = self._load_npz(file_path)
         else:
             raise ValueError(f"Unsupported file format: {suffix}")
 
+        if time_range is not None:
+            data = select_time_range(data, time_range)
+        return data
+
     def _load_csv(self, file_path: Path) -> ExperimentalData:
         """Load data from CSV file."""
+        import pandas as pd
+
         df = pd.read_csv(file_path)
+        return self._frame_to_data(
+            df, {"source_file": str(file_path), "format": "csv"}
+        )
 
+    def _frame_to_data(
+        self, df: "pd.DataFrame", metadata: Dict
+    ) -> ExperimentalData:
+        """Map tabular columns (CSV / JSON Lines) onto ExperimentalData."""
         # Expected columns
         required_cols = ["timestamp", "chsh_value"]
         optional_cols = ["magnetic_field", "electric_field", "temperature"]
@@ -138,9 +232,108 @@ class ExperimentalDataLoader:
             environmental_fields=env_fields,
             detector_counts=detector_counts,
             analyzer_settings={},
-            metadata={"source_file": str(file_path), "format": "csv"},
+            metadata=metadata,
         )
 
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunk_size: int = 100_000,
+        follow: bool = False,
+        poll_interval: float = 1.0,
+        idle_timeout: Optional[float] = None,
+    ) -> Iterator[ExperimentalData]:
+        """
+        Stream experimental data from a CSV or JSON Lines file in chunks.
+
+        Only complete lines are parsed, so the file may still be growing.
+
+        Parameters:
+        -----------
+        file_path : str
+            Path to a .csv or .jsonl file (same columns/keys as CSV)
+        chunk_size : int
+            Maximum rows per chunk
+        follow : bool
+            Keep polling for appended rows after reaching end of file
+        poll_interval : float
+            Seconds between polls in follow mode
+        idle_timeout : float, optional
+            Stop following after this many seconds without new rows
+            (default: follow until interrupted)
+
+        Yields:
+        -------
+        ExperimentalData : Next chunk of rows
+        """
+        file_path = Path(file_path)
+        suffix = file_path.suffix.lower()
+        if suffix not in (".csv", ".jsonl"):
+            raise ValueError(f"Streaming not supported for format: {suffix}")
+
+        metadata = {"source_file": str(file_path), "format": suffix[1:]}
+        import pandas as pd
+
+        lines = self._tail_lines(file_path, follow, poll_interval, idle_timeout)
+
+        header = None
+        if suffix == ".csv":
+            header = next((line for line in lines if line is not None), None)
+            if header is None:
+                return
+        batch = []
+        for line in lines:
+            if line is not None:
+                batch.append(line)
+                if len(batch) < chunk_size:
+                    continue
+            # Full chunk, or no more rows available right now
+            if batch:
+                if header is not None:
+                    df = pd.read_csv(io.StringIO(header + "".join(batch)))
+                else:
+                    df = pd.DataFrame.from_records(
+                        [json.loads(row) for row in batch if row.strip()]
+                    )
+                yield self._frame_to_data(df, metadata)
+                batch = []
+
+    @staticmethod
+    def _tail_lines(
+        file_path: Path,
+        follow: bool,
+        poll_interval: float,
+        idle_timeout: Optional[float],
+    ) -> Iterator[Optional[str]]:
+        """
+        Yield complete lines; ``None`` marks "caught up with the writer".
+
+        A trailing partial line is held back until its newline arrives.
+        """
+        with open(file_path, "r") as f:
+            pending = ""
+            idle_since = time.monotonic()
+            while True:
+                line = f.readline()
+                if line:
+                    pending += line
+                    if pending.endswith("\n"):
+                        yield pending
+                        pending = ""
+                        idle_since = time.monotonic()
+                    continue
+
+                yield None
+                idle = time.monotonic() - idle_since
+                if not follow or (
+                    idle_timeout is not None and idle >= idle_timeout
+                ):
+                    if pending and not follow:
+                        yield pending
+                        yield None
+                    return
+                time.sleep(poll_interval)
+
     def _load_json(self, file_path: Path) -> ExperimentalData:
         """Load data from JSON file."""
         with open(file_path, "r") as f:
@@ -175,6 +368,14 @@ class ExperimentalDataLoader:
             metadata=data.get("metadata", {}),
         )
 
+    def _load_hdf5(
+        self,
+        file_path: Path,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> ExperimentalData:
+        """Load data from HDF5 file as lazy, chunk-backed views."""
+        return read_hdf5(file_path, time_range=time_range, lazy=True)
+
     def _load_npz(self, file_path: Path) -> ExperimentalData:
         """Load data from NumPy compressed file."""
         data = np.load(file_path, allow_pickle=True)
@@ -218,78 +419,146 @@ class ExperimentalDataLoader:
         )
 
 
-class AnalysisReportGenerator:
-    """Generate comprehensive analysis reports."""
-
-    def __init__(self, output_dir: str):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set plotting style
-        plt.style.use("seaborn-v0_8")
-        sns.set_palette("husl")
-
-    def generate_report(
-        self, data: ExperimentalData, results: Any, config: Dict
-    ) -> str:
-        """
-        Generate comprehensive analysis report.
-
-        Parameters:
-        -----------
-        data : ExperimentalData
-            Original experimental data
-        results : AnalysisResults
-            Analysis results
-        config : dict
-            Analysis configuration
-
-        Returns:
-        --------
-        str : Path to generated report
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_dir = self.output_dir / f"analysis_report_{timestamp}"
-        report_dir.mkdir(exist_ok=True)
-
-        # Generate plots
-        plot_files = self._generate_plots(data, results, report_dir)
-
-        # Generate statistical summary
-        stats_file = self._generate_statistics_summary(results, report_dir)
-
-        # Generate physics validation report
-        validation_file = self._generate_validation_report(results, report_dir)
-
-        # Generate main HTML report
-        html_file = self._generate_html_report(
-            data,
-            results,
-            config,
-            plot_files,
-            stats_file,
-            validation_file,
-            report_dir,
-        )
+PLOT_FILES = {
+    "timeseries": "timeseries_analysis.png",
+    "correlation": "correlation_analysis.png",
+    "distribution": "distribution_analysis.png",
+}
+PLOT_DATA_FILE = "plot_data.npz"
+
+
+def build_plot_payloads(
+    data: ExperimentalData, max_points: int = 5000
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Reduce experimental data to bounded-size arrays for each figure.
+
+    The CHSH trace keeps the per-bin min/max samples so spikes stay
+    visible; the field trace is LTTB-decimated to keep its shape. Scatter
+    plots use a uniform subsample. Histograms and correlation coefficients use the full
+    data; fit lines and Q-Q quantiles a bounded uniform subsample.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Experimental data
+    max_points : int
+        Approximate maximum points per plotted series
+
+    Returns:
+    --------
+    dict : Plot name -> named arrays consumed by :func:`render_plot`
+    """
+    from scipy import stats
+
+    timestamps = np.asarray(data.timestamps)
+    chsh = np.asarray(data.chsh_values)
+    field = data.environmental_fields.get("magnetic_field")
+    n_bins = max(max_points // 2, 1)
+
+    t_chsh, s_chsh = minmax_decimate(timestamps, chsh, n_bins)
+    timeseries = {"chsh_t": t_chsh, "chsh": s_chsh}
+    correlation = {}
+    distribution = {}
+
+    # Uniform subsample for scatter plots, fits and quantiles
+    stride = max(len(chsh) // max_points, 1)
+    sample_stride = max(len(chsh) // (50 * max_points), 1)
+
+    # CHSH histogram and Q-Q quantiles
+    counts, edges = np.histogram(chsh, bins=50)
+    distribution["chsh_hist"] = counts
+    distribution["chsh_edges"] = edges
+    n_quantiles = min(len(chsh), max_points)
+    positions = (np.arange(1, n_quantiles + 1) - 0.5) / n_quantiles
+    distribution["qq_theoretical"] = stats.norm.ppf(positions)
+    distribution["qq_ordered"] = np.quantile(chsh[::sample_stride], positions)
+
+    if field is not None:
+        field = np.asarray(field)
+        t_field, s_field = lttb_decimate(timestamps, field, max(max_points, 3))
+        timeseries["field_t"] = t_field
+        timeseries["field"] = s_field
+
+        field_variance = np.var(field) * np.ones_like(chsh)  # Simplified
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fit = np.polyfit(
+                field_variance[::sample_stride], chsh[::sample_stride], 1
+            )
+            corr_coef = np.corrcoef(field_variance, chsh)[0, 1]
+        correlation["x"] = field_variance[::stride]
+        correlation["y"] = chsh[::stride]
+        correlation["fit"] = fit
+        correlation["r"] = np.array(corr_coef)
 
-        # Export data
-        self._export_results(data, results, report_dir)
+        counts, edges = np.histogram(field, bins=50)
+        distribution["field_hist"] = counts
+        distribution["field_edges"] = edges
 
-        return str(html_file)
+    return {
+        "timeseries": timeseries,
+        "correlation": correlation,
+        "distribution": distribution,
+    }
 
-    def _generate_plots(
-        self, data: ExperimentalData, results: Any, output_dir: Path
-    ) -> Dict[str, str]:
-        """Generate analysis plots."""
-        plot_files = {}
 
-        # Time series plot
+def save_plot_payloads(
+    payloads: Dict[str, Dict[str, np.ndarray]], output_dir: Path
+) -> Path:
+    """Store plot payloads for deferred rendering (no pickle)."""
+    flat = {
+        f"{name}/{key}": np.asarray(values)
+        for name, payload in payloads.items()
+        for key, values in payload.items()
+    }
+    flat.update({f"{name}/": np.array([]) for name in payloads})
+    plot_data_file = Path(output_dir) / PLOT_DATA_FILE
+    np.savez(plot_data_file, **flat)
+    return plot_data_file
+
+
+def load_plot_payloads(report_dir: Path) -> Dict[str, Dict[str, np.ndarray]]:
+    """Load plot payloads written by :func:`save_plot_payloads`."""
+    payloads: Dict[str, Dict[str, np.ndarray]] = {}
+    with np.load(Path(report_dir) / PLOT_DATA_FILE, allow_pickle=False) as f:
+        for entry in f.files:
+            name, _, key = entry.partition("/")
+            payloads.setdefault(name, {})
+            if key:
+                payloads[name][key] = f[entry]
+    return payloads
+
+
+def render_plot(
+    name: str, payload: Dict[str, np.ndarray], output_dir: str, dpi: int = 300
+) -> str:
+    """
+    Render one figure from its payload to PNG.
+
+    Safe to run in a worker process: it only uses the Agg backend.
+
+    Returns:
+    --------
+    str : Written image path
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.switch_backend("Agg")
+    plt.style.use("seaborn-v0_8")
+    sns.set_palette("husl")
+
+    if name == "timeseries":
         plt.figure(figsize=(12, 8))
 
         plt.subplot(3, 1, 1)
         plt.plot(
-            data.timestamps,
-            data.chsh_values,
+            payload["chsh_t"],
+            payload["chsh"],
             "b-",
             alpha=0.7,
             label="CHSH Parameter",
@@ -306,57 +575,30 @@ class AnalysisReportGenerator:
         plt.title("CHSH Parameter Time Evolution")
 
         # Environmental field
-        if "magnetic_field" in data.environmental_fields:
+        if "field" in payload:
             plt.subplot(3, 1, 2)
-            field_data = data.environmental_fields["magnetic_field"]
-            plt.plot(data.timestamps, field_data, "orange", alpha=0.7)
+            plt.plot(payload["field_t"], payload["field"], "orange", alpha=0.7)
             plt.ylabel("Magnetic Field (nT)")
             plt.title("Environmental Magnetic Field")
 
-        # Field variance
-        if hasattr(results, "field_variance"):
-            plt.subplot(3, 1, 3)
-            plt.plot(
-                data.timestamps, results.field_variance, "purple", alpha=0.7
-            )
-            plt.ylabel("Field Variance")
-            plt.xlabel("Time (s)")
-            plt.title("Environmental Field Variance")
-
         plt.tight_layout()
-        timeseries_file = output_dir / "timeseries_analysis.png"
-        plt.savefig(timeseries_file, dpi=300, bbox_inches="tight")
-        plt.close()
-        plot_files["timeseries"] = str(timeseries_file)
 
-        # Correlation analysis plot
+    elif name == "correlation":
         plt.figure(figsize=(10, 6))
 
-        if "magnetic_field" in data.environmental_fields:
-            field_data = data.environmental_fields["magnetic_field"]
-            field_variance = np.var(field_data) * np.ones_like(
-                data.chsh_values
-            )  # Simplified
-
-            plt.scatter(field_variance, data.chsh_values, alpha=0.6, s=20)
+        if "x" in payload:
+            x = payload["x"]
+            plt.scatter(x, payload["y"], alpha=0.6, s=20)
 
             # Fit line
-            z = np.polyfit(field_variance, data.chsh_values, 1)
-            p = np.poly1d(z)
-            plt.plot(
-                field_variance,
-                p(field_variance),
-                "r--",
-                alpha=0.8,
-                linewidth=2,
-            )
+            p = np.poly1d(payload["fit"])
+            plt.plot(x, p(x), "r--", alpha=0.8, linewidth=2)
 
             # Correlation coefficient
-            corr_coef = np.corrcoef(field_variance, data.chsh_values)[0, 1]
             plt.text(
                 0.05,
                 0.95,
-                f"r = {corr_coef:.3f}",
+                f"r = {float(payload['r']):.3f}",
                 transform=plt.gca().transAxes,
                 bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
             )
@@ -365,18 +607,15 @@ class AnalysisReportGenerator:
         plt.ylabel("CHSH Parameter S")
         plt.title("CHSH vs Environmental Field Correlation")
 
-        correlation_file = output_dir / "correlation_analysis.png"
-        plt.savefig(correlation_file, dpi=300, bbox_inches="tight")
-        plt.close()
-        plot_files["correlation"] = str(correlation_file)
-
-        # Distribution analysis
+    elif name == "distribution":
         plt.figure(figsize=(12, 4))
 
         plt.subplot(1, 3, 1)
+        edges = payload["chsh_edges"]
         plt.hist(
-            data.chsh_values,
-            bins=50,
+            edges[:-1],
+            bins=edges,
+            weights=payload["chsh_hist"],
             alpha=0.7,
             density=True,
             edgecolor="black",
@@ -391,11 +630,12 @@ class AnalysisReportGenerator:
         plt.legend()
 
         plt.subplot(1, 3, 2)
-        if "magnetic_field" in data.environmental_fields:
-            field_data = data.environmental_fields["magnetic_field"]
+        if "field_hist" in payload:
+            edges = payload["field_edges"]
             plt.hist(
-                field_data,
-                bins=50,
+                edges[:-1],
+                bins=edges,
+                weights=payload["field_hist"],
                 alpha=0.7,
                 density=True,
                 edgecolor="black",
@@ -406,17 +646,211 @@ class AnalysisReportGenerator:
             plt.title("Field Distribution")
 
         plt.subplot(1, 3, 3)
-        stats.probplot(data.chsh_values, dist="norm", plot=plt)
+        theoretical = payload["qq_theoretical"]
+        ordered = payload["qq_ordered"]
+        slope, intercept = np.polyfit(theoretical, ordered, 1)
+        plt.plot(theoretical, ordered, "bo")
+        plt.plot(theoretical, slope * theoretical + intercept, "r-")
+        plt.xlabel("Theoretical quantiles")
+        plt.ylabel("Ordered Values")
         plt.title("CHSH Normal Q-Q Plot")
 
         plt.tight_layout()
-        distribution_file = output_dir / "distribution_analysis.png"
-        plt.savefig(distribution_file, dpi=300, bbox_inches="tight")
-        plt.close()
-        plot_files["distribution"] = str(distribution_file)
 
+    else:
+        raise ValueError(f"Unknown plot: {name}")
+
+    plot_file = Path(output_dir) / PLOT_FILES[name]
+    plt.savefig(plot_file, dpi=dpi, bbox_inches="tight")
+    plt.close()
+    return str(plot_file)
+
+
+def render_plot_payloads(
+    payloads: Dict[str, Dict[str, np.ndarray]],
+    output_dir: Path,
+    dpi: int = 300,
+    parallel: bool = True,
+) -> Dict[str, str]:
+    """
+    Render all figures, in parallel worker processes when possible.
+
+    Returns:
+    --------
+    dict : Plot name -> image path
+    """
+    workers = min(len(payloads), os.cpu_count() or 1)
+    if parallel and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    name: pool.submit(
+                        render_plot, name, payload, str(output_dir), dpi
+                    )
+                    for name, payload in payloads.items()
+                }
+                return {name: f.result() for name, f in futures.items()}
+        except (OSError, BrokenProcessPool) as e:
+            warnings.warn(f"Parallel plotting unavailable ({e}); rendering serially")
+
+    return {
+        name: render_plot(name, payload, str(output_dir), dpi)
+        for name, payload in payloads.items()
+    }
+
+
+class AnalysisReportGenerator:
+    """Generate comprehensive analysis reports."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        cache: Optional[ResultCache] = None,
+        results_store: Optional[str] = None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = cache
+        # Shared HDF5 store runs are appended to (default: one per report)
+        self.results_store = Path(results_store) if results_store else None
+
+    def generate_report(
+        self,
+        data: ExperimentalData,
+        results: Any,
+        config: Dict,
+        report_name: Optional[str] = None,
+    ) -> str:
+        """
+        Generate comprehensive analysis report.
+
+        Parameters:
+        -----------
+        data : ExperimentalData
+            Original experimental data
+        results : AnalysisResults
+            Analysis results
+        config : dict
+            Analysis configuration
+        report_name : str, optional
+            Report directory name. Reusing a name updates that report in
+            place, re-rendering only the sections whose inputs changed
+            (default: a new timestamped directory)
+
+        Returns:
+        --------
+        str : Path to generated report
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_dir = self.output_dir / (
+            report_name or f"analysis_report_{timestamp}"
+        )
+        report_dir.mkdir(exist_ok=True)
+
+        # Generate plots
+        plot_files = self._generate_cached_plots(
+            data, results, config, report_dir
+        )
+
+        # Generate statistical summary
+        stats_file = self._generate_statistics_summary(results, report_dir)
+
+        # Generate physics validation report
+        validation_file = self._generate_validation_report(results, report_dir)
+
+        # Generate main HTML report
+        html_file = self._generate_html_report(
+            data,
+            results,
+            config,
+            plot_files,
+            stats_file,
+            validation_file,
+            report_dir,
+        )
+
+        # Export data
+        self._export_results(data, results, report_dir)
+
+        return str(html_file)
+
+    def _generate_cached_plots(
+        self,
+        data: ExperimentalData,
+        results: Any,
+        config: Dict,
+        output_dir: Path,
+    ) -> Dict[str, str]:
+        """Generate plots, reusing cached images for unchanged data/config."""
+        plot_config = config.get("plotting", {})
+        if self.cache is None or plot_config.get("mode", "render") != "render":
+            return self._generate_plots(data, results, output_dir, plot_config)
+
+        key = cache_key(
+            code_version(),
+            _report_code_version(),
+            fingerprint_data(data),
+            "plots",
+            plot_config,
+        )
+        images = self.cache.get(key)
+        if images is None:
+            plot_files = self._generate_plots(
+                data, results, output_dir, plot_config
+            )
+            self.cache.put(
+                key,
+                {
+                    name: [Path(path).name, Path(path).read_bytes()]
+                    for name, path in plot_files.items()
+                },
+            )
+            return plot_files
+
+        plot_files = {}
+        for name, (file_name, image) in images.items():
+            plot_file = output_dir / file_name
+            plot_file.write_bytes(image)
+            plot_files[name] = str(plot_file)
         return plot_files
 
+    def _generate_plots(
+        self,
+        data: ExperimentalData,
+        results: Any,
+        output_dir: Path,
+        plot_config: Optional[Dict] = None,
+    ) -> Dict[str, str]:
+        """
+        Generate analysis plots.
+
+        Series are decimated to ``max_points`` before plotting, so render
+        time and image size do not grow with run length. Figures are
+        rendered in parallel worker processes (Agg backend) unless
+        ``parallel`` is disabled. ``mode`` 'defer' only writes the plot
+        data (render later with --render-plots); 'skip' produces no plots.
+        """
+        plot_config = plot_config or {}
+        mode = plot_config.get("mode", "render")
+        if mode == "skip":
+            return {}
+
+        payloads = build_plot_payloads(
+            data, plot_config.get("max_points", 5000)
+        )
+        if mode == "defer":
+            save_plot_payloads(payloads, output_dir)
+            return {
+                name: str(output_dir / PLOT_FILES[name]) for name in payloads
+            }
+
+        return render_plot_payloads(
+            payloads,
+            output_dir,
+            dpi=plot_config.get("plot_dpi", 300),
+            parallel=plot_config.get("parallel", True),
+        )
+
     def _generate_statistics_summary(
         self, results: Any, output_dir: Path
     ) -> str:
@@ -521,95 +955,162 @@ class AnalysisReportGenerator:
         validation_file,
         output_dir,
     ) -> str:
-        """Generate main HTML report."""
-        html_file = output_dir / "analysis_report.html"
+        """
+        Generate main HTML report.
 
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Environmental Quantum Field Effects - Analysis Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ text-align: center; color: #2c3e50; }}
-                .section {{ margin: 30px 0; }}
-                .plot {{ text-align: center; margin: 20px 0; }}
-                .plot img {{ max-width: 100%; height: auto; }}
-                .summary {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; }}
-                .validation-pass {{ color: #27ae60; }}
-                .validation-fail {{ color: #e74c3c; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Environmental Quantum Field Effects</h1>
-                <h2>Experimental Data Analysis Report</h2>
-                <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-            </div>
-            
-            <div class="section">
-                <h3>Data Summary</h3>
+        Sections are built with :class:`ReportBuilder`, so regenerating a
+        report in the same directory only re-renders sections whose inputs
+        changed. Figures are embedded as inline SVG from decimated data;
+        rendered PNGs are linked as full-resolution versions.
+        """
+        builder = ReportBuilder(output_dir)
+        data_key = fingerprint_data(data)
+        payloads: Dict[str, Dict[str, np.ndarray]] = {}
+
+        def _payloads():
+            if not payloads:
+                payloads.update(build_plot_payloads(data, max_points=1000))
+            return payloads
+
+        def _figure(name, svg):
+            link = ""
+            if name in plot_files and Path(plot_files[name]).exists():
+                file_name = Path(plot_files[name]).name
+                link = f'<p><a href="{file_name}">Full-resolution figure</a></p>'
+            return f'<div class="plot">{svg}</div>{link}'
+
+        chsh_lines = {
+            "Classical bound": (2.0, "#d62728"),
+            "Tsirelson bound": (2 * np.sqrt(2), "#2ca02c"),
+        }
+
+        def _summary():
+            return f"""
                 <div class="summary">
                     <p><strong>Data Points:</strong> {len(data.timestamps)}</p>
                     <p><strong>Time Range:</strong> {data.timestamps[0]:.1f} - {data.timestamps[-1]:.1f} seconds</p>
                     <p><strong>Mean CHSH:</strong> {np.mean(data.chsh_values):.4f}</p>
                     <p><strong>CHSH Range:</strong> {np.min(data.chsh_values):.4f} - {np.max(data.chsh_values):.4f}</p>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>Physics Validation</h3>
+                </div>"""
+
+        validation = results.validation_results
+
+        def _validation():
+            status_class = (
+                "validation-pass" if validation.is_valid else "validation-fail"
+            )
+            return f"""
                 <div class="summary">
-                    <p class="{'validation-pass' if results.validation_results.is_valid else 'validation-fail'}">
-                        <strong>Status:</strong> {'PASSED' if results.validation_results.is_valid else 'FAILED'}
+                    <p class="{status_class}">
+                        <strong>Status:</strong> {'PASSED' if validation.is_valid else 'FAILED'}
                     </p>
                     <p><a href="physics_validation.txt">Detailed Validation Report</a></p>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>Time Series Analysis</h3>
-                <div class="plot">
-                    <img src="{Path(plot_files['timeseries']).name}" alt="Time Series Analysis">
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>Environmental Correlation</h3>
-                <div class="plot">
-                    <img src="{Path(plot_files['correlation']).name}" alt="Correlation Analysis">
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>Statistical Distributions</h3>
-                <div class="plot">
-                    <img src="{Path(plot_files['distribution']).name}" alt="Distribution Analysis">
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>Additional Resources</h3>
+                </div>"""
+
+        def _timeseries():
+            payload = _payloads()["timeseries"]
+            body = svg_line_chart(
+                {"CHSH": (payload["chsh_t"], payload["chsh"])},
+                reference_lines=chsh_lines,
+                x_label="Time (s)",
+                y_label="CHSH Parameter S",
+            )
+            if "field" in payload:
+                body += svg_line_chart(
+                    {"Magnetic field": (payload["field_t"], payload["field"])},
+                    x_label="Time (s)",
+                    y_label="Magnetic Field (nT)",
+                    height=180,
+                )
+            return _figure("timeseries", body)
+
+        def _correlation():
+            payload = _payloads()["correlation"]
+            if "x" not in payload:
+                return "<p>No environmental field data.</p>"
+            body = svg_scatter(
+                payload["x"],
+                payload["y"],
+                fit=payload["fit"],
+                x_label="Environmental Field Variance",
+                y_label="CHSH Parameter S",
+            )
+            return _figure(
+                "correlation", body + f"<p>r = {float(payload['r']):.4f}</p>"
+            )
+
+        def _distribution():
+            payload = _payloads()["distribution"]
+            body = svg_histogram(
+                payload["chsh_hist"],
+                payload["chsh_edges"],
+                reference_lines=chsh_lines,
+                x_label="CHSH Parameter S",
+            )
+            if "field_hist" in payload:
+                body += svg_histogram(
+                    payload["field_hist"],
+                    payload["field_edges"],
+                    x_label="Magnetic Field (nT)",
+                )
+            return _figure("distribution", body)
+
+        if self.results_store is None:
+            store_link = (
+                f'<a href="{RESULTS_STORE_FILE}">Full Results (HDF5)</a>'
+            )
+        else:
+            store_link = html.escape(
+                f"Full Results (HDF5): run {output_dir.name} "
+                f"in {self.results_store}"
+            )
+
+        def _resources():
+            return f"""
                 <ul>
                     <li><a href="statistical_summary.txt">Statistical Summary</a></li>
                     <li><a href="results_data.json">Raw Results (JSON)</a></li>
-                    <li><a href="results_data.npz">Raw Results (NumPy)</a></li>
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
-
-        with open(html_file, "w") as f:
-            f.write(html_content)
+                    <li>{store_link}</li>
+                </ul>"""
+
+        builder.section("data_summary", "Data Summary", data_key, _summary)
+        builder.section(
+            "validation",
+            "Physics Validation",
+            dataclasses.asdict(validation),
+            _validation,
+        )
+        for name, title, render in (
+            ("timeseries", "Time Series Analysis", _timeseries),
+            ("correlation", "Environmental Correlation", _correlation),
+            ("distribution", "Statistical Distributions", _distribution),
+        ):
+            png = plot_files.get(name)
+            if png is not None and not Path(png).exists():
+                png = None  # Deferred and not rendered yet
+            builder.section(
+                name,
+                title,
+                [data_key, Path(png).name if png else None],
+                render,
+            )
+        builder.section(
+            "resources", "Additional Resources", store_link, _resources
+        )
 
-        return str(html_file)
+        return str(builder.write())
 
     def _export_results(
         self, data: ExperimentalData, results: Any, output_dir: Path
-    ):
-        """Export results in multiple formats."""
-        # JSON export
+    ) -> Optional[Path]:
+        """
+        Export results: a JSON summary of the scalar results, and the full
+        results with their arrays appended to the HDF5 results store.
+
+        Returns:
+        --------
+        Path or None : Results store written to (None without h5py)
+        """
         results_dict = {
             "metadata": {
                 "analysis_timestamp": datetime.now().isoformat(),
@@ -629,36 +1130,35 @@ class AnalysisReportGenerator:
 
         # Add results if available
         if hasattr(results, "correlation_coefficients"):
-            results_dict["correlations"] = results.correlation_coefficients
+            results_dict["correlations"] = {
+                k: float(v) for k, v in results.correlation_coefficients.items()
+            }
 
         if hasattr(results, "amplification_params"):
-            # Convert numpy types to Python types for JSON serialization
-            amp_params = {}
-            for k, v in results.amplification_params.items():
-                if isinstance(v, (np.integer, np.floating)):
-                    amp_params[k] = float(v)
-                elif isinstance(v, bool):
-                    amp_params[k] = bool(v)
-                else:
-                    amp_params[k] = v
-            results_dict["amplification_parameters"] = amp_params
+            # Scalars only; arrays (e.g. fitted values) go to the store
+            results_dict["amplification_parameters"] = {
+                k: v.item() if isinstance(v, np.generic) else v
+                for k, v in results.amplification_params.items()
+                if np.ndim(v) == 0
+            }
 
         json_file = output_dir / "results_data.json"
         with open(json_file, "w") as f:
             json.dump(results_dict, f, indent=2)
 
-        # NumPy export
-        npz_data = {
-            "timestamps": data.timestamps,
-            "chsh_values": data.chsh_values,
-            "metadata": results_dict["metadata"],
-        }
-
-        if data.environmental_fields:
-            npz_data["environmental_fields"] = data.environmental_fields
-
-        npz_file = output_dir / "results_data.npz"
-        np.savez_compressed(npz_file, **npz_data)
+        store_path = self.results_store or output_dir / RESULTS_STORE_FILE
+        try:
+            append_results(
+                store_path,
+                data,
+                results,
+                run_id=output_dir.name,
+                replace=True,
+            )
+        except ImportError as e:
+            warnings.warn(f"Results store not written: {e}")
+            return None
+        return Path(store_path)
 
 
 def create_analysis_config() -> Dict[str, Any]:
@@ -687,18 +1187,564 @@ def create_analysis_config() -> Dict[str, Any]:
             "generate_plots": True,
             "plot_format": "png",
             "plot_dpi": 300,
+            "mode": "render",
+            "max_points": 5000,
+            "parallel": True,
+        },
+    }
+
+
+class LiveReport:
+    """
+    Incrementally refreshed HTML report for a streaming analysis.
+
+    Keeps a bounded, min/max-decimated CHSH trace and rewrites at most once
+    per refresh interval; sections whose inputs did not change since the
+    last refresh (e.g. drift events) are reused.
+    """
+
+    def __init__(
+        self,
+        report_dir: Path,
+        refresh_interval: float = 5.0,
+        max_points: int = 2000,
+    ):
+        self.builder = ReportBuilder(
+            report_dir,
+            title="Live Streaming Analysis",
+            refresh_interval=refresh_interval,
+        )
+        self.refresh_interval = refresh_interval
+        self.max_points = max_points
+        self._trace_t = np.empty(0)
+        self._trace_s = np.empty(0)
+        self._last_write = -np.inf
+
+    def _extend_trace(self, chunk: ExperimentalData) -> None:
+        t, s = minmax_decimate(
+            np.asarray(chunk.timestamps, dtype=float),
+            np.asarray(chunk.chsh_values, dtype=float),
+            max(self.max_points // 8, 1),
+        )
+        self._trace_t = np.concatenate([self._trace_t, t])
+        self._trace_s = np.concatenate([self._trace_s, s])
+        if len(self._trace_t) > 2 * self.max_points:
+            self._trace_t, self._trace_s = minmax_decimate(
+                self._trace_t, self._trace_s, self.max_points // 2
+            )
+
+    def update(
+        self,
+        chunk: Optional[ExperimentalData],
+        summary: Dict[str, Any],
+        final: bool = False,
+    ) -> bool:
+        """
+        Add a chunk and refresh the page if the refresh interval elapsed.
+
+        Returns:
+        --------
+        bool : True if the page was rewritten
+        """
+        if chunk is not None and len(chunk.timestamps):
+            self._extend_trace(chunk)
+        now = time.perf_counter()
+        if not final and now - self._last_write < self.refresh_interval:
+            return False
+
+        bell = summary["bell_test"]
+        n_samples = summary["n_samples"]
+        self.builder.section(
+            "stream_summary",
+            "Running Summary",
+            n_samples,
+            lambda: f"""
+                <div class="summary">
+                    <p><strong>Samples:</strong> {n_samples} in {summary['n_chunks']} chunks</p>
+                    <p><strong>Mean CHSH:</strong> {bell['mean_chsh']:.4f} ± {bell['std_chsh']:.4f}</p>
+                    <p><strong>Classical violations:</strong> {bell['classical_fraction']:.1%} (p = {bell['classical_p_value']:.2e})</p>
+                    <p><strong>Tsirelson violations:</strong> {bell['tsirelson_violations']}</p>
+                </div>""",
+        )
+        self.builder.section(
+            "chsh_trace",
+            "CHSH Time Evolution",
+            n_samples,
+            lambda: '<div class="plot">'
+            + svg_line_chart(
+                {"CHSH": (self._trace_t, self._trace_s)},
+                reference_lines={
+                    "Classical bound": (2.0, "#d62728"),
+                    "Tsirelson bound": (2 * np.sqrt(2), "#2ca02c"),
+                },
+                x_label="Time (s)",
+                y_label="CHSH Parameter S",
+                max_points=self.max_points,
+            )
+            + "</div>",
+        )
+        correlations = summary["field_correlations"]
+        self.builder.section(
+            "field_correlations",
+            "Environmental Field Correlations",
+            {
+                name: [c["n_samples"], round(c["correlation_coefficient"], 6)]
+                for name, c in correlations.items()
+            },
+            lambda: "<ul>"
+            + "".join(
+                f"<li>{html.escape(name)}: r = {c['correlation_coefficient']:+.4f} "
+                f"(p = {c['p_value']:.2e}, n = {c['n_samples']})</li>"
+                for name, c in correlations.items()
+            )
+            + "</ul>",
+        )
+        events = summary["drift_events"]
+        self.builder.section(
+            "drift_events",
+            "Drift Events",
+            len(events),
+            lambda: "<ul>"
+            + "".join(f"<li>{html.escape(e.message)}</li>" for e in events)
+            + "</ul>"
+            if events
+            else "<p>None detected.</p>",
+        )
+
+        if final:
+            self.builder.finalize()
+        else:
+            self.builder.write()
+        self._last_write = now
+        return True
+
+
+def run_streaming_analysis(
+    loader: ExperimentalDataLoader, args: argparse.Namespace
+) -> Dict[str, Any]:
+    """
+    Analyze a CSV / JSON Lines file chunk by chunk, printing partial results.
+
+    Parameters:
+    -----------
+    loader : ExperimentalDataLoader
+        Data loader
+    args : argparse.Namespace
+        Parsed command line (data_file, chunk_size, follow, idle_timeout,
+        live_report, refresh_interval, output_dir)
+
+    Returns:
+    --------
+    dict : Final streaming summary
+    """
+    analyzer = StreamingAnalyzer()
+    summary = analyzer.summary()
+    start = time.perf_counter()
+
+    live = None
+    if getattr(args, "live_report", False):
+        live = LiveReport(
+            Path(args.output_dir) / "live_report", args.refresh_interval
+        )
+        print(f"Live report: {live.builder.html_file}")
+
+    for chunk in loader.iter_chunks(
+        args.data_file,
+        chunk_size=args.chunk_size,
+        follow=args.follow,
+        idle_timeout=args.idle_timeout,
+    ):
+        n_events = len(analyzer.events)
+        summary = analyzer.update(chunk)
+        bell = summary["bell_test"]
+        rate = summary["n_samples"] / max(time.perf_counter() - start, 1e-9)
+
+        print(
+            f"[{summary['n_samples']:>10d} samples, {rate:,.0f}/s] "
+            f"mean CHSH {bell['mean_chsh']:.4f} ± {bell['std_chsh']:.4f}, "
+            f"classical violations {bell['classical_fraction']:.1%}"
+        )
+        for name, corr in summary["field_correlations"].items():
+            print(
+                f"    {name}: r = {corr['correlation_coefficient']:+.4f} "
+                f"(p = {corr['p_value']:.2e}, "
+                f"variance {summary['field_variance'][name]:.3e})"
+            )
+        for event in summary["drift_events"][n_events:]:
+            print(f"    ⚠ {event.message}")
+        if live is not None:
+            live.update(chunk, summary)
+
+    print("\nStreaming analysis complete:")
+    print(f"  Samples analyzed: {summary['n_samples']}")
+    print(f"  Chunks: {summary['n_chunks']}")
+    if summary["n_samples"]:
+        bell = summary["bell_test"]
+        print(f"  Mean CHSH: {bell['mean_chsh']:.4f}")
+        print(f"  Classical p-value: {bell['classical_p_value']:.3e}")
+        print(f"  Drift events: {len(summary['drift_events'])}")
+    if live is not None:
+        live.update(None, summary, final=True)
+        print(f"  Report: {live.builder.html_file}")
+
+    return summary
+
+
+def resolve_campaign_files(patterns: List[str]) -> List[Path]:
+    """
+    Expand campaign inputs into a sorted, de-duplicated list of data files.
+
+    Parameters:
+    -----------
+    patterns : list of str
+        Glob patterns, data files, or manifests. A manifest is a .txt file
+        with one path/glob per line ('#' comments allowed) or a
+        'manifest.json' / '*.manifest.json' file holding a list (or
+        {"files": [...]}); its entries are resolved
+        relative to the manifest's directory.
+
+    Returns:
+    --------
+    list : Data file paths
+    """
+    files = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.suffix == ".txt" and path.is_file():
+            entries = [
+                line.strip()
+                for line in path.read_text().splitlines()
+                if line.strip() and not line.strip().startswith("#")
+            ]
+        elif path.suffix == ".json" and path.is_file() and (
+            path.name.endswith(".manifest.json") or path.stem == "manifest"
+        ):
+            manifest = json.loads(path.read_text())
+            entries = (
+                manifest["files"] if isinstance(manifest, dict) else manifest
+            )
+        else:
+            files.extend(Path(p) for p in glob.glob(pattern, recursive=True))
+            continue
+
+        for entry in entries:
+            entry_path = Path(entry)
+            if not entry_path.is_absolute():
+                entry_path = path.parent / entry_path
+            files.extend(
+                Path(p) for p in glob.glob(str(entry_path), recursive=True)
+            )
+
+    return sorted({f.resolve() for f in files})
+
+
+def analyze_run_summary(
+    file_path: str,
+    time_range: Optional[Tuple[float, float]] = None,
+    config: Optional[Dict] = None,
+) -> Dict[str, Any]:
+    """
+    Analyze one run and reduce it to JSON-serializable campaign statistics.
+
+    Runs in campaign worker processes.
+
+    Parameters:
+    -----------
+    file_path : str
+        Data file
+    time_range : tuple, optional
+        (t_start, t_stop) selection applied to the run
+    config : dict, optional
+        Analysis configuration
+
+    Returns:
+    --------
+    dict : Sample count, CHSH moments and violation counts, field
+    correlation, validation status and scalar amplification parameters
+    """
+    data = materialize(
+        ExperimentalDataLoader().load_data(file_path, time_range=time_range)
+    )
+    results = comprehensive_analysis(data, config=config)
+
+    chsh = np.asarray(data.chsh_values, dtype=float)
+    mean_chsh = float(np.mean(chsh))
+    correlation = results.statistical_tests["correlation_test"]
+
+    return {
+        "file": str(file_path),
+        "n_samples": int(len(chsh)),
+        "mean_chsh": mean_chsh,
+        "sum_squares": float(np.sum((chsh - mean_chsh) ** 2)),
+        "classical_violations": int(np.sum(chsh > 2.0)),
+        "tsirelson_violations": int(np.sum(chsh > 2 * np.sqrt(2))),
+        "field_correlation": float(correlation["correlation_coefficient"]),
+        "field_correlation_p": float(correlation["p_value"]),
+        "validation_passed": bool(results.validation_results.is_valid),
+        "amplification_params": {
+            k: float(v)
+            for k, v in results.amplification_params.items()
+            if np.isscalar(v) and not isinstance(v, (str, bool))
         },
     }
 
 
+class CampaignAnalyzer:
+    """Analyze a measurement campaign (many runs) in parallel."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        config: Dict,
+        workers: Optional[int] = None,
+        use_cache: bool = True,
+    ):
+        """
+        Initialize campaign analyzer.
+
+        Parameters:
+        -----------
+        output_dir : str
+            Directory for the combined report and the per-run cache
+        config : dict
+            Analysis configuration (part of the cache key)
+        workers : int, optional
+            Worker processes (default: CPU count)
+        use_cache : bool
+            Reuse per-run results for unchanged files
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = self.output_dir / ".campaign_cache"
+        self.config = config
+        self.workers = workers
+        self.use_cache = use_cache
+        self.config_hash = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def run(
+        self,
+        files: List[Path],
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze all runs and aggregate cross-run statistics.
+
+        Parameters:
+        -----------
+        files : list of Path
+            Data files
+        time_range : tuple, optional
+            (t_start, t_stop) selection applied to every run
+
+        Returns:
+        --------
+        dict : 'runs' (per-run summaries), 'failed' (file -> error),
+        'pooled_bell_test', 'field_correlation_meta' and 'n_cached'
+        """
+        runs: Dict[str, Dict] = {}
+        failed: Dict[str, str] = {}
+        pending = []
+        for path in files:
+            cached = self._load_cached(path, time_range)
+            if cached is not None:
+                runs[str(path)] = cached
+            else:
+                pending.append(path)
+        n_cached = len(runs)
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(
+                        analyze_run_summary, str(path), time_range, self.config
+                    ): path
+                    for path in pending
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    path = futures[future]
+                    try:
+                        summary = future.result()
+                    except Exception as e:
+                        failed[str(path)] = str(e)
+                        print(f"  [{i}/{len(pending)}] ✗ {path.name}: {e}")
+                        continue
+                    runs[str(path)] = summary
+                    self._store_cached(path, time_range, summary)
+                    print(
+                        f"  [{i}/{len(pending)}] ✓ {path.name}: "
+                        f"mean CHSH {summary['mean_chsh']:.4f}"
+                    )
+
+        ordered = [runs[str(p)] for p in files if str(p) in runs]
+        return {
+            "runs": ordered,
+            "failed": failed,
+            "n_cached": n_cached,
+            **self._aggregate(ordered),
+        }
+
+    def _aggregate(self, runs: List[Dict]) -> Dict[str, Any]:
+        """Pooled Bell test and field-correlation meta-analysis."""
+        if not runs:
+            return {"pooled_bell_test": None, "field_correlation_meta": None}
+
+        validator = StatisticalValidator()
+        pooled = validator.pooled_bell_test(
+            [r["n_samples"] for r in runs],
+            [r["mean_chsh"] for r in runs],
+            [r["sum_squares"] for r in runs],
+        )
+        try:
+            meta = validator.correlation_meta_analysis(
+                [r["field_correlation"] for r in runs],
+                [r["n_samples"] for r in runs],
+            )
+        except ValueError:
+            meta = None
+
+        return {"pooled_bell_test": pooled, "field_correlation_meta": meta}
+
+    def _cache_path(self, path: Path) -> Path:
+        digest = hashlib.sha256(str(path).encode()).hexdigest()[:32]
+        return self.cache_dir / f"{digest}.json"
+
+    def _cache_key(self, path: Path, time_range) -> Dict[str, Any]:
+        stat = path.stat()
+        return {
+            "file": str(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "config_hash": self.config_hash,
+            "code_version": [code_version(), _report_code_version()],
+            "time_range": list(time_range) if time_range else None,
+        }
+
+    def _load_cached(self, path: Path, time_range) -> Optional[Dict]:
+        if not self.use_cache:
+            return None
+        cache_file = self._cache_path(path)
+        try:
+            with open(cache_file, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != self._cache_key(path, time_range):
+            return None
+        return entry["result"]
+
+    def _store_cached(self, path: Path, time_range, summary: Dict) -> None:
+        if not self.use_cache:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"key": self._cache_key(path, time_range), "result": summary}
+        with open(self._cache_path(path), "w") as f:
+            json.dump(entry, f)
+
+    def write_report(self, campaign: Dict[str, Any]) -> str:
+        """
+        Write the combined campaign report (JSON and HTML).
+
+        Returns:
+        --------
+        str : Path to the HTML report
+        """
+        json_file = self.output_dir / "campaign_results.json"
+        with open(json_file, "w") as f:
+            json.dump(campaign, f, indent=2, default=str)
+
+        pooled = campaign["pooled_bell_test"] or {}
+        meta = campaign["field_correlation_meta"] or {}
+        rows = "\n".join(
+            f"<tr><td>{Path(r['file']).name}</td><td>{r['n_samples']}</td>"
+            f"<td>{r['mean_chsh']:.4f}</td>"
+            f"<td>{r['field_correlation']:+.4f}</td>"
+            f"<td>{'PASSED' if r['validation_passed'] else 'FAILED'}</td></tr>"
+            for r in campaign["runs"]
+        )
+        failed = "".join(
+            f"<li>{Path(f).name}: {e}</li>" for f, e in campaign["failed"].items()
+        )
+
+        html_file = self.output_dir / "campaign_report.html"
+        html_content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Environmental Quantum Field Effects - Campaign Report</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 40px; }}
+                .header {{ text-align: center; color: #2c3e50; }}
+                .section {{ margin: 30px 0; }}
+                .summary {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; }}
+                table {{ border-collapse: collapse; width: 100%; }}
+                th, td {{ border: 1px solid #ddd; padding: 6px; text-align: right; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>Environmental Quantum Field Effects</h1>
+                <h2>Campaign Analysis Report</h2>
+                <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+            </div>
+
+            <div class="section">
+                <h3>Pooled Bell Test</h3>
+                <div class="summary">
+                    <p><strong>Runs:</strong> {pooled.get('n_runs', 0)} ({len(campaign['failed'])} failed)</p>
+                    <p><strong>Samples:</strong> {pooled.get('n_samples', 0)}</p>
+                    <p><strong>Pooled CHSH:</strong> {pooled.get('mean_chsh', float('nan')):.4f} ± {pooled.get('sem_chsh', float('nan')):.4f}</p>
+                    <p><strong>Classical p-value:</strong> {pooled.get('classical_p_value', float('nan')):.3e}</p>
+                    <p><strong>Between-run heterogeneity p-value:</strong> {pooled.get('heterogeneity_p_value', float('nan')):.3e}</p>
+                </div>
+            </div>
+
+            <div class="section">
+                <h3>Field Correlation Meta-Analysis</h3>
+                <div class="summary">
+                    <p><strong>Pooled correlation:</strong> {meta.get('correlation', float('nan')):+.4f}</p>
+                    <p><strong>p-value:</strong> {meta.get('p_value', float('nan')):.3e}</p>
+                    <p><strong>I²:</strong> {meta.get('i_squared', float('nan')):.2f}</p>
+                </div>
+            </div>
+
+            <div class="section">
+                <h3>Runs</h3>
+                <table>
+                    <tr><th>File</th><th>Samples</th><th>Mean CHSH</th><th>Field r</th><th>Validation</th></tr>
+                    {rows}
+                </table>
+                <ul>{failed}</ul>
+            </div>
+        </body>
+        </html>
+        """
+
+        with open(html_file, "w") as f:
+            f.write(html_content)
+
+        return str(html_file)
+
+
 def main():
     """Main analysis function."""
     parser = argparse.ArgumentParser(
         description="Analyze Environmental Quantum Field Effects experimental data"
     )
 
-    parser.add_argument(
-        "--data-file", required=True, help="Path to experimental data file"
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument("--data-file", help="Path to experimental data file")
+    inputs.add_argument(
+        "--campaign",
+        nargs="+",
+        metavar="PATTERN",
+        help="Analyze many runs: glob patterns, files or manifests",
+    )
+    inputs.add_argument(
+        "--render-plots",
+        metavar="REPORT_DIR",
+        help="Render plots deferred by --plot-mode defer in a report directory",
     )
     parser.add_argument(
         "--output-dir",
@@ -717,6 +1763,79 @@ def main():
     parser.add_argument(
         "--generate-plots", action="store_true", help="Generate analysis plots"
     )
+    parser.add_argument(
+        "--plot-mode",
+        choices=["render", "defer", "skip"],
+        help="Render report plots now (default), defer them, or skip them",
+    )
+    parser.add_argument(
+        "--time-range",
+        nargs=2,
+        type=float,
+        metavar=("T_START", "T_STOP"),
+        help="Analyze only samples with T_START <= timestamp < T_STOP",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Analyze CSV/JSON Lines data incrementally in chunks",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100_000,
+        help="Rows per chunk in streaming mode",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Keep reading rows appended to a growing file (streaming mode)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        help="Stop following after this many seconds without new rows",
+    )
+    parser.add_argument(
+        "--live-report",
+        action="store_true",
+        help="Maintain an auto-refreshing HTML report (streaming mode)",
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between live report refreshes",
+    )
+    parser.add_argument(
+        "--report-name",
+        help="Report directory name; reusing one updates only changed sections",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes in campaign mode (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute everything instead of reusing cached results",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Analysis stage cache directory (default: OUTPUT_DIR/.analysis_cache)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=1024,
+        help="Analysis stage cache size limit in MB",
+    )
+    parser.add_argument(
+        "--results-store",
+        help="HDF5 results store to append this run to "
+        "(default: a new store in the report directory)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Verbose output"
     )
@@ -743,14 +1862,69 @@ def main():
         # Override config with command line options
         config["validation"]["level"] = args.validation_level
         config["plotting"]["generate_plots"] = args.generate_plots
+        if args.plot_mode:
+            config["plotting"]["mode"] = args.plot_mode
+
+        if args.render_plots:
+            plot_files = render_plot_payloads(
+                load_plot_payloads(Path(args.render_plots)),
+                Path(args.render_plots),
+                dpi=config["plotting"].get("plot_dpi", 300),
+                parallel=config["plotting"].get("parallel", True),
+            )
+            for plot_file in plot_files.values():
+                print(f"Rendered: {plot_file}")
+            return 0
 
         print("Environmental Quantum Field Effects - Data Analysis")
         print("=" * 60)
 
+        loader = ExperimentalDataLoader()
+
+        if args.campaign:
+            files = resolve_campaign_files(args.campaign)
+            if not files:
+                raise FileNotFoundError(
+                    f"No data files match: {' '.join(args.campaign)}"
+                )
+            print(f"Campaign: {len(files)} runs")
+            campaign_analyzer = CampaignAnalyzer(
+                args.output_dir,
+                config,
+                workers=args.workers,
+                use_cache=not args.no_cache,
+            )
+            campaign = campaign_analyzer.run(files, time_range=args.time_range)
+            report_path = campaign_analyzer.write_report(campaign)
+
+            pooled = campaign["pooled_bell_test"]
+            print(f"\nCampaign analysis complete ({campaign['n_cached']} cached)")
+            if pooled:
+                print(
+                    f"  Pooled CHSH: {pooled['mean_chsh']:.4f} ± "
+                    f"{pooled['sem_chsh']:.4f} over {pooled['n_runs']} runs"
+                )
+            if campaign["field_correlation_meta"]:
+                meta = campaign["field_correlation_meta"]
+                print(
+                    f"  Pooled field correlation: {meta['correlation']:+.4f} "
+                    f"(p = {meta['p_value']:.2e}, I² = {meta['i_squared']:.2f})"
+                )
+            print(f"Report generated: {report_path}")
+            return 1 if campaign["failed"] else 0
+
+        if args.stream:
+            print(f"Streaming data from: {args.data_file}")
+            run_streaming_analysis(loader, args)
+            return 0
+
         # Load experimental data
         print(f"Loading data from: {args.data_file}")
-        loader = ExperimentalDataLoader()
-        data = loader.load_data(args.data_file)
+        data = loader.load_data(args.data_file, time_range=args.time_range)
+
+        # Analysis stages work on in-memory arrays; read the selected
+        # range once instead of re-reading lazy views per stage
+        data = materialize(data)
 
         print(f"Loaded {len(data.timestamps)} data points")
         print(
@@ -760,9 +1934,16 @@ def main():
             f"CHSH range: {np.min(data.chsh_values):.4f} - {np.max(data.chsh_values):.4f}"
         )
 
+        cache = None
+        if not args.no_cache:
+            cache = ResultCache(
+                args.cache_dir or Path(args.output_dir) / ".analysis_cache",
+                max_bytes=int(args.cache_size * 1024 * 1024),
+            )
+
         # Perform comprehensive analysis
         print("\nPerforming comprehensive analysis...")
-        results = comprehensive_analysis(data)
+        results = comprehensive_analysis(data, config=config, cache=cache)
 
         # Log validation results
         print("\nPhysics Validation Results:")
@@ -770,8 +1951,14 @@ def main():
 
         # Generate report
         print(f"\nGenerating analysis report in: {args.output_dir}")
-        report_generator = AnalysisReportGenerator(args.output_dir)
-        report_path = report_generator.generate_report(data, results, config)
+        report_generator = AnalysisReportGenerator(
+            args.output_dir, cache, results_store=args.results_store
+        )
+        report_path = report_generator.generate_report(
+            data, results, config, report_name=args.report_name
+        )
+        if cache is not None and args.verbose:
+            print(f"Cache: {cache.stats()}")
 
         print(f"\nAnalysis complete!")
         print(f"Report generated: {report_path}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Convert legacy experimental data files to columnar formats.
+
+Reads any format supported by ExperimentalDataLoader (CSV, JSON, NPZ, HDF5)
+and writes Parquet or Arrow IPC, which load column-by-column and by time
+range without parsing the whole file.
+
+Usage:
+    python convert_experimental_data.py INPUT [INPUT ...] [options]
+
+Options:
+    --output-dir PATH       Directory for converted files (default: alongside input)
+    --format STR            Output format (parquet/arrow)
+    --row-group-size N      Samples per Parquet row group / Arrow batch
+    --compression STR       Parquet compression codec
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add package path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent))
+
+from analyze_experimental_data import ExperimentalDataLoader
+from simulations.analysis.data_formats import write_arrow, write_parquet
+
+
+def convert_file(
+    input_path: Path,
+    output_dir: Path = None,
+    output_format: str = "parquet",
+    row_group_size: int = 1_000_000,
+    compression: str = "zstd",
+) -> Path:
+    """
+    Convert one data file to a columnar format.
+
+    Parameters:
+    -----------
+    input_path : Path
+        Legacy data file
+    output_dir : Path, optional
+        Output directory; defaults to the input file's directory
+    output_format : str
+        'parquet' or 'arrow'
+    row_group_size : int
+        Samples per row group (Parquet) or record batch (Arrow)
+    compression : str
+        Parquet compression codec
+
+    Returns:
+    --------
+    Path : Converted file path
+    """
+    data = ExperimentalDataLoader().load_data(input_path)
+
+    output_dir = Path(output_dir) if output_dir else input_path.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{input_path.stem}.{output_format}"
+
+    if output_format == "parquet":
+        return write_parquet(
+            data,
+            output_path,
+            row_group_size=row_group_size,
+            compression=compression,
+        )
+    return write_arrow(data, output_path, chunk_size=row_group_size)
+
+
+def main():
+    """Main conversion function."""
+    parser = argparse.ArgumentParser(
+        description="Convert experimental data files to Parquet/Arrow"
+    )
+    parser.add_argument("inputs", nargs="+", help="Data files to convert")
+    parser.add_argument(
+        "--output-dir", help="Output directory (default: alongside input)"
+    )
+    parser.add_argument(
+        "--format",
+        default="parquet",
+        choices=["parquet", "arrow"],
+        help="Output format",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=1_000_000,
+        help="Samples per Parquet row group / Arrow record batch",
+    )
+    parser.add_argument(
+        "--compression", default="zstd", help="Parquet compression codec"
+    )
+
+    args = parser.parse_args()
+
+    failed = 0
+    for name in args.inputs:
+        input_path = Path(name)
+        start = time.perf_counter()
+        try:
+            output_path = convert_file(
+                input_path,
+                args.output_dir,
+                args.format,
+                args.row_group_size,
+                args.compression,
+            )
+        except (OSError, ValueError, KeyError) as e:
+            print(f"✗ {input_path}: {e}")
+            failed += 1
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"✓ {input_path} -> {output_path} ({elapsed:.2f} s)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -55,6 +55,10 @@ setup(
             "sphinx-rtd-theme>=0.5.0",
             "nbsphinx>=0.8.0",
         ],
+        "io": [
+            "h5py>=3.0.0",
+            "pyarrow>=10.0.0",
+        ],
         "quantum": [
             "cirq>=0.12.0",
             "qiskit>=0.28.0",
@@ -2,9 +2,21 @@
 Simulations Package
 
 Core simulation modules for environmental quantum field effects.
-"""
 
-from .core.field_simulator import EnvironmentalFieldSimulator
-from .core.quantum_correlations import CHSHExperimentSimulator
+Simulator classes are imported on first access, so ``import simulations``
+(or any submodule) does not pay for SciPy until a simulator is used.
+"""
 
 __all__ = ["EnvironmentalFieldSimulator", "CHSHExperimentSimulator"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
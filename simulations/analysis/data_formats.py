@@ -0,0 +1,963 @@
+"""
+Experimental Data Formats Module
+
+This module implements on-disk storage backends for ``ExperimentalData``.
+Backends keep large runs on disk and expose them through lazy, sliceable
+views, so multi-GB files can be opened instantly and read only where needed.
+"""
+
+import json
+import os
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from .experimental_analysis import ExperimentalData
+
+# Per-sample dict fields of ExperimentalData, stored as groups/columns
+DATA_GROUPS = (
+    "correlations",
+    "environmental_fields",
+    "detector_counts",
+    "analyzer_settings",
+)
+
+FORMAT_VERSION = 1
+
+
+class LazyArray(NDArrayOperatorsMixin):
+    """
+    Read-on-demand 1-D view over an on-disk dataset.
+
+    Wraps any object supporting ``len`` and contiguous slicing (h5py
+    datasets, memory maps). Indexing and slicing read only the requested
+    range; NumPy functions and operators materialize the view transparently.
+    """
+
+    def __init__(self, source: Any, start: int = 0, stop: Optional[int] = None):
+        """
+        Initialize lazy view.
+
+        Parameters:
+        -----------
+        source : dataset
+            Sliceable on-disk dataset
+        start, stop : int
+            Sample range of ``source`` covered by this view
+        """
+        self.source = source
+        self.start = start
+        self.stop = len(source) if stop is None else stop
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return (self.stop - self.start,) + tuple(self.source.shape[1:])
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self.source.dtype)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyArray(shape={self.shape}, dtype={self.dtype}, "
+            f"source={type(self.source).__name__})"
+        )
+
+    def __getitem__(self, key):
+        n = len(self)
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += n
+            if not 0 <= key < n:
+                raise IndexError(f"index {key} out of range for length {n}")
+            return self.source[self.start + key]
+        if isinstance(key, slice):
+            lo, hi, step = key.indices(n)
+            if step == 1:
+                return np.asarray(
+                    self.source[self.start + lo : self.start + max(hi, lo)]
+                )
+        return self.read()[key]
+
+    def view(self, start: int, stop: int) -> "LazyArray":
+        """Return a lazy sub-view without reading data."""
+        return LazyArray(self.source, self.start + start, self.start + stop)
+
+    def read(self) -> np.ndarray:
+        """Materialize the view into memory."""
+        return np.asarray(self.source[self.start : self.stop])
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.read()
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(
+            x.read() if isinstance(x, LazyArray) else x for x in inputs
+        )
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+
+def materialize(data: ExperimentalData) -> ExperimentalData:
+    """
+    Return a copy of ``data`` with all lazy views read into memory.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Data possibly holding lazy dataset views
+
+    Returns:
+    --------
+    ExperimentalData : Data holding only NumPy arrays
+    """
+    return ExperimentalData(
+        timestamps=np.asarray(data.timestamps),
+        chsh_values=np.asarray(data.chsh_values),
+        metadata=dict(data.metadata),
+        **{
+            group: {k: np.asarray(v) for k, v in getattr(data, group).items()}
+            for group in DATA_GROUPS
+        },
+    )
+
+
+def select_time_range(
+    data: ExperimentalData, time_range: Tuple[float, float]
+) -> ExperimentalData:
+    """
+    Restrict ``data`` to samples with t_start <= timestamp < t_stop.
+
+    Timestamps are assumed sorted. Lazy views stay lazy; only the
+    timestamp search touches the data.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Experimental data
+    time_range : tuple
+        (t_start, t_stop) in seconds
+
+    Returns:
+    --------
+    ExperimentalData : Data for the requested time range
+    """
+    lo, hi = _search_range(data.timestamps, *time_range)
+    n = len(data.timestamps)
+
+    def _slice(values):
+        if len(values) != n:
+            return values
+        if isinstance(values, LazyArray):
+            return values.view(lo, hi)
+        return values[lo:hi]
+
+    metadata = dict(data.metadata)
+    metadata["time_range"] = [float(time_range[0]), float(time_range[1])]
+
+    return ExperimentalData(
+        timestamps=_slice(data.timestamps),
+        chsh_values=_slice(data.chsh_values),
+        metadata=metadata,
+        **{
+            group: {k: _slice(v) for k, v in getattr(data, group).items()}
+            for group in DATA_GROUPS
+        },
+    )
+
+
+def _search_range(
+    timestamps: Any, t_start: float, t_stop: float
+) -> Tuple[int, int]:
+    """Index range of sorted ``timestamps`` in [t_start, t_stop)."""
+    if isinstance(timestamps, np.ndarray):
+        return (
+            int(np.searchsorted(timestamps, t_start, side="left")),
+            int(np.searchsorted(timestamps, t_stop, side="left")),
+        )
+    # On-disk data: bisect with O(log n) single-element reads
+    return _bisect(timestamps, t_start), _bisect(timestamps, t_stop)
+
+
+def _bisect(timestamps: Any, value: float) -> int:
+    lo, hi = 0, len(timestamps)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if timestamps[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _require_h5py():
+    try:
+        import h5py
+    except ImportError as e:
+        raise ImportError(
+            "HDF5 support requires h5py (pip install h5py)"
+        ) from e
+    return h5py
+
+
+def write_hdf5_group(
+    group,
+    data: ExperimentalData,
+    chunk_size: int = 65536,
+    compression: Optional[str] = "gzip",
+    compression_opts: Optional[int] = 4,
+) -> None:
+    """
+    Write experimental data into an open HDF5 group (layout of :func:`write_hdf5`).
+
+    Parameters:
+    -----------
+    group : h5py.Group
+        Destination group (a file's root group or a sub-group)
+    data : ExperimentalData
+        Data to write
+    chunk_size, compression, compression_opts
+        As for :func:`write_hdf5`
+    """
+
+    def _write(parent, name, values):
+        values = np.asarray(values)
+        chunks = (min(chunk_size, len(values)),) + values.shape[1:]
+        parent.create_dataset(
+            name,
+            data=values,
+            chunks=chunks if len(values) else None,
+            compression=compression if len(values) else None,
+            compression_opts=(
+                compression_opts if compression == "gzip" else None
+            ),
+            shuffle=compression is not None and len(values) > 0,
+        )
+
+    group.attrs["metadata"] = json.dumps(data.metadata, default=str)
+    _write(group, "timestamps", data.timestamps)
+    _write(group, "chsh_values", data.chsh_values)
+    for group_name in DATA_GROUPS:
+        sub_group = group.create_group(group_name)
+        for key, values in getattr(data, group_name).items():
+            _write(sub_group, key, values)
+
+
+def read_hdf5_group(group) -> ExperimentalData:
+    """
+    Open experimental data stored by :func:`write_hdf5_group` as lazy views.
+
+    The views read from the group's file, which must stay open while they
+    are in use.
+    """
+    return ExperimentalData(
+        timestamps=LazyArray(group["timestamps"]),
+        chsh_values=LazyArray(group["chsh_values"]),
+        metadata=json.loads(group.attrs.get("metadata", "{}")),
+        **{
+            name: {k: LazyArray(ds) for k, ds in group[name].items()}
+            if name in group
+            else {}
+            for name in DATA_GROUPS
+        },
+    )
+
+
+def write_hdf5(
+    data: ExperimentalData,
+    file_path: Union[str, Path],
+    chunk_size: int = 65536,
+    compression: Optional[str] = "gzip",
+    compression_opts: Optional[int] = 4,
+) -> Path:
+    """
+    Write experimental data to a chunked, compressed HDF5 file.
+
+    Layout: root datasets 'timestamps' and 'chsh_values', one group per
+    dict field ('correlations', 'environmental_fields', ...), metadata as a
+    JSON root attribute.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Data to write
+    file_path : str or Path
+        Output file
+    chunk_size : int
+        Samples per HDF5 chunk
+    compression : str, optional
+        HDF5 compression filter ('gzip', 'lzf' or None)
+    compression_opts : int, optional
+        Compression level for gzip
+
+    Returns:
+    --------
+    Path : Written file path
+    """
+    h5py = _require_h5py()
+    file_path = Path(file_path)
+
+    with h5py.File(file_path, "w") as f:
+        f.attrs["format_version"] = FORMAT_VERSION
+        write_hdf5_group(
+            f,
+            data,
+            chunk_size=chunk_size,
+            compression=compression,
+            compression_opts=compression_opts,
+        )
+
+    return file_path
+
+
+def read_hdf5(
+    file_path: Union[str, Path],
+    time_range: Optional[Tuple[float, float]] = None,
+    lazy: bool = True,
+) -> ExperimentalData:
+    """
+    Open experimental data from an HDF5 file written by :func:`write_hdf5`.
+
+    Parameters:
+    -----------
+    file_path : str or Path
+        HDF5 file
+    time_range : tuple, optional
+        (t_start, t_stop); only this part of the run is exposed. Located by
+        bisection on the on-disk timestamps without reading them all.
+    lazy : bool
+        Return LazyArray views (default) instead of reading into memory.
+        The file stays open for as long as the views are referenced.
+
+    Returns:
+    --------
+    ExperimentalData : Loaded experimental data
+    """
+    h5py = _require_h5py()
+    f = h5py.File(file_path, "r")
+
+    data = read_hdf5_group(f)
+    data.metadata.update({"source_file": str(file_path), "format": "hdf5"})
+
+    if time_range is not None:
+        data = select_time_range(data, time_range)
+
+    if not lazy:
+        data = materialize(data)
+        f.close()
+
+    return data
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet/Arrow support requires pyarrow (pip install pyarrow)"
+        ) from e
+    return pyarrow
+
+
+def _column_name(group: str, key: str) -> str:
+    """Flat column name for a dict field entry, e.g. 'correlations.E_ab'."""
+    return f"{group}.{key}"
+
+
+def to_arrow_table(data: ExperimentalData):
+    """
+    Convert experimental data to a flat Arrow table.
+
+    Root arrays become the 'timestamps' and 'chsh_values' columns; dict
+    fields become '<group>.<key>' columns. Metadata is stored as JSON in
+    the schema metadata.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Data to convert
+
+    Returns:
+    --------
+    pyarrow.Table : Columnar representation of the run
+    """
+    pa = _require_pyarrow()
+
+    columns = {
+        "timestamps": np.asarray(data.timestamps),
+        "chsh_values": np.asarray(data.chsh_values),
+    }
+    for group in DATA_GROUPS:
+        for key, values in getattr(data, group).items():
+            columns[_column_name(group, key)] = np.asarray(values)
+
+    table = pa.table(columns)
+    return table.replace_schema_metadata(
+        {
+            "eqfe_metadata": json.dumps(data.metadata, default=str),
+            "eqfe_format_version": str(FORMAT_VERSION),
+        }
+    )
+
+
+def from_arrow_table(table, metadata: Optional[Dict] = None) -> ExperimentalData:
+    """
+    Build experimental data from an Arrow table written by
+    :func:`to_arrow_table`.
+
+    Columns backed by a single null-free chunk are exposed as zero-copy
+    NumPy views of the Arrow buffers.
+
+    Parameters:
+    -----------
+    table : pyarrow.Table
+        Columnar run data
+    metadata : dict, optional
+        Extra metadata merged over the stored metadata
+
+    Returns:
+    --------
+    ExperimentalData : Experimental data backed by Arrow memory
+    """
+    stored = (table.schema.metadata or {}).get(b"eqfe_metadata", b"{}")
+    run_metadata: Dict = json.loads(stored)
+    run_metadata.update(metadata or {})
+
+    groups: Dict[str, Dict[str, np.ndarray]] = {g: {} for g in DATA_GROUPS}
+    root: Dict[str, np.ndarray] = {}
+    for name in table.column_names:
+        values = _column_to_numpy(table.column(name))
+        group, _, key = name.partition(".")
+        if key and group in groups:
+            groups[group][key] = values
+        else:
+            root[name] = values
+
+    empty = np.array([], dtype=float)
+    return ExperimentalData(
+        timestamps=root.get("timestamps", empty),
+        chsh_values=root.get("chsh_values", empty),
+        metadata=run_metadata,
+        **groups,
+    )
+
+
+def _column_to_numpy(column) -> np.ndarray:
+    """Zero-copy conversion where Arrow's memory layout allows it."""
+    if column.num_chunks == 1 and column.null_count == 0:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _projection(
+    available, columns: Optional[Sequence[str]]
+) -> Optional[list]:
+    """
+    Resolve requested columns against the file schema.
+
+    Entries may be full column names ('environmental_fields.temperature')
+    or group names ('environmental_fields'). 'timestamps' is always kept.
+    """
+    if columns is None:
+        return None
+
+    selected = ["timestamps"]
+    for name in columns:
+        matches = [
+            c for c in available if c == name or c.startswith(f"{name}.")
+        ]
+        if not matches:
+            raise ValueError(f"Unknown column or group: {name}")
+        selected.extend(c for c in matches if c not in selected)
+    return selected
+
+
+def write_parquet(
+    data: ExperimentalData,
+    file_path: Union[str, Path],
+    row_group_size: int = 1_000_000,
+    compression: str = "zstd",
+) -> Path:
+    """
+    Write experimental data to a Parquet file.
+
+    Row groups carry min/max timestamp statistics, which lets
+    :func:`read_parquet` skip row groups outside a requested time range.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Data to write
+    file_path : str or Path
+        Output file
+    row_group_size : int
+        Samples per row group
+    compression : str
+        Parquet compression codec
+
+    Returns:
+    --------
+    Path : Written file path
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    file_path = Path(file_path)
+    pq.write_table(
+        to_arrow_table(data),
+        file_path,
+        row_group_size=row_group_size,
+        compression=compression,
+    )
+    return file_path
+
+
+def read_parquet(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    time_range: Optional[Tuple[float, float]] = None,
+) -> ExperimentalData:
+    """
+    Read experimental data from a Parquet file.
+
+    Parameters:
+    -----------
+    file_path : str or Path
+        Parquet file
+    columns : sequence of str, optional
+        Column or group names to read (projection); all by default
+    time_range : tuple, optional
+        (t_start, t_stop); pushed down as a timestamp predicate so only
+        matching row groups are decoded
+
+    Returns:
+    --------
+    ExperimentalData : Loaded experimental data
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(file_path)
+    filters = None
+    if time_range is not None:
+        filters = [
+            ("timestamps", ">=", float(time_range[0])),
+            ("timestamps", "<", float(time_range[1])),
+        ]
+
+    table = pq.read_table(
+        file_path,
+        columns=_projection(schema.names, columns),
+        filters=filters,
+    )
+    metadata = {"source_file": str(file_path), "format": "parquet"}
+    if time_range is not None:
+        metadata["time_range"] = [float(time_range[0]), float(time_range[1])]
+    return from_arrow_table(table, metadata)
+
+
+def write_arrow(
+    data: ExperimentalData,
+    file_path: Union[str, Path],
+    chunk_size: int = 1_000_000,
+) -> Path:
+    """
+    Write experimental data to an uncompressed Arrow IPC file.
+
+    Arrow IPC files can be memory-mapped by :func:`read_arrow`, so reads
+    are zero-copy at the cost of larger files than Parquet.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Data to write
+    file_path : str or Path
+        Output file
+    chunk_size : int
+        Samples per record batch
+
+    Returns:
+    --------
+    Path : Written file path
+    """
+    pa = _require_pyarrow()
+
+    file_path = Path(file_path)
+    table = to_arrow_table(data)
+    with pa.OSFile(str(file_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=chunk_size)
+    return file_path
+
+
+def read_arrow(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    time_range: Optional[Tuple[float, float]] = None,
+) -> ExperimentalData:
+    """
+    Memory-map experimental data from an Arrow IPC file.
+
+    Parameters:
+    -----------
+    file_path : str or Path
+        Arrow IPC file
+    columns : sequence of str, optional
+        Column or group names to expose; all by default
+    time_range : tuple, optional
+        (t_start, t_stop); selected by binary search on the mapped
+        timestamps, without copying
+
+    Returns:
+    --------
+    ExperimentalData : Experimental data backed by the mapped file
+    """
+    pa = _require_pyarrow()
+
+    source = pa.memory_map(str(file_path), "r")
+    table = pa.ipc.open_file(source).read_all()
+    selected = _projection(table.column_names, columns)
+    if selected is not None:
+        table = table.select(selected)
+
+    metadata = {"source_file": str(file_path), "format": "arrow"}
+    data = from_arrow_table(table, metadata)
+    if time_range is not None:
+        data = select_time_range(data, time_range)
+    return data
+
+
+RAW_INDEX_NAME = "index.json"
+
+
+class UniformTimebase:
+    """
+    Timestamps of a uniformly sampled run, computed on demand.
+
+    Behaves like a read-only 1-D dataset so it can back a LazyArray
+    without storing one float per sample.
+    """
+
+    def __init__(self, n_samples: int, sample_rate: float, time_origin: float = 0.0):
+        self.n_samples = int(n_samples)
+        self.sample_rate = float(sample_rate)
+        self.time_origin = float(time_origin)
+        self.shape = (self.n_samples,)
+        self.dtype = np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            indices = np.arange(*key.indices(self.n_samples), dtype=np.float64)
+        else:
+            indices = np.asarray(key, dtype=np.float64)
+            if np.any((indices < 0) | (indices >= self.n_samples)):
+                raise IndexError("sample index out of range")
+        return self.time_origin + indices / self.sample_rate
+
+
+class ScaledSamples:
+    """
+    Integer ADC codes converted to physical units on demand.
+
+    Behaves like a read-only dataset over ``source`` (e.g. an int16
+    memory map) returning ``codes * scale + offset`` as float64 for the
+    requested range only, so runs stay stored at their native resolution.
+    """
+
+    def __init__(self, source: Any, scale: float, offset: float = 0.0):
+        self.source = source
+        self.scale = float(scale)
+        self.offset = float(offset)
+        self.shape = tuple(source.shape)
+        self.dtype = np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __getitem__(self, key):
+        values = np.asarray(self.source[key], dtype=np.float64)
+        values *= self.scale
+        values += self.offset
+        return values
+
+
+class RawRunWriter:
+    """
+    Writer for the raw binary run format.
+
+    A run is a directory holding one raw little-endian file per channel
+    (``<channel>.bin``) and an ``index.json`` with dtype, shape, target
+    ExperimentalData field, sample rate, time origin and metadata. Channels
+    are appended block by block, so acquisition code can stream samples to
+    disk without ever holding the full run in memory; readers open each
+    file with ``np.memmap``.
+    """
+
+    def __init__(
+        self,
+        run_dir: Union[str, Path],
+        sample_rate: float,
+        time_origin: float = 0.0,
+        metadata: Optional[Dict] = None,
+    ):
+        """
+        Create a run directory.
+
+        Parameters:
+        -----------
+        run_dir : str or Path
+            Output directory (created if missing)
+        sample_rate : float
+            Samples per second shared by all channels
+        time_origin : float
+            Timestamp of the first sample (seconds)
+        metadata : dict, optional
+            Run metadata stored in the index
+        """
+        self.run_dir = Path(run_dir)
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.sample_rate = float(sample_rate)
+        self.time_origin = float(time_origin)
+        self.metadata = dict(metadata or {})
+        self.channels: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, Any] = {}
+
+    def add_channel(
+        self,
+        name: str,
+        dtype: Any = np.float64,
+        group: Optional[str] = "environmental_fields",
+        sample_shape: Tuple[int, ...] = (),
+        scale: Optional[float] = None,
+        offset: float = 0.0,
+    ) -> None:
+        """
+        Declare a channel.
+
+        Parameters:
+        -----------
+        name : str
+            Channel name (file stem and ExperimentalData key)
+        dtype : dtype
+            Sample dtype; stored little-endian
+        group : str, optional
+            ExperimentalData dict field holding the channel, or None for the
+            root 'timestamps'/'chsh_values' arrays
+        sample_shape : tuple
+            Per-sample shape for multi-valued channels
+        scale, offset : float, optional
+            For integer ADC codes: readers return ``code * scale + offset``
+            instead of the raw codes
+        """
+        if name in self.channels:
+            raise ValueError(f"Channel already defined: {name}")
+        if group is not None and group not in DATA_GROUPS:
+            raise ValueError(f"Unknown data group: {group}")
+
+        dtype = np.dtype(dtype).newbyteorder("<")
+        self.channels[name] = {
+            "file": f"{name}.bin",
+            "dtype": dtype.str,
+            "group": group,
+            "sample_shape": list(sample_shape),
+            "n_samples": 0,
+        }
+        if scale is not None:
+            self.channels[name].update(scale=float(scale), offset=float(offset))
+        self._files[name] = open(self.run_dir / f"{name}.bin", "wb")
+
+    def append(self, name: str, samples: np.ndarray) -> None:
+        """Append a block of samples to a channel."""
+        info = self.channels[name]
+        block = np.ascontiguousarray(samples, dtype=np.dtype(info["dtype"]))
+        block = block.reshape((-1,) + tuple(info["sample_shape"]))
+        block.tofile(self._files[name])
+        info["n_samples"] += len(block)
+
+    def flush(self) -> None:
+        """Flush channel files and rewrite the index."""
+        for f in self._files.values():
+            f.flush()
+        self._write_index()
+
+    def sync(self) -> None:
+        """Flush channel files, force them to stable storage and rewrite the index."""
+        for f in self._files.values():
+            f.flush()
+            os.fsync(f.fileno())
+        self._write_index()
+
+    def close(self) -> Path:
+        """Close channel files and write the final index."""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+        return self._write_index()
+
+    def __enter__(self) -> "RawRunWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _write_index(self) -> Path:
+        index = {
+            "format_version": FORMAT_VERSION,
+            "sample_rate": self.sample_rate,
+            "time_origin": self.time_origin,
+            "channels": {
+                name: dict(
+                    info,
+                    shape=[info["n_samples"]] + info["sample_shape"],
+                )
+                for name, info in self.channels.items()
+            },
+            "metadata": self.metadata,
+        }
+        index_path = self.run_dir / RAW_INDEX_NAME
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2, default=str)
+        tmp_path.replace(index_path)
+        return index_path
+
+
+def write_raw_run(
+    data: ExperimentalData,
+    run_dir: Union[str, Path],
+    sample_rate: Optional[float] = None,
+) -> Path:
+    """
+    Write experimental data in the raw binary run format.
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Data to write
+    run_dir : str or Path
+        Output directory
+    sample_rate : float, optional
+        Declared sample rate; estimated from the timestamps if omitted.
+        Explicit timestamps are always stored, so irregular sampling
+        round-trips exactly.
+
+    Returns:
+    --------
+    Path : Index file path
+    """
+    timestamps = np.asarray(data.timestamps)
+    if sample_rate is None:
+        span = timestamps[-1] - timestamps[0] if len(timestamps) > 1 else 0.0
+        sample_rate = (len(timestamps) - 1) / span if span > 0 else 1.0
+    time_origin = float(timestamps[0]) if len(timestamps) else 0.0
+
+    with RawRunWriter(run_dir, sample_rate, time_origin, data.metadata) as w:
+        for name in ("timestamps", "chsh_values"):
+            values = np.asarray(getattr(data, name))
+            w.add_channel(name, values.dtype, None, values.shape[1:])
+            w.append(name, values)
+        for group in DATA_GROUPS:
+            for key, values in getattr(data, group).items():
+                values = np.asarray(values)
+                name = _column_name(group, key)
+                w.add_channel(name, values.dtype, group, values.shape[1:])
+                w.append(name, values)
+    return Path(run_dir) / RAW_INDEX_NAME
+
+
+def read_raw_run(
+    run_path: Union[str, Path],
+    time_range: Optional[Tuple[float, float]] = None,
+    mode: str = "r",
+) -> ExperimentalData:
+    """
+    Open a raw binary run as memory-mapped experimental data.
+
+    Parameters:
+    -----------
+    run_path : str or Path
+        Run directory or its index file
+    time_range : tuple, optional
+        (t_start, t_stop); maps only the matching sample range
+    mode : str
+        np.memmap mode ('r' read-only, 'c' copy-on-write)
+
+    Returns:
+    --------
+    ExperimentalData : Experimental data backed by np.memmap arrays. Runs
+    without a 'timestamps' channel get timestamps computed on demand from
+    the sample rate and time origin, and channels of scaled ADC codes are
+    converted on access (as LazyArray views).
+    """
+    run_path = Path(run_path)
+    run_dir = run_path.parent if run_path.is_file() else run_path
+    with open(run_dir / RAW_INDEX_NAME, "r") as f:
+        index = json.load(f)
+
+    def _map(info):
+        dtype = np.dtype(info["dtype"])
+        shape = tuple(info["shape"])
+        if shape[0] == 0:
+            samples = np.empty(shape, dtype=dtype)
+        else:
+            samples = np.memmap(
+                run_dir / info["file"], dtype=dtype, mode=mode, shape=shape
+            )
+        if "scale" in info:
+            return LazyArray(
+                ScaledSamples(samples, info["scale"], info.get("offset", 0.0))
+            )
+        return samples
+
+    root: Dict[str, Any] = {}
+    groups: Dict[str, Dict[str, np.ndarray]] = {g: {} for g in DATA_GROUPS}
+    for name, info in index["channels"].items():
+        group = info.get("group")
+        if group is None:
+            root[name] = _map(info)
+        else:
+            groups[group][name.split(".", 1)[-1]] = _map(info)
+
+    n_samples = max(
+        (info["shape"][0] for info in index["channels"].values()), default=0
+    )
+    if "timestamps" not in root:
+        root["timestamps"] = LazyArray(
+            UniformTimebase(
+                n_samples, index["sample_rate"], index["time_origin"]
+            )
+        )
+
+    metadata = dict(index.get("metadata", {}))
+    metadata.update(
+        {
+            "source_file": str(run_dir),
+            "format": "raw",
+            "sample_rate": index["sample_rate"],
+            "time_origin": index["time_origin"],
+        }
+    )
+    data = ExperimentalData(
+        timestamps=root["timestamps"],
+        chsh_values=root.get("chsh_values", np.empty(0)),
+        metadata=metadata,
+        **groups,
+    )
+    if time_range is not None:
+        data = select_time_range(data, time_range)
+    return data
@@ -0,0 +1,107 @@
+"""
+Series Decimation Module
+
+This module reduces long time series to a bounded number of points for
+display. Unlike block averaging (``CHSHAnalyzer.decimate``), both methods
+keep actual samples, so spikes and excursions remain visible in plots.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, n_bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keep the minimum and maximum sample of each of ``n_bins`` index bins.
+
+    The envelope of the series is preserved exactly; the output has at most
+    ``2 * n_bins`` points in original order.
+
+    Parameters:
+    -----------
+    x, y : array
+        Sample positions and values
+    n_bins : int
+        Number of bins
+
+    Returns:
+    --------
+    tuple : (x, y) of the retained samples
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= 2 * n_bins:
+        return x, y
+
+    bin_size = n // n_bins
+    n_full = bin_size * n_bins
+    blocks = y[:n_full].reshape(n_bins, bin_size)
+    offsets = np.arange(n_bins) * bin_size
+    i_min = offsets + np.argmin(blocks, axis=1)
+    i_max = offsets + np.argmax(blocks, axis=1)
+
+    indices = np.sort(np.concatenate([i_min, i_max]))
+    if n_full < n:
+        tail = n_full + np.array(
+            [np.argmin(y[n_full:]), np.argmax(y[n_full:])]
+        )
+        indices = np.concatenate([indices, np.sort(tail)])
+    indices = indices[np.concatenate([[True], np.diff(indices) > 0])]
+
+    return x[indices], y[indices]
+
+
+def lttb_decimate(
+    x: np.ndarray, y: np.ndarray, n_out: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last samples and, from each of ``n_out - 2``
+    buckets in between, the sample forming the largest triangle with the
+    previously kept sample and the mean of the next bucket. The loop runs
+    over buckets; work inside each bucket is vectorized.
+
+    Parameters:
+    -----------
+    x, y : array
+        Sample positions and values
+    n_out : int
+        Number of output points (>= 3)
+
+    Returns:
+    --------
+    tuple : (x, y) of the retained samples
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    # Mean of each bucket, used as the third triangle vertex
+    sums_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    means_x = np.append(sums_x / counts, x[-1])
+    means_y = np.append(sums_y / counts, y[-1])
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        ax, ay = x[previous], y[previous]
+        cx, cy = means_x[bucket + 1], means_y[bucket + 1]
+        area = np.abs(
+            (ax - cx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy - ay)
+        )
+        previous = lo + int(np.argmax(area))
+        indices[bucket + 1] = previous
+
+    return x[indices], y[indices]
@@ -7,16 +7,16 @@ field correlations, and statistical validation.
 """
 
 import numpy as np
-import pandas as pd
-from scipy import stats, optimize, signal
-from scipy.special import erfc
-import matplotlib.pyplot as plt
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Any, Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass, field
 import warnings
 
 from .physics_validator import QuantumBoundsValidator, ValidationResult
 
+# Dense count layout: [window, setting, outcome]
+CHSH_SETTINGS = ("00", "01", "10", "11")
+COINCIDENCE_OUTCOMES = ("pp", "pm", "mp", "mm")
+
 
 @dataclass
 class ExperimentalData:
@@ -43,6 +43,15 @@ class AnalysisResults:
     plots: Dict[str, str] = field(default_factory=dict)
 
 
+def _is_sorted(values: np.ndarray, chunk_size: int = 1_000_000) -> bool:
+    """Check monotonic non-decreasing order without a full-size temporary."""
+    for lo in range(0, len(values) - 1, chunk_size):
+        chunk = values[lo : lo + chunk_size + 1]
+        if np.any(chunk[1:] < chunk[:-1]):
+            return False
+    return True
+
+
 class CHSHAnalyzer:
     """
     Analyzer for CHSH Bell test experimental data with environmental correlations.
@@ -107,36 +116,145 @@ class CHSHAnalyzer:
         --------
         dict : Correlation functions E(a,b)
         """
-        correlations = {}
+        present = []
+        stacked = []
 
-        # Standard CHSH analyzer settings
-        settings = ["00", "01", "10", "11"]
-
-        for setting in settings:
+        for setting in CHSH_SETTINGS:
             try:
                 # Coincidence counts for all four combinations (++, +-, -+, --)
-                N_pp = counts[f"AB_{setting}_pp"]  # Both detectors fire
-                N_pm = counts[f"AB_{setting}_pm"]  # A fires, B doesn't
-                N_mp = counts[f"AB_{setting}_mp"]  # A doesn't fire, B fires
-                N_mm = counts[f"AB_{setting}_mm"]  # Neither fires
+                stacked.append(
+                    [counts[f"AB_{setting}_{o}"] for o in COINCIDENCE_OUTCOMES]
+                )
+                present.append(setting)
+            except KeyError:
+                warnings.warn(f"Missing count data for setting {setting}")
 
-                # Calculate correlation: E = (N++ + N-- - N+- - N-+) / (N++ + N-- + N+- + N-+)
-                numerator = N_pp + N_mm - N_pm - N_mp
-                denominator = N_pp + N_mm + N_pm + N_mp
+        if not present:
+            return {}
 
-                # Avoid division by zero
-                mask = denominator > 0
-                E = np.zeros_like(numerator, dtype=float)
-                E[mask] = numerator[mask] / denominator[mask]
+        # (settings, outcomes, windows) -> (windows, settings, outcomes)
+        stacked = np.asarray(stacked)
+        window_shape = stacked.shape[2:]
+        count_array = np.moveaxis(
+            stacked.reshape(len(present), len(COINCIDENCE_OUTCOMES), -1), -1, 0
+        )
+        E, _, _ = self._correlation_kernel(count_array)
 
-                correlations[f"E_{setting}"] = E
+        return {
+            f"E_{setting}": E[:, i].reshape(window_shape)
+            for i, setting in enumerate(present)
+        }
 
-            except KeyError:
-                warnings.warn(f"Missing count data for setting {setting}")
+    def counts_to_array(self, counts: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Pack dict-style coincidence counts into the dense count layout.
+
+        Parameters:
+        -----------
+        counts : dict
+            Detection counts with keys 'AB_{setting}_{outcome}', e.g.
+            'AB_01_pm', for all four settings and outcomes
+
+        Returns:
+        --------
+        array : Integer counts of shape (n_windows, 4 settings, 4 outcomes),
+            settings ordered as CHSH_SETTINGS, outcomes as
+            COINCIDENCE_OUTCOMES
+        """
+        try:
+            columns = [
+                np.atleast_1d(counts[f"AB_{setting}_{outcome}"])
+                for setting in CHSH_SETTINGS
+                for outcome in COINCIDENCE_OUTCOMES
+            ]
+        except KeyError as e:
+            raise ValueError(f"Missing count data: {e}")
+
+        return np.stack(columns, axis=-1).reshape(-1, 4, 4).astype(np.int64)
+
+    def analyze_count_array(self, counts: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized CHSH analysis of coincidence counts for many windows.
+
+        All correlations E(a,b), the CHSH parameter S and their Poisson
+        uncertainties are computed in one pass; counts stay integer until
+        the final division.
+
+        Parameters:
+        -----------
+        counts : array
+            Integer counts of shape (n_windows, 4, 4) indexed as
+            [window, setting, outcome], settings ordered as CHSH_SETTINGS
+            ('00', '01', '10', '11') and outcomes as COINCIDENCE_OUTCOMES
+            ('pp', 'pm', 'mp', 'mm'). A single (4, 4) table is accepted.
+
+        Returns:
+        --------
+        dict : 'correlations' and 'correlation_errors' of shape
+            (n_windows, 4), 'chsh_values' and 'chsh_errors' of shape
+            (n_windows,), and 'coincidences' (total counts per setting)
+        """
+        counts = np.asarray(counts)
+        if counts.shape[-2:] != (4, 4):
+            raise ValueError(
+                f"Expected counts of shape (n_windows, 4, 4), got {counts.shape}"
+            )
+        if not np.issubdtype(counts.dtype, np.integer):
+            counts = counts.astype(np.int64)
+        counts = counts.reshape(-1, 4, 4)
 
-        return correlations
+        E, E_var, totals = self._correlation_kernel(counts)
 
-    def analyze_time_evolution(self, data: ExperimentalData) -> Dict:
+        # S = |E(a0,b0) - E(a0,b1)| + |E(a1,b0) + E(a1,b1)|
+        S = np.abs(E[:, 0] - E[:, 1]) + np.abs(E[:, 2] + E[:, 3])
+        S_err = np.sqrt(E_var.sum(axis=1))
+
+        return {
+            "correlations": E,
+            "correlation_errors": np.sqrt(E_var),
+            "chsh_values": S,
+            "chsh_errors": S_err,
+            "coincidences": totals,
+        }
+
+    @staticmethod
+    def _correlation_kernel(
+        counts: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Correlations and Poisson variances from a (..., outcomes) count array.
+
+        E = (N++ + N-- - N+- - N-+) / N and, for independent Poisson counts,
+        Var(E) = 4 N_same N_diff / N^3. Zero-count settings give E = 0 and
+        zero variance, as in the dict-based path.
+        """
+        if np.issubdtype(counts.dtype, np.integer):
+            counts = counts.astype(np.int64, copy=False)
+        same = counts[..., 0] + counts[..., 3]
+        diff = counts[..., 1] + counts[..., 2]
+        total = same + diff
+
+        mask = total > 0
+        total_f = total.astype(float)
+        E = np.divide(
+            same - diff, total_f, out=np.zeros(total.shape), where=mask
+        )
+        E_var = np.divide(
+            4.0 * (same * diff),
+            total_f**3,
+            out=np.zeros(total.shape),
+            where=mask,
+        )
+
+        return E, E_var, total
+
+    def analyze_time_evolution(
+        self,
+        data: ExperimentalData,
+        max_points: Optional[int] = None,
+        chunk_size: int = 1_000_000,
+        keep_smoothed: bool = True,
+    ) -> Dict:
         """
         Analyze time evolution of CHSH parameters.
 
@@ -144,6 +262,15 @@ class CHSHAnalyzer:
         -----------
         data : ExperimentalData
             Experimental data including timestamps and CHSH values
+        max_points : int, optional
+            Block-average the series down to at most this many points before
+            smoothing (multi-resolution view for very long runs)
+        chunk_size : int
+            Smoothing chunk length; the filter runs chunk by chunk with
+            overlap, so only one full-size smoothed copy is ever held
+        keep_smoothed : bool
+            Return the smoothed series; if False only the scalar results are
+            computed and no full-size smoothed copy is kept
 
         Returns:
         --------
@@ -151,30 +278,53 @@ class CHSHAnalyzer:
         """
         results = {}
 
-        # Sort by timestamp
-        sort_idx = np.argsort(data.timestamps)
-        times = data.timestamps[sort_idx]
-        chsh = data.chsh_values[sort_idx]
+        # Sort by timestamp, unless already sorted
+        times = np.asarray(data.timestamps)
+        chsh = np.asarray(data.chsh_values)
+        if not _is_sorted(times, chunk_size):
+            sort_idx = np.argsort(times, kind="stable")
+            times = times[sort_idx]
+            chsh = chsh[sort_idx]
+
+        decimation_factor = 1
+        if max_points is not None and len(chsh) > max_points:
+            decimation_factor = int(np.ceil(len(chsh) / max_points))
+            times = self.decimate(times, decimation_factor)
+            chsh = self.decimate(chsh, decimation_factor)
+
+        n = len(chsh)
+        window_size = self.smoothing_window(n)
+
+        # Initial slope region: points with t < t0 + 10% of the span
+        cutoff = times[0] + (times[-1] - times[0]) * 0.1
+        n_initial = max(int(np.searchsorted(times, cutoff, side="left")), 2)
+
+        chsh_smooth = np.empty(n) if keep_smoothed else None
+        initial_smooth = np.empty(min(n_initial, n))
+        max_idx, max_chsh = 0, -np.inf
+
+        for lo, smooth in self._savgol_chunks(chsh, window_size, chunk_size):
+            hi = lo + len(smooth)
+            if keep_smoothed:
+                chsh_smooth[lo:hi] = smooth
+            if lo < len(initial_smooth):
+                stop = min(hi, len(initial_smooth))
+                initial_smooth[lo:stop] = smooth[: stop - lo]
+
+            # Find maximum and time to maximum
+            chunk_max = int(np.argmax(smooth))
+            if smooth[chunk_max] > max_chsh:
+                max_idx, max_chsh = lo + chunk_max, smooth[chunk_max]
 
-        # Calculate running average
-        window_size = min(100, len(chsh) // 10)
-        chsh_smooth = signal.savgol_filter(chsh, window_size, 3)
-
-        # Find maximum and time to maximum
-        max_idx = np.argmax(chsh_smooth)
         max_time = times[max_idx]
-        max_chsh = chsh_smooth[max_idx]
-
-        # Calculate time derivatives
-        dt = np.diff(times)
-        dS_dt = np.diff(chsh_smooth) / dt
 
-        # Initial slope (enhancement rate)
-        initial_mask = times[1:] < times[0] + (times[-1] - times[0]) * 0.1
-        if np.any(initial_mask):
-            initial_slope = np.mean(dS_dt[initial_mask])
+        # Initial slope (enhancement rate) from the smoothed derivative
+        if n < 2:
+            initial_slope = np.nan
         else:
-            initial_slope = dS_dt[0]
+            k = len(initial_smooth)
+            dS_dt = np.diff(initial_smooth) / np.diff(times[:k])
+            initial_slope = np.mean(dS_dt) if k > 2 else dS_dt[0]
 
         results.update(
             {
@@ -184,16 +334,163 @@ class CHSHAnalyzer:
                 "times": times,
                 "chsh_smooth": chsh_smooth,
                 "enhancement_phase_duration": max_time,
+                "smoothing_window": window_size,
+                "decimation_factor": decimation_factor,
             }
         )
 
         return results
 
+    @staticmethod
+    def smoothing_window(n_points: int, polyorder: int = 3) -> int:
+        """
+        Savitzky–Golay window length for a series of ``n_points``.
+
+        Roughly a tenth of the series, capped at 101, always odd and longer
+        than ``polyorder``. Returns 0 when the series is too short to smooth.
+        """
+        window = min(101, max(n_points // 10, polyorder + 2))
+        window = min(window, n_points)
+        if window % 2 == 0:
+            window -= 1
+        return window if window > polyorder else 0
+
+    def smooth_series(
+        self,
+        values: np.ndarray,
+        window_length: Optional[int] = None,
+        polyorder: int = 3,
+        chunk_size: int = 1_000_000,
+    ) -> np.ndarray:
+        """
+        Savitzky–Golay smoothing evaluated in overlapping chunks.
+
+        Gives the same result as ``signal.savgol_filter`` on the full series
+        (mode='interp') while filtering at most ``chunk_size`` points plus
+        the window overlap at a time.
+
+        Parameters:
+        -----------
+        values : array
+            Series to smooth
+        window_length : int, optional
+            Filter window (default: :meth:`smoothing_window`)
+        polyorder : int
+            Polynomial order
+        chunk_size : int
+            Points filtered per chunk
+
+        Returns:
+        --------
+        array : Smoothed series
+        """
+        if window_length is None:
+            window_length = self.smoothing_window(len(values), polyorder)
+        out = np.empty(len(values))
+        for lo, smooth in self._savgol_chunks(
+            values, window_length, chunk_size, polyorder
+        ):
+            out[lo : lo + len(smooth)] = smooth
+        return out
+
+    @staticmethod
+    def _savgol_chunks(
+        values: np.ndarray,
+        window_length: int,
+        chunk_size: int,
+        polyorder: int = 3,
+    ):
+        """Yield (start, smoothed chunk) pairs covering ``values``."""
+        from scipy import signal
+
+        n = len(values)
+        if window_length <= polyorder:
+            for lo in range(0, n, chunk_size):
+                yield lo, np.asarray(values[lo : lo + chunk_size], dtype=float)
+            return
+
+        half = window_length // 2
+        chunk_size = max(chunk_size, window_length)
+        for lo in range(0, n, chunk_size):
+            hi = min(lo + chunk_size, n)
+            # Interior points only need +/- half neighbours to be exact;
+            # series edges keep savgol's polynomial edge fit
+            seg_lo = max(lo - half, 0)
+            seg_hi = min(hi + half, n)
+            if seg_hi - seg_lo < window_length:
+                seg_lo = max(min(seg_lo, n - window_length), 0)
+                seg_hi = min(seg_lo + window_length, n)
+            smooth = signal.savgol_filter(
+                values[seg_lo:seg_hi], window_length, polyorder
+            )
+            yield lo, smooth[lo - seg_lo : hi - seg_lo]
+
+    @staticmethod
+    def decimate(values: np.ndarray, factor: int) -> np.ndarray:
+        """
+        Block-average ``values`` by an integer ``factor``.
+
+        The trailing partial block is averaged on its own, so the result
+        has ceil(len / factor) points.
+        """
+        values = np.asarray(values, dtype=float)
+        if factor <= 1:
+            return values
+        n_full = len(values) // factor * factor
+        reduced = values[:n_full].reshape(-1, factor).mean(axis=1)
+        if n_full < len(values):
+            reduced = np.append(reduced, values[n_full:].mean())
+        return reduced
+
+    def multi_resolution_views(
+        self,
+        times: np.ndarray,
+        values: np.ndarray,
+        factor: int = 10,
+        min_points: int = 1000,
+    ) -> List[Dict[str, np.ndarray]]:
+        """
+        Build successively decimated views of a time series.
+
+        Each level is block-averaged from the previous one, so the whole
+        pyramid costs about 1/(factor - 1) of the original series.
+
+        Parameters:
+        -----------
+        times : array
+            Sorted timestamps
+        values : array
+            Series values
+        factor : int
+            Decimation factor between levels
+        min_points : int
+            Stop once a level would have fewer points than this
+
+        Returns:
+        --------
+        list : Views from finest to coarsest, each a dict with 'times',
+            'values' and cumulative 'decimation_factor'
+        """
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+
+        views = []
+        total = 1
+        while len(values) // factor >= min_points:
+            times = self.decimate(times, factor)
+            values = self.decimate(values, factor)
+            total *= factor
+            views.append(
+                {"times": times, "values": values, "decimation_factor": total}
+            )
+        return views
+
     def fit_amplification_law(
         self,
         times: np.ndarray,
         chsh_values: np.ndarray,
         field_variance: np.ndarray,
+        max_iterations: int = 5000,
     ) -> Dict:
         """
         Fit the theoretical amplification law to experimental data.
@@ -206,11 +503,15 @@ class CHSHAnalyzer:
             Measured CHSH parameter values
         field_variance : array
             Environmental field variance ⟨φ²⟩
+        max_iterations : int
+            Maximum number of model evaluations in the fit
 
         Returns:
         --------
         dict : Fit parameters and quality metrics
         """
+        from scipy import optimize
+
         # Amplification law: S(t) = S₀ * exp[α⟨φ²⟩t - β∫C(τ)dτ]
         # For short times: S(t) ≈ S₀ * (1 + α⟨φ²⟩t - βt/τ_c)
 
@@ -239,7 +540,7 @@ class CHSHAnalyzer:
                 chsh_values,
                 p0=initial_guess,
                 bounds=([1.0, 0, 0, 0], [4.0, 1.0, 1.0, np.max(times)]),
-                maxfev=5000,
+                maxfev=max_iterations,
             )
 
             S0_fit, alpha_fit, beta_fit, tau_c_fit = popt
@@ -305,6 +606,8 @@ class EnvironmentalCorrelationAnalyzer:
         --------
         array : Field variance ⟨φ²⟩
         """
+        import pandas as pd
+
         # Calculate running variance using pandas for efficiency
         field_series = pd.Series(field_data)
         rolling_var = field_series.rolling(
@@ -321,6 +624,7 @@ class EnvironmentalCorrelationAnalyzer:
         chsh_values: np.ndarray,
         field_variance: np.ndarray,
         method: str = "pearson",
+        alpha: float = 0.001,
     ) -> Dict:
         """
         Analyze correlation between CHSH parameter and field variance.
@@ -333,11 +637,15 @@ class EnvironmentalCorrelationAnalyzer:
             Environmental field variance
         method : str
             Correlation method ('pearson', 'spearman', 'kendall')
+        alpha : float
+            Significance level of the correlation test
 
         Returns:
         --------
         dict : Correlation analysis results
         """
+        from scipy import stats
+
         if method == "pearson":
             corr_coef, p_value = stats.pearsonr(chsh_values, field_variance)
         elif method == "spearman":
@@ -358,7 +666,6 @@ class EnvironmentalCorrelationAnalyzer:
             effect_size = "large"
 
         # Statistical significance
-        alpha = 0.001  # Significance level
         is_significant = p_value < alpha
 
         return {
@@ -392,6 +699,8 @@ class EnvironmentalCorrelationAnalyzer:
         --------
         dict : Lag correlation analysis results
         """
+        from scipy import stats
+
         lags = np.arange(-max_lag, max_lag + 1)
         correlations = []
 
@@ -455,6 +764,8 @@ class StatisticalValidator:
         --------
         dict : Statistical test results
         """
+        from scipy import stats
+
         tsirelson_bound = 2 * np.sqrt(2)
         classical_bound = 2.0
 
@@ -515,6 +826,8 @@ class StatisticalValidator:
         --------
         dict : Correlation test results
         """
+        from scipy import stats
+
         # Fisher z-transformation for significance testing
         z_score = 0.5 * np.log((1 + correlation_coef) / (1 - correlation_coef))
         standard_error = 1 / np.sqrt(n_samples - 3)
@@ -541,6 +854,127 @@ class StatisticalValidator:
             "n_samples": n_samples,
         }
 
+    def pooled_bell_test(
+        self,
+        sample_sizes: np.ndarray,
+        means: np.ndarray,
+        sum_squares: np.ndarray,
+    ) -> Dict:
+        """
+        Bell-inequality test on CHSH values pooled across runs.
+
+        Runs are merged from their summary moments, so the result equals a
+        t-test on the concatenated CHSH series without reloading it.
+
+        Parameters:
+        -----------
+        sample_sizes : array
+            Number of CHSH values per run
+        means : array
+            Mean CHSH value per run
+        sum_squares : array
+            Sum of squared deviations from the run mean, per run
+
+        Returns:
+        --------
+        dict : Pooled mean/std, p-values against the classical and
+        Tsirelson bounds, and between-run heterogeneity (one-way ANOVA)
+        """
+        from scipy import stats
+
+        n = np.asarray(sample_sizes, dtype=float)
+        means = np.asarray(means, dtype=float)
+        sum_squares = np.asarray(sum_squares, dtype=float)
+
+        n_total = n.sum()
+        mean = np.dot(n, means) / n_total
+        between = np.dot(n, (means - mean) ** 2)
+        within = sum_squares.sum()
+        std = np.sqrt((within + between) / n_total)
+        sem = np.sqrt((within + between) / (n_total - 1) / n_total)
+
+        p_classical = stats.t.sf((mean - 2.0) / sem, n_total - 1)
+        p_tsirelson = stats.t.sf((mean - 2 * np.sqrt(2)) / sem, n_total - 1)
+
+        # Between-run heterogeneity of the mean CHSH value
+        df_between = len(n) - 1
+        df_within = n_total - len(n)
+        if df_between > 0 and df_within > 0 and within > 0:
+            f_stat = (between / df_between) / (within / df_within)
+            p_heterogeneity = stats.f.sf(f_stat, df_between, df_within)
+        else:
+            f_stat, p_heterogeneity = 0.0, 1.0
+
+        return {
+            "n_runs": len(n),
+            "n_samples": int(n_total),
+            "mean_chsh": mean,
+            "std_chsh": std,
+            "sem_chsh": sem,
+            "classical_p_value": p_classical,
+            "classical_significant": p_classical < self.alpha,
+            "tsirelson_p_value": p_tsirelson,
+            "tsirelson_significant": p_tsirelson < self.alpha,
+            "heterogeneity_f": f_stat,
+            "heterogeneity_p_value": p_heterogeneity,
+        }
+
+    def correlation_meta_analysis(
+        self, correlations: np.ndarray, sample_sizes: np.ndarray
+    ) -> Dict:
+        """
+        Fixed-effect meta-analysis of per-run correlation coefficients.
+
+        Parameters:
+        -----------
+        correlations : array
+            Correlation coefficient per run
+        sample_sizes : array
+            Number of samples behind each coefficient
+
+        Returns:
+        --------
+        dict : Pooled correlation with confidence interval and p-value
+        (Fisher z, inverse-variance weights n - 3), plus Cochran's Q and
+        I² heterogeneity
+        """
+        from scipy import stats
+
+        r = np.clip(np.asarray(correlations, dtype=float), -0.999999, 0.999999)
+        n = np.asarray(sample_sizes, dtype=float)
+        valid = np.isfinite(r) & (n > 3)
+        r, n = r[valid], n[valid]
+        if len(r) == 0:
+            raise ValueError("No runs with a usable correlation estimate")
+
+        z = np.arctanh(r)
+        weights = n - 3
+        z_pooled = np.dot(weights, z) / weights.sum()
+        standard_error = 1 / np.sqrt(weights.sum())
+
+        z_stat = z_pooled / standard_error
+        p_value = 2 * stats.norm.sf(np.abs(z_stat))
+        z_critical = stats.norm.ppf(1 - self.alpha / 2)
+
+        q_stat = np.dot(weights, (z - z_pooled) ** 2)
+        df = len(r) - 1
+        i_squared = max(0.0, (q_stat - df) / q_stat) if q_stat > 0 else 0.0
+
+        return {
+            "correlation": np.tanh(z_pooled),
+            "confidence_interval": (
+                np.tanh(z_pooled - z_critical * standard_error),
+                np.tanh(z_pooled + z_critical * standard_error),
+            ),
+            "p_value": p_value,
+            "is_significant": p_value < self.alpha,
+            "n_runs": len(r),
+            "n_samples": int(n.sum()),
+            "cochran_q": q_stat,
+            "heterogeneity_p_value": stats.chi2.sf(q_stat, df) if df else 1.0,
+            "i_squared": i_squared,
+        }
+
     def power_analysis(
         self,
         effect_size: float,
@@ -563,6 +997,8 @@ class StatisticalValidator:
         --------
         dict : Power analysis results
         """
+        from scipy import stats
+
         if test_type == "correlation":
             # Power for correlation test
             z_alpha = stats.norm.ppf(1 - self.alpha / 2)
@@ -598,7 +1034,11 @@ class StatisticalValidator:
         }
 
 
-def comprehensive_analysis(data: ExperimentalData) -> AnalysisResults:
+def comprehensive_analysis(
+    data: ExperimentalData,
+    config: Optional[Dict] = None,
+    cache: Optional[Any] = None,
+) -> AnalysisResults:
     """
     Perform comprehensive analysis of experimental data.
 
@@ -606,42 +1046,94 @@ def comprehensive_analysis(data: ExperimentalData) -> AnalysisResults:
     -----------
     data : ExperimentalData
         Complete experimental dataset
+    config : dict, optional
+        Analysis configuration (as ``create_analysis_config`` in the analysis
+        script); defaults reproduce the unconfigured analysis
+    cache : ResultCache, optional
+        Stage cache. Each stage is keyed on the data content, its own
+        configuration section and the code version, so a config change
+        only recomputes the stages that depend on it.
 
     Returns:
     --------
     AnalysisResults : Complete analysis results
     """
+    config = config or {}
+    correlation_config = config.get("correlation_analysis", {})
+    fitting_config = config.get("amplification_fitting", {})
+    significance_level = correlation_config.get("significance_level", 0.001)
+
+    if cache is not None:
+        from .result_cache import cache_key, code_version, fingerprint_data
+
+        data_key = (code_version(), fingerprint_data(data))
+
+    def _stage(name, params, compute):
+        if cache is None:
+            return compute()
+        return cache.cached(cache_key(*data_key, name, params), compute)
+
     # Initialize analyzers
     chsh_analyzer = CHSHAnalyzer()
     env_analyzer = EnvironmentalCorrelationAnalyzer()
-    stat_validator = StatisticalValidator()
+    stat_validator = StatisticalValidator(alpha=significance_level)
 
     # Physics validation
-    validation_result = chsh_analyzer.validator.comprehensive_validation(
-        S=data.chsh_values
+    validation_result = _stage(
+        "validation",
+        None,
+        lambda: chsh_analyzer.validator.comprehensive_validation(
+            S=data.chsh_values
+        ),
     )
 
-    # Time evolution analysis
-    time_results = chsh_analyzer.analyze_time_evolution(data)
-
     # Environmental correlation
-    field_variance = env_analyzer.calculate_field_variance(
-        data.environmental_fields.get(
-            "magnetic_field", np.zeros_like(data.timestamps)
-        )
+    field_variance = _stage(
+        "field_variance",
+        None,
+        lambda: env_analyzer.calculate_field_variance(
+            data.environmental_fields.get(
+                "magnetic_field", np.zeros_like(data.timestamps)
+            )
+        ),
     )
 
-    correlation_results = env_analyzer.correlation_analysis(
-        data.chsh_values, field_variance
+    correlation_method = correlation_config.get("methods", ["pearson"])[0]
+    correlation_results = _stage(
+        "correlation",
+        [correlation_method, significance_level],
+        lambda: env_analyzer.correlation_analysis(
+            data.chsh_values,
+            field_variance,
+            method=correlation_method,
+            alpha=significance_level,
+        ),
     )
 
     # Amplification law fitting
-    fit_results = chsh_analyzer.fit_amplification_law(
-        data.timestamps, data.chsh_values, field_variance
-    )
+    if fitting_config.get("enable", True):
+        fit_results = _stage(
+            "amplification_fit",
+            fitting_config,
+            lambda: chsh_analyzer.fit_amplification_law(
+                data.timestamps,
+                data.chsh_values,
+                field_variance,
+                max_iterations=fitting_config.get("max_iterations", 5000),
+            ),
+        )
+    else:
+        fit_results = {
+            "fit_success": False,
+            "error_message": "Amplification fitting disabled",
+        }
 
     # Statistical tests
-    bell_test_results = stat_validator.bell_inequality_test(data.chsh_values)
+    bell_test_results = _stage(
+        "bell_test",
+        significance_level,
+        lambda: stat_validator.bell_inequality_test(data.chsh_values),
+    )
 
     # Compile results
     results = AnalysisResults(
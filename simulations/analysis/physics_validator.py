@@ -8,11 +8,14 @@ physical principles.
 
 import numpy as np
 import warnings
-from typing import Union, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Union, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from ..core.field_simulator import PhysicalConstants
 
+if TYPE_CHECKING:
+    from .streaming_validator import OnlineDriftDetector, StreamingCountValidator
+
 
 @dataclass
 class ValidationResult:
@@ -364,6 +367,198 @@ class QuantumBoundsValidator:
             bounds_checked=bounds_checked,
         )
 
+    def check_bounds(
+        self,
+        S: Optional[Union[float, np.ndarray]] = None,
+        correlations: Optional[Dict[str, Union[float, np.ndarray]]] = None,
+        probabilities: Optional[np.ndarray] = None,
+        amplification: Optional[Union[float, np.ndarray]] = None,
+        fast_fail: bool = False,
+    ) -> ValidationResult:
+        """
+        Fused single-pass check of all quantum bounds.
+
+        Each quantity is reduced once to its extrema (and, for probabilities,
+        its sum); every bound is then decided from those scalars. Messages are
+        only formatted for bounds that actually fail.
+
+        Parameters:
+        -----------
+        S : float or array, optional
+            CHSH parameter values (classical, Tsirelson and range checks)
+        correlations : dict, optional
+            Correlation functions E(a,b), scalars or arrays
+        probabilities : array, optional
+            Probability distribution (positivity, normalization, upper bound)
+        amplification : float or array, optional
+            Amplification factors
+        fast_fail : bool
+            Stop at the first violated bound and skip warnings. Intended for
+            inner loops that only need ``is_valid``.
+
+        Returns:
+        --------
+        ValidationResult : Validation results with prefixed bound names
+            matching :meth:`comprehensive_validation`
+        """
+        violations = []
+        warnings_list = []
+        bounds_checked = {}
+
+        def _result() -> ValidationResult:
+            return ValidationResult(
+                is_valid=len(violations) == 0,
+                violations=violations,
+                warnings=warnings_list,
+                bounds_checked=bounds_checked,
+            )
+
+        if S is not None:
+            s_min, s_max = _extrema(S)
+
+            ok = not s_max > self.tsirelson_bound + self.tolerance
+            bounds_checked["chsh_tsirelson"] = ok
+            if not ok:
+                violations.append(
+                    f"Tsirelson bound violated: max S = {s_max:.6f}, "
+                    f"violation = {s_max - self.tsirelson_bound:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+            advantage = s_max > self.classical_bound + self.tolerance
+            bounds_checked["chsh_quantum_advantage"] = advantage
+            if not advantage and not fast_fail:
+                warnings_list.append("No quantum advantage detected (S ≤ 2)")
+
+            ok = not s_min < 0
+            bounds_checked["chsh_positivity"] = ok
+            if not ok:
+                violations.append("Non-physical negative CHSH values detected")
+                if fast_fail:
+                    return _result()
+
+            ok = not s_max > 4.0
+            bounds_checked["chsh_physical_range"] = ok
+            if not ok:
+                violations.append(
+                    f"Unphysically large CHSH values detected: max = {s_max:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+        if correlations is not None:
+            values = [np.ravel(E) for E in correlations.values()]
+            abs_E = np.abs(np.concatenate(values)) if values else np.empty(0)
+            _, abs_max = _extrema(abs_E)
+
+            ok = abs_max <= 1 + self.tolerance
+            bounds_checked["corr_correlation_bounds"] = ok
+            if not ok:
+                for key, E in correlations.items():
+                    for value in np.ravel(E):
+                        if not abs(value) <= 1 + self.tolerance:
+                            violations.append(
+                                f"Correlation {key} = {value:.6f} "
+                                "outside physical bounds [-1, 1]"
+                            )
+                if fast_fail:
+                    return _result()
+
+            closest, _ = _extrema(np.abs(abs_E - 1.0))
+            realistic = not closest < self.tolerance
+            bounds_checked["corr_realistic_correlations"] = realistic
+            if not realistic and not fast_fail:
+                perfect = [
+                    key
+                    for key, E in correlations.items()
+                    if np.any(np.abs(np.abs(E) - 1.0) < self.tolerance)
+                ]
+                warnings_list.append(
+                    f"Perfect correlations detected: {perfect}"
+                )
+
+        if probabilities is not None:
+            p_min, p_max = _extrema(probabilities)
+            p_sum = float(np.sum(probabilities))
+
+            ok = p_min >= -self.tolerance
+            bounds_checked["prob_positivity"] = ok
+            if not ok:
+                violations.append(
+                    f"Negative probabilities detected: min = {p_min:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+            ok = abs(p_sum - 1.0) < self.tolerance
+            bounds_checked["prob_normalization"] = ok
+            if not ok:
+                violations.append(
+                    f"Probabilities not normalized: sum = {p_sum:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+            ok = p_max <= 1 + self.tolerance
+            bounds_checked["prob_probability_bounds"] = ok
+            if not ok:
+                violations.append(
+                    f"Probabilities > 1 detected: max = {p_max:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+        if amplification is not None:
+            a_min, a_max = _extrema(amplification)
+
+            ok = a_min >= 1.0 - self.tolerance
+            bounds_checked["amp_amplification_positive"] = ok
+            if not ok:
+                violations.append(
+                    f"Suppression detected (a < 1): min a = {a_min:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+            reasonable = a_max <= 1.5
+            bounds_checked["amp_reasonable_amplification"] = reasonable
+            if not reasonable and not fast_fail:
+                warnings_list.append(
+                    f"Large amplification detected: max a = {a_max:.6f}"
+                )
+
+            ok = not a_max > 2.0
+            bounds_checked["amp_extreme_amplification"] = ok
+            if not ok:
+                violations.append(
+                    f"Extreme amplification detected: max a = {a_max:.6f}"
+                )
+                if fast_fail:
+                    return _result()
+
+        return _result()
+
+    def is_physical(
+        self,
+        S: Optional[Union[float, np.ndarray]] = None,
+        correlations: Optional[Dict[str, Union[float, np.ndarray]]] = None,
+        probabilities: Optional[np.ndarray] = None,
+        amplification: Optional[Union[float, np.ndarray]] = None,
+    ) -> bool:
+        """
+        Fast-fail bounds check returning only a boolean.
+
+        See :meth:`check_bounds` for the parameters.
+        """
+        return self.check_bounds(
+            S=S,
+            correlations=correlations,
+            probabilities=probabilities,
+            amplification=amplification,
+            fast_fail=True,
+        ).is_valid
+
     def comprehensive_validation(
         self,
         S: Union[float, np.ndarray],
@@ -389,56 +584,37 @@ class QuantumBoundsValidator:
         --------
         ValidationResult : Combined validation results
         """
-        all_violations = []
-        all_warnings = []
-        all_bounds_checked = {}
-
-        # Validate CHSH parameter
-        chsh_result = self.validate_chsh_parameter(S)
-        all_violations.extend(chsh_result.violations)
-        all_warnings.extend(chsh_result.warnings)
-        all_bounds_checked.update(
-            {f"chsh_{k}": v for k, v in chsh_result.bounds_checked.items()}
+        result = self.check_bounds(
+            S=S, correlations=correlations, amplification=amplification
         )
 
-        # Validate correlations if provided
-        if correlations is not None:
-            corr_result = self.validate_correlations(correlations)
-            all_violations.extend(corr_result.violations)
-            all_warnings.extend(corr_result.warnings)
-            all_bounds_checked.update(
-                {f"corr_{k}": v for k, v in corr_result.bounds_checked.items()}
-            )
-
-        # Validate amplification if provided
-        if amplification is not None:
-            amp_result = self.validate_amplification_factor(amplification)
-            all_violations.extend(amp_result.violations)
-            all_warnings.extend(amp_result.warnings)
-            all_bounds_checked.update(
-                {f"amp_{k}": v for k, v in amp_result.bounds_checked.items()}
-            )
-
-        # Validate field parameters if provided
+        # Field parameters are scalars; no array pass to fuse
         if field_params is not None:
             field_result = self.validate_field_parameters(**field_params)
-            all_violations.extend(field_result.violations)
-            all_warnings.extend(field_result.warnings)
-            all_bounds_checked.update(
+            result.violations.extend(field_result.violations)
+            result.warnings.extend(field_result.warnings)
+            result.bounds_checked.update(
                 {
                     f"field_{k}": v
                     for k, v in field_result.bounds_checked.items()
                 }
             )
+            result.is_valid = len(result.violations) == 0
 
-        is_valid = len(all_violations) == 0
+        return result
 
-        return ValidationResult(
-            is_valid=is_valid,
-            violations=all_violations,
-            warnings=all_warnings,
-            bounds_checked=all_bounds_checked,
-        )
+
+def _extrema(values: Union[float, np.ndarray]) -> Tuple[float, float]:
+    """
+    Return (min, max) of ``values`` as Python floats.
+
+    Empty input yields (+inf, -inf) so that bound comparisons reproduce the
+    vacuous truth of ``np.all``/``np.any`` on empty arrays.
+    """
+    arr = np.asarray(values, dtype=float)
+    if arr.size == 0:
+        return np.inf, -np.inf
+    return float(np.min(arr)), float(np.max(arr))
 
 
 class ExperimentalValidator:
@@ -577,6 +753,61 @@ class ExperimentalValidator:
             bounds_checked=bounds_checked,
         )
 
+    def create_drift_monitor(self, **kwargs) -> "OnlineDriftDetector":
+        """
+        Create an online counterpart of :meth:`detect_systematic_drifts`.
+
+        The returned detector consumes data block by block during acquisition
+        and raises events as soon as drifts or step changes exceed thresholds.
+
+        Parameters:
+        -----------
+        **kwargs
+            Forwarded to ``OnlineDriftDetector``
+
+        Returns:
+        --------
+        OnlineDriftDetector : Streaming drift detector
+        """
+        from .streaming_validator import OnlineDriftDetector
+
+        return OnlineDriftDetector(**kwargs)
+
+    def create_count_monitor(
+        self,
+        detectors: List[str],
+        expected_rate: float,
+        measurement_time: float,
+        **kwargs,
+    ) -> "StreamingCountValidator":
+        """
+        Create an online counterpart of :meth:`validate_count_statistics`.
+
+        The returned validator keeps running moments per detector and runs a
+        windowed chi-square dispersion test on every DAQ block, without
+        storing the raw counts.
+
+        Parameters:
+        -----------
+        detectors : list of str
+            Detector names
+        expected_rate : float
+            Expected count rate (Hz)
+        measurement_time : float
+            Integration time per measurement (s)
+        **kwargs
+            Forwarded to ``StreamingCountValidator``
+
+        Returns:
+        --------
+        StreamingCountValidator : Streaming count statistics validator
+        """
+        from .streaming_validator import StreamingCountValidator
+
+        return StreamingCountValidator(
+            detectors, expected_rate, measurement_time, **kwargs
+        )
+
 
 def validate_simulation_results(simulation_results: Dict) -> ValidationResult:
     """
@@ -0,0 +1,464 @@
+"""
+Report Builder Module
+
+This module assembles HTML analysis reports from independently cached
+sections. Each section is re-rendered only when the key describing its
+inputs changes; unchanged sections are reused from their stored fragments,
+so refreshing a report during a long run costs only the changed parts.
+Figures are embedded as compact inline SVG built from decimated data
+instead of full-resolution images.
+"""
+
+import hashlib
+import html
+import json
+import os
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .decimation import minmax_decimate
+
+PAGE_TEMPLATE = Template(
+    """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>$title</title>
+    $refresh
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { text-align: center; color: #2c3e50; }
+        .section { margin: 30px 0; }
+        .plot { text-align: center; margin: 20px 0; }
+        .plot svg { max-width: 100%; height: auto; }
+        .summary { background-color: #f8f9fa; padding: 20px; border-radius: 5px; }
+        .validation-pass { color: #27ae60; }
+        .validation-fail { color: #e74c3c; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Environmental Quantum Field Effects</h1>
+        <h2>$title</h2>
+        <p>Generated: $generated$status</p>
+    </div>
+$sections
+</body>
+</html>
+"""
+)
+
+SECTION_TEMPLATE = Template(
+    """
+    <div class="section" id="$name">
+        <h3>$title</h3>
+$body
+    </div>
+"""
+)
+
+# Colour cycle for multi-series charts
+SERIES_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#9467bd", "#8c564b")
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _key_digest(key: Any) -> str:
+    payload = json.dumps(key, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ReportBuilder:
+    """
+    Incremental HTML report made of named sections.
+
+    Section fragments and their input keys are stored next to the page
+    (``sections/`` and ``report_state.json``), so a later builder on the
+    same directory (a repeated analysis or a live-refresh loop) only
+    re-renders sections whose key changed.
+    """
+
+    STATE_FILE = "report_state.json"
+    SECTIONS_DIR = "sections"
+
+    def __init__(
+        self,
+        report_dir: Union[str, Path],
+        title: str = "Experimental Data Analysis Report",
+        html_name: str = "analysis_report.html",
+        refresh_interval: Optional[float] = None,
+    ):
+        """
+        Initialize report builder.
+
+        Parameters:
+        -----------
+        report_dir : str or Path
+            Report directory (created if missing)
+        title : str
+            Report title
+        html_name : str
+            File name of the assembled page
+        refresh_interval : float, optional
+            Live mode: the page asks the browser to reload every
+            ``refresh_interval`` seconds until :meth:`finalize` is called
+        """
+        self.report_dir = Path(report_dir)
+        self.sections_dir = self.report_dir / self.SECTIONS_DIR
+        self.sections_dir.mkdir(parents=True, exist_ok=True)
+        self.html_file = self.report_dir / html_name
+        self.title = title
+        self.refresh_interval = refresh_interval
+        self.regenerated: List[str] = []
+
+        state_file = self.report_dir / self.STATE_FILE
+        try:
+            self._state = json.loads(state_file.read_text())
+        except (OSError, ValueError):
+            self._state = {"order": [], "keys": {}, "titles": {}}
+        self._dirty = False
+
+    def _fragment_path(self, name: str) -> Path:
+        return self.sections_dir / f"{name}.html"
+
+    def section(
+        self, name: str, title: str, key: Any, render: Callable[[], str]
+    ) -> bool:
+        """
+        Add or update a section.
+
+        Parameters:
+        -----------
+        name : str
+            Section identifier (also the HTML element id)
+        title : str
+            Section heading
+        key : JSON-serializable
+            Description of the section's inputs; ``render`` is only called
+            when it differs from the stored key
+        render : callable
+            Returns the section body HTML
+
+        Returns:
+        --------
+        bool : True if the section was (re-)rendered
+        """
+        digest = _key_digest([title, key])
+        fragment = self._fragment_path(name)
+        if name not in self._state["order"]:
+            self._state["order"].append(name)
+            self._dirty = True
+        elif self._state["keys"].get(name) == digest and fragment.exists():
+            return False
+
+        _atomic_write(fragment, render())
+        self._state["keys"][name] = digest
+        self._state["titles"][name] = title
+        self.regenerated.append(name)
+        self._dirty = True
+        return True
+
+    def remove_section(self, name: str) -> None:
+        """Drop a section from the report."""
+        if name in self._state["order"]:
+            self._state["order"].remove(name)
+            self._state["keys"].pop(name, None)
+            self._state["titles"].pop(name, None)
+            self._fragment_path(name).unlink(missing_ok=True)
+            self._dirty = True
+
+    def write(self, force: bool = False) -> Path:
+        """
+        Assemble the page from the section fragments.
+
+        Only rewrites the page if a section changed since the last write
+        (or ``force`` is set).
+
+        Returns:
+        --------
+        Path : Report page
+        """
+        if not (self._dirty or force or not self.html_file.exists()):
+            return self.html_file
+
+        sections = "".join(
+            SECTION_TEMPLATE.substitute(
+                name=name,
+                title=html.escape(self._state["titles"][name]),
+                body=self._fragment_path(name).read_text(encoding="utf-8"),
+            )
+            for name in self._state["order"]
+        )
+        live = self.refresh_interval is not None
+        page = PAGE_TEMPLATE.substitute(
+            title=html.escape(self.title),
+            refresh=(
+                f'<meta http-equiv="refresh" content="{self.refresh_interval:g}">'
+                if live
+                else ""
+            ),
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            status=" (live, updating)" if live else "",
+            sections=sections,
+        )
+        _atomic_write(self.html_file, page)
+        _atomic_write(
+            self.report_dir / self.STATE_FILE, json.dumps(self._state)
+        )
+        self._dirty = False
+        self.regenerated = []
+        return self.html_file
+
+    def finalize(self) -> Path:
+        """Write the page without live refresh (end of a live run)."""
+        self.refresh_interval = None
+        return self.write(force=True)
+
+
+def _scale(values: np.ndarray, lo: float, hi: float, size: float) -> np.ndarray:
+    span = hi - lo if hi > lo else 1.0
+    return (np.asarray(values, dtype=float) - lo) / span * size
+
+
+def _axis_range(arrays: Sequence[np.ndarray], extra=()) -> Tuple[float, float]:
+    """Padded (low, high) covering all finite values and ``extra``."""
+    values = [np.asarray(a, dtype=float) for a in arrays]
+    values = [v[np.isfinite(v)] for v in values]
+    lows = [float(v.min()) for v in values if len(v)] + list(extra)
+    highs = [float(v.max()) for v in values if len(v)] + list(extra)
+    if not lows:
+        return 0.0, 1.0
+    lo, hi = min(lows), max(highs)
+    pad = 0.05 * (hi - lo) if hi > lo else 0.5
+    return lo - pad, hi + pad
+
+
+def _svg_frame(
+    width: int,
+    height: int,
+    margin: int,
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+    x_label: str,
+    y_label: str,
+    content: List[str],
+) -> str:
+    plot_w, plot_h = width - 2 * margin, height - 2 * margin
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}" '
+        'font-family="Arial" font-size="11">',
+        f'<rect x="{margin}" y="{margin}" width="{plot_w}" '
+        f'height="{plot_h}" fill="none" stroke="#888"/>',
+        f'<g transform="translate({margin},{margin + plot_h}) scale(1,-1)">',
+        *content,
+        "</g>",
+        f'<text x="{margin}" y="{height - 8}">{x_range[0]:.4g}</text>',
+        f'<text x="{width - margin}" y="{height - 8}" '
+        f'text-anchor="end">{x_range[1]:.4g}</text>',
+        f'<text x="{width / 2:.0f}" y="{height - 8}" '
+        f'text-anchor="middle">{html.escape(x_label)}</text>',
+        f'<text x="4" y="{margin + plot_h}">{y_range[0]:.4g}</text>',
+        f'<text x="4" y="{margin - 4}">{y_range[1]:.4g}</text>',
+        f'<text x="{width / 2:.0f}" y="14" '
+        f'text-anchor="middle">{html.escape(y_label)}</text>',
+        "</svg>",
+    ]
+    return "\n".join(parts)
+
+
+def _hline(y: float, y_range, plot_w, plot_h, color: str, label: str) -> str:
+    yy = _scale([y], *y_range, plot_h)[0]
+    return (
+        f'<line x1="0" x2="{plot_w}" y1="{yy:.1f}" y2="{yy:.1f}" '
+        f'stroke="{color}" stroke-dasharray="4,3">'
+        f"<title>{html.escape(label)}</title></line>"
+    )
+
+
+def svg_line_chart(
+    series: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    reference_lines: Optional[Dict[str, Tuple[float, str]]] = None,
+    x_label: str = "",
+    y_label: str = "",
+    max_points: int = 1000,
+    width: int = 800,
+    height: int = 260,
+) -> str:
+    """
+    Inline SVG line chart of one or more (x, y) series.
+
+    Each series is min/max decimated to about ``max_points`` points, so
+    the markup stays a few tens of kB regardless of series length.
+
+    Parameters:
+    -----------
+    series : dict
+        Label -> (x, y)
+    reference_lines : dict, optional
+        Label -> (y value, colour) for horizontal reference lines
+    x_label, y_label : str
+        Axis labels
+    max_points : int
+        Approximate points per series
+    width, height : int
+        Image size in pixels
+
+    Returns:
+    --------
+    str : SVG markup
+    """
+    margin = 40
+    plot_w, plot_h = width - 2 * margin, height - 2 * margin
+    reference_lines = reference_lines or {}
+    decimated = {
+        label: minmax_decimate(
+            np.asarray(x, dtype=float),
+            np.asarray(y, dtype=float),
+            max(max_points // 2, 1),
+        )
+        for label, (x, y) in series.items()
+    }
+    x_range = _axis_range([x for x, _ in decimated.values()])
+    y_range = _axis_range(
+        [y for _, y in decimated.values()],
+        tuple(value for value, _ in reference_lines.values()),
+    )
+
+    content = [
+        _hline(value, y_range, plot_w, plot_h, color, label)
+        for label, (value, color) in reference_lines.items()
+    ]
+    for (label, (x, y)), color in zip(decimated.items(), SERIES_COLORS * 4):
+        xs = _scale(x, *x_range, plot_w)
+        ys = _scale(y, *y_range, plot_h)
+        points = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(xs, ys))
+        content.append(
+            f'<polyline fill="none" stroke="{color}" stroke-width="1" '
+            f'points="{points}"><title>{html.escape(label)}</title></polyline>'
+        )
+    return _svg_frame(
+        width, height, margin, x_range, y_range, x_label, y_label, content
+    )
+
+
+def svg_scatter(
+    x: np.ndarray,
+    y: np.ndarray,
+    fit: Optional[Sequence[float]] = None,
+    x_label: str = "",
+    y_label: str = "",
+    max_points: int = 500,
+    width: int = 600,
+    height: int = 360,
+) -> str:
+    """
+    Inline SVG scatter plot of a uniform subsample, with optional fit line.
+
+    Parameters:
+    -----------
+    x, y : array
+        Points
+    fit : sequence, optional
+        (slope, intercept) of a line to overlay
+    x_label, y_label : str
+        Axis labels
+    max_points : int
+        Maximum plotted points
+    width, height : int
+        Image size in pixels
+
+    Returns:
+    --------
+    str : SVG markup
+    """
+    margin = 40
+    plot_w, plot_h = width - 2 * margin, height - 2 * margin
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    stride = max(len(x) // max_points, 1)
+    x, y = x[::stride], y[::stride]
+    x_range = _axis_range([x])
+    y_range = _axis_range([y])
+
+    xs = _scale(x, *x_range, plot_w)
+    ys = _scale(y, *y_range, plot_h)
+    content = [
+        f'<circle cx="{a:.1f}" cy="{b:.1f}" r="2" fill="{SERIES_COLORS[0]}" '
+        'fill-opacity="0.6"/>'
+        for a, b in zip(xs, ys)
+    ]
+    if fit is not None and len(fit) == 2 and np.all(np.isfinite(fit)):
+        fx = np.array(x_range)
+        fy = _scale(fit[0] * fx + fit[1], *y_range, plot_h)
+        content.append(
+            f'<line x1="0" x2="{plot_w}" y1="{fy[0]:.1f}" y2="{fy[1]:.1f}" '
+            'stroke="#d62728" stroke-dasharray="6,3"/>'
+        )
+    return _svg_frame(
+        width, height, margin, x_range, y_range, x_label, y_label, content
+    )
+
+
+def svg_histogram(
+    counts: np.ndarray,
+    edges: np.ndarray,
+    reference_lines: Optional[Dict[str, Tuple[float, str]]] = None,
+    x_label: str = "",
+    width: int = 400,
+    height: int = 260,
+) -> str:
+    """
+    Inline SVG histogram from precomputed bin counts.
+
+    Parameters:
+    -----------
+    counts : array
+        Counts per bin
+    edges : array
+        Bin edges (``len(counts) + 1``)
+    reference_lines : dict, optional
+        Label -> (x value, colour) for vertical reference lines
+    x_label : str
+        Axis label
+    width, height : int
+        Image size in pixels
+
+    Returns:
+    --------
+    str : SVG markup
+    """
+    margin = 40
+    plot_w, plot_h = width - 2 * margin, height - 2 * margin
+    counts = np.asarray(counts, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+    reference_lines = reference_lines or {}
+    marks = [value for value, _ in reference_lines.values()]
+    x_range = (min([edges[0], *marks]), max([edges[-1], *marks]))
+    y_range = (0.0, float(counts.max()) if len(counts) and counts.max() else 1.0)
+
+    left = _scale(edges[:-1], *x_range, plot_w)
+    right = _scale(edges[1:], *x_range, plot_w)
+    heights = _scale(counts, *y_range, plot_h)
+    content = [
+        f'<rect x="{a:.1f}" y="0" width="{max(b - a, 0.5):.1f}" '
+        f'height="{h:.1f}" fill="{SERIES_COLORS[0]}" fill-opacity="0.7"/>'
+        for a, b, h in zip(left, right, heights)
+    ]
+    for label, (value, color) in reference_lines.items():
+        xx = _scale([value], *x_range, plot_w)[0]
+        content.append(
+            f'<line x1="{xx:.1f}" x2="{xx:.1f}" y1="0" y2="{plot_h}" '
+            f'stroke="{color}" stroke-dasharray="4,3">'
+            f"<title>{html.escape(label)}</title></line>"
+        )
+    return _svg_frame(
+        width, height, margin, x_range, y_range, x_label, "count", content
+    )
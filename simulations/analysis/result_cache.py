@@ -0,0 +1,314 @@
+"""
+Result Cache Module
+
+This module implements a content-addressed on-disk cache for analysis
+stages. Entries are keyed by a hash of the input data, the stage's
+configuration and the analysis code version, so unchanged inputs are
+never recomputed and any code or config change invalidates exactly the
+stages it touches. Entries are stored as JSON plus a NumPy ``.npz`` for
+array payloads (no pickle) and evicted least-recently-used by size.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from .experimental_analysis import AnalysisResults, ExperimentalData
+from .physics_validator import ValidationResult
+
+# Dataclasses that may appear in cached stage outputs
+CACHEABLE_TYPES = {
+    cls.__name__: cls
+    for cls in (AnalysisResults, ExperimentalData, ValidationResult)
+}
+
+_ANALYSIS_SOURCES = (
+    "experimental_analysis.py",
+    "physics_validator.py",
+    "result_cache.py",
+)
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """
+    Hash of the analysis module sources.
+
+    Any edit to the analysis code changes the version and therefore every
+    cache key, so stale results are never served after an upgrade.
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for name in _ANALYSIS_SOURCES:
+            digest.update((Path(__file__).parent / name).read_bytes())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def fingerprint_array(
+    values: Any, digest=None, block_size: int = 1 << 24
+) -> str:
+    """
+    Content hash of an array (dtype, shape and data).
+
+    Large or lazily loaded arrays are hashed block by block, so the hash
+    never needs a second full-size copy in memory.
+    """
+    digest = digest or hashlib.blake2b(digest_size=20)
+    dtype = np.dtype(values.dtype) if hasattr(values, "dtype") else None
+    if dtype is None:
+        values = np.asarray(values)
+        dtype = values.dtype
+    digest.update(f"{dtype.str}{tuple(values.shape)}".encode())
+
+    step = max(1, block_size // max(dtype.itemsize, 1))
+    for start in range(0, len(values), step):
+        block = np.ascontiguousarray(values[start : start + step])
+        digest.update(memoryview(block).cast("B"))
+    return digest.hexdigest()
+
+
+def fingerprint_data(data: ExperimentalData) -> str:
+    """
+    Content hash of experimental data (all arrays plus metadata).
+
+    Parameters:
+    -----------
+    data : ExperimentalData
+        Experimental data
+
+    Returns:
+    --------
+    str : Hex digest identifying the data content
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    fingerprint_array(data.timestamps, digest)
+    fingerprint_array(data.chsh_values, digest)
+    for group in (
+        "correlations",
+        "environmental_fields",
+        "detector_counts",
+        "analyzer_settings",
+    ):
+        for key in sorted(getattr(data, group)):
+            digest.update(f"{group}/{key}".encode())
+            fingerprint_array(getattr(data, group)[key], digest)
+    metadata = {
+        k: v
+        for k, v in data.metadata.items()
+        if k not in ("source_file", "format")
+    }
+    digest.update(json.dumps(metadata, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    """Hash of JSON-serializable key parts (order-sensitive)."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _encode(value: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Convert a stage output to JSON, moving arrays into ``arrays``."""
+    if isinstance(value, np.ndarray) or (
+        hasattr(value, "__array__") and not isinstance(value, np.generic)
+    ):
+        name = f"a{len(arrays)}"
+        arrays[name] = np.asarray(value)
+        return {"__array__": name}
+    if isinstance(value, (bytes, bytearray)):
+        name = f"a{len(arrays)}"
+        arrays[name] = np.frombuffer(bytes(value), dtype=np.uint8)
+        return {"__bytes__": name}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        type_name = type(value).__name__
+        if type_name not in CACHEABLE_TYPES:
+            raise TypeError(f"Cannot cache dataclass {type_name}")
+        return {
+            "__dataclass__": type_name,
+            "fields": {
+                f.name: _encode(getattr(value, f.name), arrays)
+                for f in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value):
+            return {
+                "__dict__": {k: _encode(v, arrays) for k, v in value.items()}
+            }
+        raise TypeError("Cached dicts must have string keys")
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v, arrays) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v, arrays) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode(value: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Inverse of :func:`_encode`."""
+    if isinstance(value, list):
+        return [_decode(v, arrays) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__array__" in value:
+        return arrays[value["__array__"]]
+    if "__bytes__" in value:
+        return arrays[value["__bytes__"]].tobytes()
+    if "__dataclass__" in value:
+        cls = CACHEABLE_TYPES[value["__dataclass__"]]
+        return cls(
+            **{k: _decode(v, arrays) for k, v in value["fields"].items()}
+        )
+    if "__tuple__" in value:
+        return tuple(_decode(v, arrays) for v in value["__tuple__"])
+    return {k: _decode(v, arrays) for k, v in value["__dict__"].items()}
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache with LRU size-based eviction.
+
+    Each entry is ``<key>.json`` (structure) plus an optional
+    ``<key>.npz`` (arrays). Reads refresh the entry's modification time,
+    which is used as the LRU clock when the cache exceeds its size limit.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int = 1 << 30,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize result cache.
+
+        Parameters:
+        -----------
+        cache_dir : str or Path
+            Cache directory (created if missing)
+        max_bytes : int
+            Total size limit for all entries
+        max_entries : int, optional
+            Entry count limit
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.npz"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default``."""
+        json_path, npz_path = self._paths(key)
+        try:
+            with open(json_path, "r") as f:
+                entry = json.load(f)
+            arrays = {}
+            if entry.get("has_arrays"):
+                with np.load(npz_path, allow_pickle=False) as npz:
+                    arrays = {name: npz[name] for name in npz.files}
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return default
+
+        os.utime(json_path)
+        self.hits += 1
+        return _decode(entry["value"], arrays)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` and enforce the size limits."""
+        arrays: Dict[str, np.ndarray] = {}
+        entry = {"value": _encode(value, arrays), "has_arrays": bool(arrays)}
+        json_path, npz_path = self._paths(key)
+
+        if arrays:
+            tmp_npz = npz_path.with_name(f"{key}.tmp.npz")
+            np.savez(tmp_npz, **arrays)
+            tmp_npz.replace(npz_path)
+        tmp_json = json_path.with_suffix(".tmp")
+        with open(tmp_json, "w") as f:
+            json.dump(entry, f)
+        tmp_json.replace(json_path)
+
+        self.evict()
+
+    def cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _entries(self):
+        entries = []
+        for json_path in self.cache_dir.glob("*.json"):
+            npz_path = json_path.with_suffix(".npz")
+            try:
+                size = json_path.stat().st_size
+                last_used = json_path.stat().st_mtime
+                if npz_path.exists():
+                    size += npz_path.stat().st_size
+            except OSError:
+                continue
+            entries.append((last_used, size, json_path, npz_path))
+        return sorted(entries)
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until within limits.
+
+        Returns:
+        --------
+        int : Number of entries removed
+        """
+        entries = self._entries()
+        total = sum(e[1] for e in entries)
+        removed = 0
+        while entries and (
+            total > self.max_bytes
+            or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            _, size, json_path, npz_path = entries.pop(0)
+            for path in (json_path, npz_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for _, _, json_path, npz_path in self._entries():
+            for path in (json_path, npz_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(e[1] for e in entries),
+        }
@@ -0,0 +1,369 @@
+"""
+Results Store Module
+
+This module implements a schema-versioned HDF5 store for analysis results.
+Each analyzed run is appended as its own group holding the (optional) input
+arrays and the full ``AnalysisResults`` tree with arrays stored natively,
+and a compact per-run index table lets dashboards scan thousands of runs
+without opening any run group. Nothing is pickled: every value is an HDF5
+dataset, attribute or group.
+
+Layout (schema version 1)::
+
+    /                      attrs: schema_version
+    /index                 one row per run (see INDEX_FIELDS)
+    /runs/<run_id>/        attrs: analysis_timestamp, metadata (JSON)
+        data/              ExperimentalData (layout of ``write_hdf5``)
+        results/           AnalysisResults fields as nested groups
+"""
+
+import dataclasses
+import json
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .data_formats import (
+    _require_h5py,
+    materialize,
+    read_hdf5_group,
+    write_hdf5_group,
+)
+from .experimental_analysis import ExperimentalData
+
+RESULTS_SCHEMA_VERSION = 1
+RESULTS_STORE_FILE = "results.h5"
+
+# Per-run summary columns of the /index table
+INDEX_FIELDS = (
+    ("run_id", "str"),
+    ("analysis_timestamp", "str"),
+    ("source_file", "str"),
+    ("n_samples", "i8"),
+    ("t_start", "f8"),
+    ("t_stop", "f8"),
+    ("chsh_mean", "f8"),
+    ("chsh_std", "f8"),
+    ("chsh_min", "f8"),
+    ("chsh_max", "f8"),
+    ("is_valid", "?"),
+)
+
+# Marks a group that stores a list (items are named "0", "1", ...)
+_LIST_ATTR = "__list__"
+
+
+def _index_dtype(h5py) -> np.dtype:
+    return np.dtype(
+        [
+            (name, h5py.string_dtype() if kind == "str" else kind)
+            for name, kind in INDEX_FIELDS
+        ]
+    )
+
+
+def _node_name(key: Any) -> str:
+    """HDF5-safe name for a dict key ('/' separates HDF5 paths)."""
+    return str(key).replace("%", "%25").replace("/", "%2F")
+
+
+def _key_name(node: str) -> str:
+    return node.replace("%2F", "/").replace("%25", "%")
+
+
+def _write_tree(group, name: str, value: Any, h5py) -> None:
+    """
+    Store ``value`` under ``name`` in ``group``.
+
+    Dicts and dataclasses become groups, numeric/boolean arrays and lists
+    become datasets, lists of strings become string datasets, other (and
+    empty) lists become list groups, and scalars/strings/None become attributes.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = {
+            f.name: getattr(value, f.name) for f in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        sub_group = group.create_group(name)
+        for key, item in value.items():
+            _write_tree(sub_group, _node_name(key), item, h5py)
+        return
+    if value is None:
+        group.attrs[name] = h5py.Empty("f8")
+        return
+    if isinstance(value, (str, bool, int, float, np.generic)):
+        group.attrs[name] = value
+        return
+
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, str) for v in value):
+            group.create_dataset(
+                name, data=list(value), dtype=h5py.string_dtype()
+            )
+            return
+        if not value or not all(
+            isinstance(v, (bool, int, float, np.generic)) for v in value
+        ):
+            sub_group = group.create_group(name)
+            sub_group.attrs[_LIST_ATTR] = True
+            for i, item in enumerate(value):
+                _write_tree(sub_group, str(i), item, h5py)
+            return
+
+    values = np.asarray(value)
+    if values.dtype.kind not in "biufc":
+        raise TypeError(
+            f"Cannot store {name!r} of type {type(value).__name__} "
+            f"(dtype {values.dtype})"
+        )
+    group.create_dataset(name, data=values)
+
+
+def _read_node(node, h5py) -> Any:
+    if isinstance(node, h5py.Dataset):
+        if h5py.check_string_dtype(node.dtype) is not None:
+            return list(node.asstr()[()])
+        return node[()]
+    return _read_tree(node, h5py)
+
+
+def _read_tree(group, h5py) -> Any:
+    """Inverse of :func:`_write_tree` for one group."""
+    if group.attrs.get(_LIST_ATTR, False):
+        items = dict(group.attrs)
+        items.update(dict(group.items()))
+        items.pop(_LIST_ATTR)
+        return [
+            _read_value(items[str(i)], h5py) for i in range(len(items))
+        ]
+
+    tree = {_key_name(k): _read_value(v, h5py) for k, v in group.attrs.items()}
+    for name, node in group.items():
+        tree[_key_name(name)] = _read_node(node, h5py)
+    return tree
+
+
+def _read_value(value: Any, h5py) -> Any:
+    if isinstance(value, (h5py.Dataset, h5py.Group)):
+        return _read_node(value, h5py)
+    if isinstance(value, h5py.Empty):
+        return None
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return value
+
+
+def _decode_strings(column) -> np.ndarray:
+    return np.array(
+        [v.decode() if isinstance(v, bytes) else v for v in column],
+        dtype=object,
+    )
+
+
+def _check_schema(f) -> None:
+    version = int(f.attrs.get("schema_version", 0))
+    if version != RESULTS_SCHEMA_VERSION:
+        raise ValueError(
+            f"Results store schema version {version} is not supported "
+            f"(expected {RESULTS_SCHEMA_VERSION})"
+        )
+
+
+def _summary_row(
+    run_id: str,
+    analysis_timestamp: str,
+    data: ExperimentalData,
+    results: Any,
+) -> tuple:
+    timestamps = np.asarray(data.timestamps)
+    chsh = np.asarray(data.chsh_values, dtype=float)
+    has_data = len(chsh) > 0
+    validation = getattr(results, "validation_results", None)
+    return (
+        run_id,
+        analysis_timestamp,
+        str(data.metadata.get("source_file", "")),
+        len(chsh),
+        float(timestamps[0]) if has_data else np.nan,
+        float(timestamps[-1]) if has_data else np.nan,
+        float(np.mean(chsh)) if has_data else np.nan,
+        float(np.std(chsh)) if has_data else np.nan,
+        float(np.min(chsh)) if has_data else np.nan,
+        float(np.max(chsh)) if has_data else np.nan,
+        bool(getattr(validation, "is_valid", False)),
+    )
+
+
+def append_results(
+    store_path: Union[str, Path],
+    data: ExperimentalData,
+    results: Any,
+    run_id: Optional[str] = None,
+    include_data: bool = True,
+    chunk_size: int = 65536,
+    compression: Optional[str] = "gzip",
+    replace: bool = False,
+) -> str:
+    """
+    Append one analyzed run to a results store (created if missing).
+
+    Parameters:
+    -----------
+    store_path : str or Path
+        HDF5 results store
+    data : ExperimentalData
+        Analyzed experimental data
+    results : AnalysisResults
+        Analysis results (any dataclass or dict tree of arrays, numbers,
+        strings and lists)
+    run_id : str, optional
+        Unique run name (default: current time)
+    include_data : bool
+        Also store the input arrays, not only the results
+    chunk_size, compression
+        HDF5 chunking and compression of the input arrays
+    replace : bool
+        Overwrite an existing run with the same id (its index row is
+        updated in place) instead of raising ValueError
+
+    Returns:
+    --------
+    str : Run id the results were stored under
+    """
+    h5py = _require_h5py()
+    analysis_timestamp = datetime.now().isoformat()
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    row = _summary_row(run_id, analysis_timestamp, data, results)
+
+    with h5py.File(store_path, "a") as f:
+        if "schema_version" not in f.attrs:
+            f.attrs["schema_version"] = RESULTS_SCHEMA_VERSION
+            f.create_group("runs")
+            f.create_dataset(
+                "index",
+                shape=(0,),
+                maxshape=(None,),
+                chunks=(1024,),
+                dtype=_index_dtype(h5py),
+            )
+        _check_schema(f)
+
+        name = _node_name(run_id)
+        index = f["index"]
+        row_number = len(index)
+        if name in f["runs"]:
+            if not replace:
+                raise ValueError(
+                    f"Run {run_id!r} already exists in {store_path}"
+                )
+            del f["runs"][name]
+            row_number = list(_decode_strings(index["run_id"])).index(run_id)
+
+        run_group = f["runs"].create_group(name)
+        run_group.attrs["analysis_timestamp"] = analysis_timestamp
+        run_group.attrs["metadata"] = json.dumps(data.metadata, default=str)
+        if include_data:
+            write_hdf5_group(
+                run_group.create_group("data"),
+                data,
+                chunk_size=chunk_size,
+                compression=compression,
+            )
+        _write_tree(run_group, "results", results, h5py)
+
+        if row_number == len(index):
+            index.resize((row_number + 1,))
+        index[row_number] = row
+
+    return run_id
+
+
+def read_results_index(store_path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """
+    Read the per-run summary table.
+
+    Parameters:
+    -----------
+    store_path : str or Path
+        HDF5 results store
+
+    Returns:
+    --------
+    dict : Column name -> array (one entry per run, in append order)
+    """
+    h5py = _require_h5py()
+    with h5py.File(store_path, "r") as f:
+        _check_schema(f)
+        table = f["index"][()]
+
+    columns = {}
+    for name, kind in INDEX_FIELDS:
+        column = table[name]
+        if kind == "str":
+            column = _decode_strings(column)
+        columns[name] = column
+    return columns
+
+
+def list_runs(store_path: Union[str, Path]) -> List[str]:
+    """Run ids in the store, in append order."""
+    return list(read_results_index(store_path)["run_id"])
+
+
+def read_results(
+    store_path: Union[str, Path], run_id: str, lazy: bool = True
+) -> Dict[str, Any]:
+    """
+    Read one run back from a results store.
+
+    Parameters:
+    -----------
+    store_path : str or Path
+        HDF5 results store
+    run_id : str
+        Run to read
+    lazy : bool
+        Return the input arrays as LazyArray views (default) instead of
+        reading them into memory. The file stays open for as long as the
+        views are referenced.
+
+    Returns:
+    --------
+    dict : 'run_id', 'analysis_timestamp', 'metadata', 'results' (nested
+    dicts of arrays and scalars) and 'data' (ExperimentalData, or None if
+    the run was stored without data)
+    """
+    h5py = _require_h5py()
+    f = h5py.File(store_path, "r")
+    try:
+        _check_schema(f)
+        name = _node_name(run_id)
+        if name not in f["runs"]:
+            raise KeyError(f"Run {run_id!r} not found in {store_path}")
+        run_group = f["runs"][name]
+
+        data = None
+        if "data" in run_group:
+            data = read_hdf5_group(run_group["data"])
+            if not lazy:
+                data = materialize(data)
+
+        run = {
+            "run_id": run_id,
+            "analysis_timestamp": _read_value(
+                run_group.attrs["analysis_timestamp"], h5py
+            ),
+            "metadata": json.loads(run_group.attrs.get("metadata", "{}")),
+            "results": _read_tree(run_group["results"], h5py),
+            "data": data,
+        }
+    except Exception:
+        f.close()
+        raise
+
+    if data is None or not lazy:
+        f.close()
+    return run
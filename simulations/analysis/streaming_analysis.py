@@ -0,0 +1,276 @@
+"""
+Streaming Analysis Module
+
+This module implements incremental counterparts of the stages in
+``comprehensive_analysis``. Data arrives as ``ExperimentalData`` chunks
+(e.g. from a file that is still being written) and each stage keeps only
+running statistics plus a window-sized tail, so partial results are
+available at any point during a run.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+from .experimental_analysis import ExperimentalData
+from .streaming_validator import DriftEvent, OnlineDriftDetector, RunningMoments
+
+
+class RollingVariance:
+    """
+    Streaming equivalent of ``EnvironmentalCorrelationAnalyzer.calculate_field_variance``.
+
+    Emits the sample variance (ddof=1) of each complete window as soon as its
+    last sample arrives. Window labels follow the pandas ``center=True``
+    convention, so the variance for sample ``i`` is emitted once sample
+    ``i + window_size // 2`` has been seen. Edge samples without a full
+    window are not emitted (the batch version back/forward-fills them).
+    """
+
+    def __init__(self, window_size: int = 100):
+        """
+        Initialize rolling variance.
+
+        Parameters:
+        -----------
+        window_size : int
+            Window size for running variance calculation
+        """
+        if window_size < 2:
+            raise ValueError("window_size must be at least 2")
+        self.window_size = window_size
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear stream state."""
+        self.n_seen = 0
+        self._tail = np.empty(0)
+
+    @property
+    def lag(self) -> int:
+        """Number of samples between a window label and its last sample."""
+        return self.window_size - 1 - self.window_size // 2
+
+    def update(self, values: np.ndarray) -> tuple:
+        """
+        Add samples and return the newly completed window variances.
+
+        Parameters:
+        -----------
+        values : array
+            Next block of field samples
+
+        Returns:
+        --------
+        tuple : (first_label, variances) where ``first_label`` is the global
+        sample index the first variance belongs to
+        """
+        values = np.asarray(values, dtype=float)
+        w = self.window_size
+        buffer = np.concatenate([self._tail, values])
+        start = self.n_seen - len(self._tail)
+        self.n_seen += len(values)
+        self._tail = buffer[-(w - 1) :] if w > 1 else np.empty(0)
+
+        n_windows = len(buffer) - w + 1
+        if n_windows <= 0:
+            return start + w // 2, np.empty(0)
+
+        # Shifted cumulative sums keep the rounding error near the data scale
+        shifted = buffer - buffer[0]
+        s1 = np.concatenate([[0.0], np.cumsum(shifted)])
+        s2 = np.concatenate([[0.0], np.cumsum(shifted * shifted)])
+        sum1 = s1[w:] - s1[:-w]
+        sum2 = s2[w:] - s2[:-w]
+        variance = np.maximum((sum2 - sum1 * sum1 / w) / (w - 1), 0.0)
+
+        return start + w // 2, variance
+
+
+class StreamingAnalyzer:
+    """
+    Incremental CHSH / environmental-field analysis over data chunks.
+
+    Stages:
+    - running CHSH moments (mean, spread, trend, Bell-test statistics)
+    - rolling variance of each environmental field
+    - online Pearson correlation between CHSH and each field variance
+    - drift and step detection on the CHSH series
+    """
+
+    classical_bound = 2.0
+    tsirelson_bound = 2 * np.sqrt(2)
+
+    def __init__(
+        self,
+        window_size: int = 100,
+        alpha: float = 0.001,
+        drift_detector: Optional[OnlineDriftDetector] = None,
+    ):
+        """
+        Initialize streaming analyzer.
+
+        Parameters:
+        -----------
+        window_size : int
+            Rolling field variance window
+        alpha : float
+            Significance level for Bell and correlation tests
+        drift_detector : OnlineDriftDetector, optional
+            Drift detector applied to the CHSH series (default settings
+            if omitted)
+        """
+        self.window_size = window_size
+        self.alpha = alpha
+        self.drift_detector = drift_detector or OnlineDriftDetector()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all running statistics."""
+        self.n_samples = 0
+        self.n_chunks = 0
+        self.chsh_moments = RunningMoments()
+        self.chsh_min = np.inf
+        self.chsh_max = -np.inf
+        self.classical_violations = 0
+        self.tsirelson_violations = 0
+        self.field_variance: Dict[str, RollingVariance] = {}
+        self.field_correlation: Dict[str, RunningMoments] = {}
+        self.last_field_variance: Dict[str, float] = {}
+        self.events: List[DriftEvent] = []
+        self.drift_detector.reset()
+        self._chsh_tail = np.empty(0)
+
+    def update(self, chunk: ExperimentalData) -> Dict:
+        """
+        Feed the next chunk of data through all stages.
+
+        Parameters:
+        -----------
+        chunk : ExperimentalData
+            Next block of samples (timestamps, CHSH values and fields of
+            equal length)
+
+        Returns:
+        --------
+        dict : Partial results after this chunk (see :meth:`summary`)
+        """
+        timestamps = np.asarray(chunk.timestamps, dtype=float)
+        chsh = np.asarray(chunk.chsh_values, dtype=float)
+        n_before = self.n_samples
+
+        # CHSH moments and Bell-test counters
+        if len(chsh):
+            self.chsh_moments.update(timestamps, chsh)
+            self.chsh_min = min(self.chsh_min, float(chsh.min()))
+            self.chsh_max = max(self.chsh_max, float(chsh.max()))
+            self.classical_violations += int(
+                np.count_nonzero(chsh > self.classical_bound)
+            )
+            self.tsirelson_violations += int(
+                np.count_nonzero(chsh > self.tsirelson_bound)
+            )
+            self.events.extend(self.drift_detector.update(chsh, timestamps))
+
+        # CHSH history reaching back to the oldest unlabelled window centre
+        history = np.concatenate([self._chsh_tail, chsh])
+        history_start = n_before + len(chsh) - len(history)
+
+        # Rolling field variance and online correlation with CHSH
+        for name, values in chunk.environmental_fields.items():
+            if name not in self.field_variance:
+                self.field_variance[name] = RollingVariance(self.window_size)
+                self.field_correlation[name] = RunningMoments()
+            first_label, variance = self.field_variance[name].update(values)
+            if len(variance):
+                lo = first_label - history_start
+                paired = history[lo : lo + len(variance)]
+                self.field_correlation[name].update(variance, paired)
+                self.last_field_variance[name] = float(variance[-1])
+
+        self.n_samples += len(chsh)
+        self.n_chunks += 1
+        self._chsh_tail = history[-self.window_size :]
+
+        return self.summary()
+
+    def bell_test(self) -> Dict:
+        """
+        Bell-inequality statistics from the running moments.
+
+        Returns:
+        --------
+        dict : Same keys as the streaming-computable part of
+        ``StatisticalValidator.bell_inequality_test``
+        """
+        from scipy import stats
+
+        n = self.chsh_moments.n
+        mean = self.chsh_moments.mean_x
+        std = np.sqrt(self.chsh_moments.m2_x / n) if n else 0.0
+        sem = np.sqrt(self.chsh_moments.variance_x / n) if n > 1 else np.inf
+
+        def _one_sided_p(bound):
+            if not np.isfinite(sem) or sem == 0:
+                return 1.0 if mean <= bound else 0.0
+            return float(stats.t.sf((mean - bound) / sem, n - 1))
+
+        p_classical = _one_sided_p(self.classical_bound)
+        p_tsirelson = _one_sided_p(self.tsirelson_bound)
+
+        return {
+            "classical_violations": self.classical_violations,
+            "classical_fraction": self.classical_violations / n if n else 0.0,
+            "classical_p_value": p_classical,
+            "classical_significant": p_classical < self.alpha,
+            "tsirelson_violations": self.tsirelson_violations,
+            "tsirelson_fraction": self.tsirelson_violations / n if n else 0.0,
+            "tsirelson_p_value": p_tsirelson,
+            "tsirelson_significant": p_tsirelson < self.alpha,
+            "mean_chsh": mean,
+            "std_chsh": std,
+        }
+
+    def correlation_results(self) -> Dict[str, Dict]:
+        """
+        Online Pearson correlation of CHSH with each field variance.
+
+        Returns:
+        --------
+        dict : Per-field 'correlation_coefficient', 'p_value',
+        'is_significant' and 'n_samples'
+        """
+        results = {}
+        for name, moments in self.field_correlation.items():
+            fit = moments.linear_fit()
+            results[name] = {
+                "correlation_coefficient": fit["r_value"],
+                "p_value": fit["p_value"],
+                "is_significant": fit["p_value"] < self.alpha,
+                "n_samples": moments.n,
+            }
+        return results
+
+    def summary(self) -> Dict:
+        """
+        Current partial results.
+
+        Returns:
+        --------
+        dict : 'n_samples', 'n_chunks', 'chsh_range', 'chsh_trend',
+        'bell_test', 'field_variance' (latest value per field),
+        'field_correlations' and 'drift_events'
+        """
+        trend = self.chsh_moments.linear_fit()
+        return {
+            "n_samples": self.n_samples,
+            "n_chunks": self.n_chunks,
+            "chsh_range": (self.chsh_min, self.chsh_max),
+            "chsh_trend": {
+                "slope": trend["slope"],
+                "p_value": trend["p_value"],
+            },
+            "bell_test": self.bell_test(),
+            "field_variance": dict(self.last_field_variance),
+            "field_correlations": self.correlation_results(),
+            "drift_events": list(self.events),
+        }
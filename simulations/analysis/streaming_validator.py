@@ -0,0 +1,713 @@
+"""
+Streaming Validation Module
+
+This module implements online counterparts of the post-run checks in
+``ExperimentalValidator``. Detectors consume data block by block during
+acquisition, keep only constant-size running statistics, and raise events
+as soon as a threshold is crossed instead of after the run has finished.
+"""
+
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from dataclasses import dataclass
+
+from .physics_validator import ValidationResult
+
+
+@dataclass
+class DriftEvent:
+    """Container for a drift or step-change event raised during a run."""
+
+    kind: str
+    sample_index: int
+    timestamp: float
+    statistic: float
+    threshold: float
+    message: str
+
+
+@dataclass
+class CountEvent:
+    """Container for a non-Poisson counting event on one detector window."""
+
+    detector: str
+    kind: str
+    window_index: int
+    sample_index: int
+    statistic: float
+    threshold: float
+    message: str
+
+
+@dataclass
+class RunningMoments:
+    """
+    Mergeable running mean/variance/co-moment accumulator.
+
+    Blocks are combined with the pairwise update of Chan et al., so the
+    result is identical (up to rounding) to a single pass over the full
+    series without storing it.
+    """
+
+    n: int = 0
+    mean_t: float = 0.0
+    mean_x: float = 0.0
+    m2_t: float = 0.0
+    m2_x: float = 0.0
+    c_tx: float = 0.0
+
+    def update(self, t: np.ndarray, x: np.ndarray) -> None:
+        """Merge a block of (t, x) samples into the running moments."""
+        n_b = len(x)
+        if n_b == 0:
+            return
+
+        mean_t_b = float(np.mean(t))
+        mean_x_b = float(np.mean(x))
+        dt = t - mean_t_b
+        dx = x - mean_x_b
+        m2_t_b = float(np.dot(dt, dt))
+        m2_x_b = float(np.dot(dx, dx))
+        c_tx_b = float(np.dot(dt, dx))
+
+        n = self.n + n_b
+        delta_t = mean_t_b - self.mean_t
+        delta_x = mean_x_b - self.mean_x
+        weight = self.n * n_b / n
+
+        self.mean_t += delta_t * n_b / n
+        self.mean_x += delta_x * n_b / n
+        self.m2_t += m2_t_b + delta_t**2 * weight
+        self.m2_x += m2_x_b + delta_x**2 * weight
+        self.c_tx += c_tx_b + delta_t * delta_x * weight
+        self.n = n
+
+    @property
+    def variance_x(self) -> float:
+        """Sample variance of x (ddof=1)."""
+        return self.m2_x / (self.n - 1) if self.n > 1 else 0.0
+
+    def linear_fit(self) -> Dict[str, float]:
+        """
+        Least-squares fit x = slope * t + intercept on the data seen so far.
+
+        Returns:
+        --------
+        dict : slope, intercept, r_value, p_value, std_err (as linregress)
+        """
+        if self.n < 3 or self.m2_t <= 0 or self.m2_x <= 0:
+            return {
+                "slope": 0.0,
+                "intercept": self.mean_x,
+                "r_value": 0.0,
+                "p_value": 1.0,
+                "std_err": np.inf,
+            }
+
+        from scipy import stats
+
+        slope = self.c_tx / self.m2_t
+        intercept = self.mean_x - slope * self.mean_t
+        r_value = float(
+            np.clip(self.c_tx / np.sqrt(self.m2_t * self.m2_x), -1, 1)
+        )
+
+        df = self.n - 2
+        residual = max(1.0 - r_value**2, 0.0)
+        if residual == 0.0:
+            p_value = 0.0
+        else:
+            t_stat = r_value * np.sqrt(df / residual)
+            p_value = float(2 * stats.t.sf(abs(t_stat), df))
+        std_err = np.sqrt(residual * self.m2_x / self.m2_t / df)
+
+        return {
+            "slope": slope,
+            "intercept": intercept,
+            "r_value": r_value,
+            "p_value": p_value,
+            "std_err": std_err,
+        }
+
+
+class OnlineDriftDetector:
+    """
+    Online drift and step-change detector for acquisition streams.
+
+    Combines three detectors, all updated per block in O(block) time and
+    O(1) memory:
+    - Incremental linear regression (same criterion as
+      ``ExperimentalValidator.detect_systematic_drifts``)
+    - Two-sided Page–Hinkley test for mean shifts
+    - Step detection on first differences against their running spread
+    """
+
+    def __init__(
+        self,
+        drift_p_value: float = 0.01,
+        drift_min_correlation: float = 0.1,
+        step_sigma: float = 5.0,
+        max_step_fraction: float = 0.001,
+        ph_delta: float = 0.5,
+        ph_threshold: float = 50.0,
+        min_samples: int = 30,
+        on_event: Optional[Callable[[DriftEvent], None]] = None,
+    ):
+        """
+        Initialize online drift detector.
+
+        Parameters:
+        -----------
+        drift_p_value : float
+            Significance level for the linear drift test
+        drift_min_correlation : float
+            Minimum |r| for a drift to be reported
+        step_sigma : float
+            Step threshold in units of the first-difference standard deviation
+        max_step_fraction : float
+            Allowed fraction of large steps before a violation is raised
+        ph_delta : float
+            Page–Hinkley drift allowance in units of the noise level
+        ph_threshold : float
+            Page–Hinkley alarm threshold in units of the noise level
+        min_samples : int
+            Samples required before any event is raised
+        on_event : callable, optional
+            Called with each DriftEvent as soon as it is raised
+        """
+        self.drift_p_value = drift_p_value
+        self.drift_min_correlation = drift_min_correlation
+        self.step_sigma = step_sigma
+        self.max_step_fraction = max_step_fraction
+        self.ph_delta = ph_delta
+        self.ph_threshold = ph_threshold
+        self.min_samples = min_samples
+        self.on_event = on_event
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all running statistics and events."""
+        self.regression = RunningMoments()
+        self.diff_moments = RunningMoments()
+        self.n_samples = 0
+        self.n_large_steps = 0
+        self.events: List[DriftEvent] = []
+        self._last_value: Optional[float] = None
+        self._last_time: Optional[float] = None
+        self._drift_reported = False
+        self._steps_reported = False
+        self._reset_page_hinkley()
+
+    def _reset_page_hinkley(self) -> None:
+        self._ph_n = 0
+        self._ph_sum = 0.0
+        self._ph_up = 0.0
+        self._ph_up_min = 0.0
+        self._ph_down = 0.0
+        self._ph_down_max = 0.0
+
+    def update(
+        self, data: np.ndarray, time_stamps: np.ndarray
+    ) -> List[DriftEvent]:
+        """
+        Consume one acquisition block.
+
+        Parameters:
+        -----------
+        data : array
+            Block of time series samples
+        time_stamps : array
+            Time stamps for each sample in the block
+
+        Returns:
+        --------
+        list : DriftEvents raised by this block
+        """
+        data = np.asarray(data, dtype=float)
+        time_stamps = np.asarray(time_stamps, dtype=float)
+        if len(data) == 0:
+            return []
+
+        start_index = self.n_samples
+        new_events = []
+
+        self.regression.update(time_stamps, data)
+
+        # First differences, carrying the last sample across block edges
+        if self._last_value is not None:
+            diffs = np.diff(data, prepend=self._last_value)
+        else:
+            diffs = np.diff(data)
+        self.diff_moments.update(np.zeros_like(diffs), diffs)
+        self._last_value = float(data[-1])
+        self._last_time = float(time_stamps[-1])
+        self.n_samples += len(data)
+
+        diff_std = np.sqrt(self.diff_moments.variance_x)
+        if self.n_samples < self.min_samples or diff_std == 0:
+            self._page_hinkley(data, time_stamps, start_index, 0.0)
+            return new_events
+
+        # Step changes
+        large = np.abs(diffs) > self.step_sigma * diff_std
+        self.n_large_steps += int(np.count_nonzero(large))
+        step_fraction = self.n_large_steps / max(self.diff_moments.n, 1)
+        if step_fraction > self.max_step_fraction and not self._steps_reported:
+            self._steps_reported = True
+            idx = int(np.flatnonzero(large)[0]) if np.any(large) else 0
+            new_events.append(
+                DriftEvent(
+                    kind="step_change",
+                    sample_index=start_index + idx,
+                    timestamp=float(time_stamps[idx]),
+                    statistic=step_fraction,
+                    threshold=self.max_step_fraction,
+                    message=(
+                        f"Excessive step changes detected: "
+                        f"{step_fraction:.4f} fraction"
+                    ),
+                )
+            )
+
+        # Mean shifts; white noise has diff std = sqrt(2) * sigma
+        new_events.extend(
+            self._page_hinkley(
+                data, time_stamps, start_index, diff_std / np.sqrt(2)
+            )
+        )
+
+        # Linear drift
+        if not self._drift_reported:
+            fit = self.regression.linear_fit()
+            if (
+                fit["p_value"] < self.drift_p_value
+                and abs(fit["r_value"]) > self.drift_min_correlation
+            ):
+                self._drift_reported = True
+                new_events.append(
+                    DriftEvent(
+                        kind="linear_drift",
+                        sample_index=self.n_samples - 1,
+                        timestamp=self._last_time,
+                        statistic=fit["r_value"],
+                        threshold=self.drift_min_correlation,
+                        message=(
+                            f"Significant linear drift detected: "
+                            f"slope = {fit['slope']:.6e}, "
+                            f"r = {fit['r_value']:.3f}, "
+                            f"p = {fit['p_value']:.3e}"
+                        ),
+                    )
+                )
+
+        self.events.extend(new_events)
+        if self.on_event is not None:
+            for event in new_events:
+                self.on_event(event)
+
+        return new_events
+
+    def _page_hinkley(
+        self,
+        data: np.ndarray,
+        time_stamps: np.ndarray,
+        start_index: int,
+        sigma: float,
+    ) -> List[DriftEvent]:
+        """Vectorized two-sided Page–Hinkley update over one block."""
+        events = []
+        offset = 0
+
+        while offset < len(data):
+            block = data[offset:]
+            counts = self._ph_n + np.arange(1, len(block) + 1)
+            running_mean = (self._ph_sum + np.cumsum(block)) / counts
+            deviation = block - running_mean
+            delta = self.ph_delta * sigma
+
+            up = self._ph_up + np.cumsum(deviation - delta)
+            up_min = np.minimum.accumulate(np.minimum(up, self._ph_up_min))
+            down = self._ph_down + np.cumsum(deviation + delta)
+            down_max = np.maximum.accumulate(
+                np.maximum(down, self._ph_down_max)
+            )
+
+            if sigma == 0 or self._ph_n + len(block) < self.min_samples:
+                alarms = np.empty(0, dtype=int)
+            else:
+                statistic = np.maximum(up - up_min, down_max - down)
+                alarms = np.flatnonzero(statistic > self.ph_threshold * sigma)
+
+            if len(alarms) == 0:
+                self._ph_n = int(counts[-1])
+                self._ph_sum += float(np.sum(block))
+                self._ph_up, self._ph_up_min = float(up[-1]), float(up_min[-1])
+                self._ph_down = float(down[-1])
+                self._ph_down_max = float(down_max[-1])
+                break
+
+            idx = int(alarms[0])
+            value = float(
+                max(up[idx] - up_min[idx], down_max[idx] - down[idx])
+            )
+            direction = (
+                "upward"
+                if up[idx] - up_min[idx] >= down_max[idx] - down[idx]
+                else "downward"
+            )
+            events.append(
+                DriftEvent(
+                    kind="mean_shift",
+                    sample_index=start_index + offset + idx,
+                    timestamp=float(time_stamps[offset + idx]),
+                    statistic=value / sigma,
+                    threshold=self.ph_threshold,
+                    message=(
+                        f"Page-Hinkley {direction} mean shift detected: "
+                        f"statistic = {value / sigma:.1f} sigma"
+                    ),
+                )
+            )
+
+            # Restart the test after the change point
+            self._reset_page_hinkley()
+            offset += idx + 1
+
+        return events
+
+    def summary(self) -> ValidationResult:
+        """
+        Summarize the run so far in the ``detect_systematic_drifts`` format.
+
+        Returns:
+        --------
+        ValidationResult : Validation results
+        """
+        violations = []
+        warnings_list = []
+        bounds_checked = {
+            "linear_drift": not self._drift_reported,
+            "step_changes": not self._steps_reported,
+            "mean_shift": not any(e.kind == "mean_shift" for e in self.events),
+        }
+
+        for event in self.events:
+            if event.kind == "step_change":
+                violations.append(event.message)
+            else:
+                warnings_list.append(event.message)
+
+        return ValidationResult(
+            is_valid=len(violations) == 0,
+            violations=violations,
+            warnings=warnings_list,
+            bounds_checked=bounds_checked,
+        )
+
+
+class StreamingCountValidator:
+    """
+    Streaming Poisson-statistics validator for photon-count streams.
+
+    Streaming counterpart of ``ExperimentalValidator.validate_count_statistics``.
+    Running moments and zero counts are kept per detector, for the whole
+    run and for the current time window, as arrays over detectors so that
+    one DAQ block is processed with a handful of vectorized reductions.
+    Each completed window is tested with the chi-square dispersion test
+    D = sum((n - mean)^2) / mean ~ chi2(N - 1); raw counts are not stored.
+    """
+
+    def __init__(
+        self,
+        detectors: Sequence[str],
+        expected_rate: float,
+        measurement_time: float,
+        window_size: int = 1000,
+        alpha: float = 0.001,
+        max_zero_fraction: float = 0.01,
+        on_event: Optional[Callable[[CountEvent], None]] = None,
+    ):
+        """
+        Initialize streaming count validator.
+
+        Parameters:
+        -----------
+        detectors : sequence of str
+            Detector names, in the row order of array blocks
+        expected_rate : float
+            Expected count rate (Hz)
+        measurement_time : float
+            Integration time per count sample (s)
+        window_size : int
+            Number of samples per dispersion-test window
+        alpha : float
+            Two-sided significance level of the dispersion test
+        max_zero_fraction : float
+            Allowed fraction of zero-count samples per window
+        on_event : callable, optional
+            Called with each CountEvent as soon as it is raised
+        """
+        if window_size < 2:
+            raise ValueError("window_size must be at least 2")
+
+        self.detectors = list(detectors)
+        self.expected_rate = expected_rate
+        self.measurement_time = measurement_time
+        self.window_size = window_size
+        self.alpha = alpha
+        self.max_zero_fraction = max_zero_fraction
+        self.on_event = on_event
+
+        # Dispersion acceptance region for a full window, D ~ chi2(N - 1)
+        from scipy import stats
+
+        df = window_size - 1
+        self._lower = float(stats.chi2.ppf(alpha / 2, df))
+        self._upper = float(stats.chi2.isf(alpha / 2, df))
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all running statistics and events."""
+        n_det = len(self.detectors)
+        self.n_samples = 0
+        self.n_windows = 0
+        self.events: List[CountEvent] = []
+        self._mean = np.zeros(n_det)
+        self._m2 = np.zeros(n_det)
+        self._zeros = np.zeros(n_det, dtype=np.int64)
+        self._flagged_windows = np.zeros(n_det, dtype=np.int64)
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        n_det = len(self.detectors)
+        self._w_n = 0
+        self._w_mean = np.zeros(n_det)
+        self._w_m2 = np.zeros(n_det)
+        self._w_zeros = np.zeros(n_det, dtype=np.int64)
+
+    @staticmethod
+    def _merge(n_a, mean_a, m2_a, block):
+        """Chan merge of running (mean, M2) with a (detectors, n) block."""
+        n_b = block.shape[1]
+        mean_b = block.mean(axis=1)
+        m2_b = np.einsum(
+            "ij,ij->i", block - mean_b[:, None], block - mean_b[:, None]
+        )
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        m2 = m2_a + m2_b + delta**2 * n_a * n_b / n
+        return mean, m2
+
+    def update(
+        self, counts: Union[Dict[str, np.ndarray], np.ndarray]
+    ) -> List[CountEvent]:
+        """
+        Consume one DAQ block of counts.
+
+        Parameters:
+        -----------
+        counts : dict or array
+            Per-detector count arrays of equal length, or an array of shape
+            (n_detectors, n_samples) in ``detectors`` order
+
+        Returns:
+        --------
+        list : CountEvents raised by windows completed in this block
+        """
+        if isinstance(counts, dict):
+            block = np.stack(
+                [np.asarray(counts[d], dtype=float) for d in self.detectors]
+            )
+        else:
+            block = np.asarray(counts, dtype=float).reshape(
+                len(self.detectors), -1
+            )
+        if block.shape[1] == 0:
+            return []
+
+        # Whole-run moments
+        self._mean, self._m2 = self._merge(
+            self.n_samples, self._mean, self._m2, block
+        )
+        self._zeros += np.count_nonzero(block == 0, axis=1)
+
+        # Per-window moments; split the block on window boundaries
+        new_events = []
+        offset = 0
+        while offset < block.shape[1]:
+            take = min(self.window_size - self._w_n, block.shape[1] - offset)
+            segment = block[:, offset : offset + take]
+            self._w_mean, self._w_m2 = self._merge(
+                self._w_n, self._w_mean, self._w_m2, segment
+            )
+            self._w_zeros += np.count_nonzero(segment == 0, axis=1)
+            self._w_n += take
+            offset += take
+
+            if self._w_n == self.window_size:
+                new_events.extend(
+                    self._close_window(self.n_samples + offset - 1)
+                )
+
+        self.n_samples += block.shape[1]
+
+        self.events.extend(new_events)
+        if self.on_event is not None:
+            for event in new_events:
+                self.on_event(event)
+
+        return new_events
+
+    def _close_window(self, sample_index: int) -> List[CountEvent]:
+        """Run the dispersion and zero-count tests on the finished window."""
+        events = []
+        n = self._w_n
+        df = n - 1
+        mean = self._w_mean
+        lower, upper = self._lower, self._upper
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dispersion = np.where(mean > 0, self._w_m2 / mean, np.nan)
+        zero_fraction = self._w_zeros / n
+
+        for i in np.flatnonzero(dispersion > upper):
+            events.append(
+                self._window_event(
+                    i,
+                    "overdispersion",
+                    sample_index,
+                    dispersion[i] / df,
+                    upper / df,
+                )
+            )
+        for i in np.flatnonzero(dispersion < lower):
+            events.append(
+                self._window_event(
+                    i,
+                    "underdispersion",
+                    sample_index,
+                    dispersion[i] / df,
+                    lower / df,
+                )
+            )
+        for i in np.flatnonzero(zero_fraction > self.max_zero_fraction):
+            events.append(
+                CountEvent(
+                    detector=self.detectors[i],
+                    kind="excessive_zeros",
+                    window_index=self.n_windows,
+                    sample_index=sample_index,
+                    statistic=float(zero_fraction[i]),
+                    threshold=self.max_zero_fraction,
+                    message=(
+                        f"{self.detectors[i]}: excessive zero counts: "
+                        f"{zero_fraction[i]:.3f} fraction"
+                    ),
+                )
+            )
+
+        flagged = {self.detectors.index(event.detector) for event in events}
+        self._flagged_windows[list(flagged)] += 1
+
+        self.n_windows += 1
+        self._reset_window()
+        return events
+
+    def _window_event(
+        self,
+        i: int,
+        kind: str,
+        sample_index: int,
+        index: float,
+        threshold: float,
+    ) -> CountEvent:
+        return CountEvent(
+            detector=self.detectors[i],
+            kind=kind,
+            window_index=self.n_windows,
+            sample_index=sample_index,
+            statistic=float(index),
+            threshold=float(threshold),
+            message=(
+                f"{self.detectors[i]}: non-Poisson statistics in window "
+                f"{self.n_windows}: dispersion index = {index:.3f} "
+                f"({kind}, threshold {threshold:.3f})"
+            ),
+        )
+
+    @property
+    def dispersion_index(self) -> Dict[str, float]:
+        """Whole-run variance-to-mean ratio per detector."""
+        n = max(self.n_samples, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            index = np.where(self._mean > 0, self._m2 / n / self._mean, np.nan)
+        return dict(zip(self.detectors, index.tolist()))
+
+    def summary(self) -> ValidationResult:
+        """
+        Summarize the run so far in the ``validate_count_statistics`` format.
+
+        Bound names are prefixed with the detector name.
+
+        Returns:
+        --------
+        ValidationResult : Validation results
+        """
+        violations = []
+        warnings_list = []
+        bounds_checked = {}
+
+        expected_counts = self.expected_rate * self.measurement_time
+        n = max(self.n_samples, 1)
+        variance = self._m2 / n
+
+        for i, detector in enumerate(self.detectors):
+            mean_counts = self._mean[i]
+
+            count_level_ok = bool(
+                0.1 * expected_counts <= mean_counts <= 10 * expected_counts
+            )
+            bounds_checked[f"{detector}_count_level"] = count_level_ok
+            if not count_level_ok:
+                warnings_list.append(
+                    f"{detector}: count rate differs from expected: "
+                    f"measured = {mean_counts/self.measurement_time:.1f} Hz, "
+                    f"expected = {self.expected_rate:.1f} Hz"
+                )
+
+            poisson_ok = bool(
+                abs(variance[i] - mean_counts) < 3 * np.sqrt(mean_counts)
+            )
+            bounds_checked[f"{detector}_poisson_statistics"] = poisson_ok
+            if not poisson_ok:
+                violations.append(
+                    f"{detector}: non-Poisson statistics detected: "
+                    f"variance = {variance[i]:.1f}, mean = {mean_counts:.1f}"
+                )
+
+            # A few windows fail by chance at level alpha; allow 10x that
+            flagged = int(self._flagged_windows[i])
+            windows_ok = flagged <= max(1, 10 * self.alpha * self.n_windows)
+            bounds_checked[f"{detector}_window_dispersion"] = windows_ok
+            if not windows_ok:
+                violations.append(
+                    f"{detector}: {flagged}/{self.n_windows} windows failed "
+                    "the dispersion test"
+                )
+
+            zero_fraction = self._zeros[i] / n
+            zeros_ok = bool(zero_fraction <= self.max_zero_fraction)
+            bounds_checked[f"{detector}_excessive_zeros"] = zeros_ok
+            if not zeros_ok:
+                violations.append(
+                    f"{detector}: excessive zero counts: "
+                    f"{zero_fraction:.3f} fraction"
+                )
+
+        return ValidationResult(
+            is_valid=len(violations) == 0,
+            violations=violations,
+            warnings=warnings_list,
+            bounds_checked=bounds_checked,
+        )
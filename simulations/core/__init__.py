@@ -2,7 +2,24 @@
 Core simulation modules for environmental quantum field effects.
 """
 
-from .field_simulator import EnvironmentalFieldSimulator
-from .quantum_correlations import CHSHExperimentSimulator
+import importlib
 
-__all__ = ["EnvironmentalFieldSimulator", "CHSHExperimentSimulator"]
+_EXPORTS = {
+    "EnvironmentalFieldSimulator": ".field_simulator",
+    "CHSHExperimentSimulator": ".quantum_correlations",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Deferred so importing one submodule does not import its siblings
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
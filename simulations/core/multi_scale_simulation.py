@@ -9,7 +9,6 @@ import numpy as np
 import scipy as sp
 from scipy.integrate import solve_ivp
 from scipy.linalg import expm
-import matplotlib.pyplot as plt
 from typing import Callable, Dict, Tuple, Optional, List, Union
 
 # Constants
@@ -172,6 +171,7 @@ class EnvironmentalCorrelation:
         tau_values = np.linspace(-tau_max, tau_max, num_points)
         corr_values = self.correlation_function(tau_values)
         
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         plt.plot(tau_values, corr_values)
         plt.xlabel(r'Time difference $\tau$')
@@ -186,6 +186,7 @@ class EnvironmentalCorrelation:
         omega_values = np.linspace(-omega_max, omega_max, num_points)
         spectral_values = self.spectral_density(omega_values)
         
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         plt.plot(omega_values, spectral_values)
         plt.xlabel(r'Frequency $\omega$')
@@ -658,6 +659,8 @@ class QuantumCorrelationAmplifier:
         coupling_strengths = results['coupling_strengths']
         correlation_times = results['correlation_times']
         
+        import matplotlib.pyplot as plt
+
         # Create figure with multiple subplots
         fig, axes = plt.subplots(1, 3, figsize=(18, 6))
         
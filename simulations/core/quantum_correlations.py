@@ -6,7 +6,6 @@ All simulations maintain rigorous respect for quantum mechanical bounds.
 """
 
 import numpy as np
-from scipy import stats as scipy_stats
 from typing import Dict, Optional
 import warnings
 
@@ -138,7 +137,7 @@ class CHSHExperimentSimulator:
             "S_measured": S_measured,  # Alias for compatibility
             "S_mean": np.mean(S_measured),
             "S_std": np.std(S_measured),
-            "S_sem": scipy_stats.sem(S_measured),
+            "S_sem": np.std(S_measured, ddof=1) / np.sqrt(len(S_measured)),
             "S_ideal": S_ideal,
             "env_field": env_field,
             "environmental_amplification": S_env_modified
@@ -157,9 +156,7 @@ class CHSHExperimentSimulator:
                 "classical_violations": np.sum(S_measured > 2.0),
                 "tsirelson_violations": np.sum(S_measured > 2 * np.sqrt(2)),
             },
-            "validation_results": self.validator.validate_chsh_parameter(
-                S_measured
-            ),
+            "validation_results": validation_result,
             "simulation_parameters": self.env_simulator.get_simulation_parameters(),
         }
 
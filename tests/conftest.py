@@ -22,6 +22,47 @@ def test_tolerances():
     return {"physics_bound": 1e-10, "numerical": 1e-12, "statistical": 0.1}
 
 
+@pytest.fixture
+def make_run_data():
+    """Factory of small synthetic ExperimentalData runs, keyed by seed."""
+    from simulations.analysis.experimental_analysis import ExperimentalData
+
+    def make(seed=0, n_points=2000):
+        rng = np.random.default_rng(seed)
+        field = rng.normal(0, 1, n_points)
+        return ExperimentalData(
+            timestamps=np.linspace(0, 100, n_points),
+            chsh_values=2.4 + 0.1 * np.abs(field) + rng.normal(0, 0.05, n_points),
+            correlations={},
+            environmental_fields={"magnetic_field": field},
+            detector_counts={},
+            analyzer_settings={},
+            metadata={"source_file": f"run_{seed}.csv"},
+        )
+
+    return make
+
+
+@pytest.fixture
+def bell_trials():
+    """
+    Generator of CHSH trials on a maximally entangled pair.
+
+    Called as ``bell_trials(n, rng)``; returns the analyzer settings
+    ``sa``, ``sb`` and outcomes ``a``, ``b`` (0 for +, 1 for -) of each
+    trial, at the angles that maximise S.
+    """
+
+    def trials(n, rng):
+        sa, sb = rng.integers(0, 2, n), rng.integers(0, 2, n)
+        angle = np.array([0, np.pi / 4])[sa] - np.array([np.pi / 8, 3 * np.pi / 8])[sb]
+        a = rng.integers(0, 2, n)
+        b = np.where(rng.random(n) < np.cos(angle) ** 2, a, 1 - a)
+        return sa, sb, a, b
+
+    return trials
+
+
 def assert_physics_compliant(S_value, tolerance=1e-10):
     """Assert that CHSH parameter respects physics bounds."""
     tsirelson_bound = 2 * np.sqrt(2)
@@ -6,6 +6,7 @@ to ensure correctness, physics compliance, and numerical stability.
 """
 
 import unittest
+import pytest
 import numpy as np
 import numpy.testing as npt
 from unittest.mock import Mock, patch
@@ -30,6 +31,7 @@ try:
     from simulations.analysis.experimental_analysis import (
         CHSHAnalyzer,
         EnvironmentalCorrelationAnalyzer,
+        ExperimentalData,
     )
 except ImportError as e:
     print(f"Warning: Could not import modules for testing: {e}")
@@ -146,6 +148,47 @@ class TestQuantumBoundsValidator:
         assert not result.is_valid
         assert not result.bounds_checked["normalization"]
 
+    def test_fused_bounds_match_individual_validators(self):
+        """Test fused kernel agrees with the per-quantity validators."""
+        S = np.array([1.9, 2.5, 3.0])
+        correlations = {"E_00": 0.7, "E_01": np.array([-0.5, 1.2])}
+        probs = np.array([-0.1, 0.6, 0.3, 0.2])
+        amplification = np.array([0.9, 1.6])
+
+        fused = self.validator.check_bounds(
+            S=S,
+            correlations=correlations,
+            probabilities=probs,
+            amplification=amplification,
+        )
+
+        assert not fused.is_valid
+        chsh = self.validator.validate_chsh_parameter(S)
+        for key, value in chsh.bounds_checked.items():
+            assert fused.bounds_checked[f"chsh_{key}"] == value
+        probs_result = self.validator.validate_probabilities(probs)
+        for key, value in probs_result.bounds_checked.items():
+            assert fused.bounds_checked[f"prob_{key}"] == value
+        amp = self.validator.validate_amplification_factor(amplification)
+        for key, value in amp.bounds_checked.items():
+            assert fused.bounds_checked[f"amp_{key}"] == value
+        assert not fused.bounds_checked["corr_correlation_bounds"]
+        assert "Tsirelson bound violated" in fused.violations[0]
+
+    def test_fast_fail_stops_at_first_violation(self):
+        """Test fast-fail mode returns after the first violated bound."""
+        result = self.validator.check_bounds(
+            S=np.array([3.0, -1.0]), fast_fail=True
+        )
+
+        assert not result.is_valid
+        assert len(result.violations) == 1
+        assert result.warnings == []
+        assert not self.validator.is_physical(S=np.array([3.0]))
+        assert self.validator.is_physical(
+            S=np.array([2.5]), amplification=np.array([1.05])
+        )
+
 
 class TestEnvironmentalFieldSimulator:
     """Test environmental field simulator functionality."""
@@ -341,6 +384,88 @@ class TestCHSHAnalyzer:
         if "E_01" in correlations:
             assert correlations["E_01"][0] == -1.0  # Perfect anti-correlation
 
+    def test_count_array_matches_dict_path(self):
+        """Test vectorized count-array analysis against the dict path."""
+        rng = np.random.default_rng(0)
+        count_array = rng.poisson(50, size=(200, 4, 4))
+        count_array[0, 2] = 0  # Empty setting in one window
+
+        counts = {
+            f"AB_{setting}_{outcome}": count_array[:, i, j]
+            for i, setting in enumerate(["00", "01", "10", "11"])
+            for j, outcome in enumerate(["pp", "pm", "mp", "mm"])
+        }
+        npt.assert_array_equal(
+            self.analyzer.counts_to_array(counts), count_array
+        )
+
+        result = self.analyzer.analyze_count_array(count_array)
+        correlations = self.analyzer.correlation_from_counts(counts)
+
+        for i, setting in enumerate(["00", "01", "10", "11"]):
+            npt.assert_allclose(
+                result["correlations"][:, i], correlations[f"E_{setting}"]
+            )
+        npt.assert_allclose(
+            result["chsh_values"],
+            self.analyzer.calculate_chsh_parameter(correlations),
+        )
+        assert result["correlations"][0, 2] == 0.0
+        assert result["correlation_errors"][0, 2] == 0.0
+
+        # Poisson error of E matches sqrt((1 - E²) / N)
+        N = result["coincidences"][1:]
+        E = result["correlations"][1:]
+        npt.assert_allclose(
+            result["correlation_errors"][1:], np.sqrt((1 - E**2) / N)
+        )
+
+    def test_chunked_smoothing_matches_full_filter(self):
+        """Test overlapping-chunk smoothing equals a full savgol pass."""
+        from scipy import signal
+
+        values = np.random.normal(2.4, 0.05, 5000)
+        window = self.analyzer.smoothing_window(len(values))
+
+        assert window % 2 == 1
+        npt.assert_allclose(
+            self.analyzer.smooth_series(values, chunk_size=700),
+            signal.savgol_filter(values, window, 3),
+        )
+
+    def test_time_evolution_short_and_decimated_series(self):
+        """Test time evolution on tiny series and decimated views."""
+        for n_points in [3, 8, 25]:
+            data = ExperimentalData(
+                timestamps=np.arange(n_points, dtype=float),
+                chsh_values=np.linspace(2.0, 2.5, n_points),
+                correlations={},
+                environmental_fields={},
+                detector_counts={},
+                analyzer_settings={},
+            )
+            result = self.analyzer.analyze_time_evolution(data)
+            npt.assert_allclose(result["max_chsh"], 2.5)
+
+        times = np.linspace(0, 100, 100000)
+        chsh = 2.4 + 0.1 * np.sin(np.pi * times / 100)
+        data = ExperimentalData(
+            timestamps=times[::-1],
+            chsh_values=chsh[::-1],
+            correlations={},
+            environmental_fields={},
+            detector_counts={},
+            analyzer_settings={},
+        )
+        result = self.analyzer.analyze_time_evolution(
+            data, max_points=1000, keep_smoothed=False
+        )
+
+        assert result["decimation_factor"] == 100
+        assert result["chsh_smooth"] is None
+        assert abs(result["time_to_max"] - 50) < 1
+        assert result["initial_enhancement_rate"] > 0
+
 
 class TestEnvironmentalCorrelationAnalyzer:
     """Test environmental correlation analysis."""
@@ -383,6 +508,10 @@ class TestEnvironmentalCorrelationAnalyzer:
 
         # Should detect positive correlation
         assert result["correlation_coefficient"] > 0
+        assert result["is_significant"]
+        assert not self.analyzer.correlation_analysis(
+            chsh_values, field_variance, alpha=0.0
+        )["is_significant"]
 
     def test_lag_correlation_analysis(self):
         """Test time-lagged correlation analysis."""
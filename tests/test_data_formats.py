@@ -0,0 +1,177 @@
+"""
+Tests for on-disk experimental data formats.
+"""
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from simulations.analysis.data_formats import (
+    LazyArray,
+    materialize,
+    read_hdf5,
+    select_time_range,
+    write_hdf5,
+)
+from simulations.analysis.experimental_analysis import ExperimentalData
+
+
+def _make_data(n_points=5000, seed=0):
+    """Create a small synthetic run."""
+    rng = np.random.default_rng(seed)
+    return ExperimentalData(
+        timestamps=np.arange(n_points) * 0.1,
+        chsh_values=2.4 + 0.05 * rng.standard_normal(n_points),
+        correlations={"E_ab": rng.uniform(-1, 1, n_points)},
+        environmental_fields={"temperature": 300 + rng.normal(0, 1, n_points)},
+        detector_counts={"count_A": rng.poisson(100, n_points)},
+        analyzer_settings={},
+        metadata={"run": "test"},
+    )
+
+
+class TestHDF5Format:
+    """Test chunked HDF5 storage with lazy views."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pytest.importorskip("h5py")
+        self.data = _make_data()
+
+    def test_round_trip_is_lazy_and_exact(self, tmp_path):
+        """Test written data reads back identically through lazy views."""
+        path = write_hdf5(self.data, tmp_path / "run.h5", chunk_size=512)
+        loaded = read_hdf5(path)
+
+        assert isinstance(loaded.chsh_values, LazyArray)
+        assert loaded.metadata["run"] == "test"
+        npt.assert_array_equal(loaded.chsh_values[10:20], self.data.chsh_values[10:20])
+
+        eager = materialize(loaded)
+        npt.assert_array_equal(eager.timestamps, self.data.timestamps)
+        npt.assert_array_equal(
+            eager.detector_counts["count_A"], self.data.detector_counts["count_A"]
+        )
+        assert np.mean(loaded.chsh_values) == pytest.approx(
+            np.mean(self.data.chsh_values)
+        )
+
+    def test_partial_time_range_read(self, tmp_path):
+        """Test a time range selects the same samples as an in-memory mask."""
+        path = write_hdf5(self.data, tmp_path / "run.h5")
+        loaded = read_hdf5(path, time_range=(100.0, 150.0))
+        mask = (self.data.timestamps >= 100.0) & (self.data.timestamps < 150.0)
+
+        assert len(loaded.timestamps) == mask.sum()
+        npt.assert_array_equal(
+            np.asarray(loaded.environmental_fields["temperature"]),
+            self.data.environmental_fields["temperature"][mask],
+        )
+
+        in_memory = select_time_range(self.data, (100.0, 150.0))
+        npt.assert_array_equal(in_memory.chsh_values, self.data.chsh_values[mask])
+
+
+class TestColumnarFormats:
+    """Test Parquet and Arrow IPC storage."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pytest.importorskip("pyarrow")
+        self.data = _make_data()
+
+    @pytest.mark.parametrize("suffix", ["parquet", "arrow"])
+    def test_round_trip_with_projection_and_time_range(self, tmp_path, suffix):
+        """Test projected, time-filtered reads match in-memory selection."""
+        from simulations.analysis import data_formats
+
+        write = getattr(data_formats, f"write_{suffix}")
+        read = getattr(data_formats, f"read_{suffix}")
+        path = write(self.data, tmp_path / f"run.{suffix}", 1000)
+
+        full = read(path)
+        npt.assert_array_equal(full.chsh_values, self.data.chsh_values)
+        assert full.metadata["run"] == "test"
+
+        subset = read(
+            path, columns=["environmental_fields"], time_range=(100.0, 150.0)
+        )
+        mask = (self.data.timestamps >= 100.0) & (self.data.timestamps < 150.0)
+        npt.assert_array_equal(subset.timestamps, self.data.timestamps[mask])
+        npt.assert_array_equal(
+            subset.environmental_fields["temperature"],
+            self.data.environmental_fields["temperature"][mask],
+        )
+        assert subset.correlations == {}
+        assert len(subset.chsh_values) == 0
+
+    def test_unknown_column_rejected(self, tmp_path):
+        """Test projection on a missing column raises."""
+        from simulations.analysis.data_formats import read_parquet, write_parquet
+
+        path = write_parquet(self.data, tmp_path / "run.parquet")
+        with pytest.raises(ValueError):
+            read_parquet(path, columns=["magnetic_field"])
+
+
+class TestRawRunFormat:
+    """Test the memory-mapped raw binary run format."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.data = _make_data()
+
+    def test_round_trip_is_memory_mapped(self, tmp_path):
+        """Test channels reopen as memmaps with identical contents."""
+        from simulations.analysis.data_formats import read_raw_run, write_raw_run
+
+        index_path = write_raw_run(self.data, tmp_path / "run")
+        loaded = read_raw_run(index_path)
+
+        assert isinstance(loaded.chsh_values, np.memmap)
+        npt.assert_array_equal(loaded.chsh_values, self.data.chsh_values)
+        npt.assert_array_equal(
+            loaded.detector_counts["count_A"], self.data.detector_counts["count_A"]
+        )
+        assert loaded.metadata["run"] == "test"
+
+        subset = read_raw_run(tmp_path / "run", time_range=(100.0, 150.0))
+        mask = (self.data.timestamps >= 100.0) & (self.data.timestamps < 150.0)
+        npt.assert_array_equal(subset.timestamps, self.data.timestamps[mask])
+
+    def test_streamed_channels_use_sample_clock(self, tmp_path):
+        """Test block-appended channels get timestamps from the sample rate."""
+        from simulations.analysis.data_formats import RawRunWriter, read_raw_run
+
+        with RawRunWriter(tmp_path / "daq", sample_rate=1e3, time_origin=5.0) as w:
+            w.add_channel("ch1", np.int16)
+            for block in np.arange(3000, dtype=np.int16).reshape(3, 1000):
+                w.append("ch1", block)
+
+        loaded = read_raw_run(tmp_path / "daq", time_range=(6.0, 7.0))
+        channel = loaded.environmental_fields["ch1"]
+
+        assert channel.dtype == np.dtype("<i2")
+        npt.assert_array_equal(channel, np.arange(1000, 2000))
+        npt.assert_allclose(loaded.timestamps[[0, -1]], [6.0, 6.999])
+
+    def test_scaled_channels_read_as_volts(self, tmp_path):
+        """Test ADC code channels with scale/offset convert lazily on read."""
+        from simulations.analysis.data_formats import (
+            LazyArray,
+            RawRunWriter,
+            read_raw_run,
+        )
+
+        codes = np.arange(-500, 500, dtype=np.int16)
+        with RawRunWriter(tmp_path / "daq", sample_rate=1e3) as w:
+            w.add_channel("ch1", np.int16, scale=1e-3, offset=0.25)
+            w.append("ch1", codes)
+
+        channel = read_raw_run(tmp_path / "daq").environmental_fields["ch1"]
+
+        assert isinstance(channel, LazyArray)
+        assert channel.dtype == np.float64
+        npt.assert_allclose(channel[10:20], codes[10:20] * 1e-3 + 0.25)
+        npt.assert_allclose(np.asarray(channel), codes * 1e-3 + 0.25)
+        assert (tmp_path / "daq" / "ch1.bin").stat().st_size == codes.nbytes
@@ -0,0 +1,44 @@
+"""
+Tests for display decimation of long time series.
+"""
+
+import numpy as np
+import numpy.testing as npt
+
+from simulations.analysis.decimation import lttb_decimate, minmax_decimate
+
+
+class TestDecimation:
+    """Test min/max and LTTB decimation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(5)
+        self.x = np.arange(100_003, dtype=float)
+        self.y = rng.normal(0, 1, len(self.x))
+        self.y[54_321] = 25.0  # Isolated spike
+
+    def test_minmax_preserves_envelope(self):
+        """Test extrema and spikes survive min/max decimation."""
+        x, y = minmax_decimate(self.x, self.y, 500)
+
+        assert len(x) <= 2 * 500 + 2
+        assert np.all(np.diff(x) > 0)
+        assert y.max() == self.y.max() and y.min() == self.y.min()
+        assert 54_321 in x
+
+    def test_lttb_keeps_endpoints_and_spike(self):
+        """Test LTTB output size, ordering and feature retention."""
+        x, y = lttb_decimate(self.x, self.y, 1000)
+
+        assert len(x) == 1000
+        assert np.all(np.diff(x) > 0)
+        npt.assert_array_equal(x[[0, -1]], self.x[[0, -1]])
+        assert 25.0 in y
+
+    def test_short_series_unchanged(self):
+        """Test series already below the budget are returned as-is."""
+        x, y = minmax_decimate(self.x[:100], self.y[:100], 500)
+        npt.assert_array_equal(y, self.y[:100])
+        x, y = lttb_decimate(self.x[:100], self.y[:100], 500)
+        npt.assert_array_equal(y, self.y[:100])
@@ -0,0 +1,119 @@
+"""
+Tests for streaming DAQ ring buffers to disk.
+"""
+
+import time
+
+import numpy as np
+import numpy.testing as npt
+
+from hardware.disk_streamer import DiskStreamWriter
+from hardware.hardware_manager import ExperimentConfig, HardwareManager
+from hardware.interfaces.data_acquisition import HighSpeedDigitizer
+from hardware.interfaces.ring_buffer import RingBuffer
+from simulations.analysis.data_formats import LazyArray, read_raw_run
+
+
+class TestDiskStreamWriter:
+    """Test background draining of ring buffers into raw runs."""
+
+    def test_streams_every_sample_in_order(self, tmp_path):
+        """Test a run written in many batches matches the produced samples."""
+        ring = RingBuffer(4096, dtype=np.int16)
+        streamer = DiskStreamWriter(
+            tmp_path / "run", {"ch1": ring.add_reader("disk")},
+            sample_rate=1e3, batch_bytes=1024, max_latency=0.01,
+            fsync_policy="batch"
+        )
+        streamer.start()
+        expected = np.arange(20000, dtype=np.int16)
+        for block in np.array_split(expected, 100):
+            while ring.write_index - streamer.readers["ch1"].cursor > 2048:
+                time.sleep(0.001)  # Stay within the buffer
+            ring.write(block)
+        stats = streamer.stop()
+
+        data = read_raw_run(tmp_path / "run")
+        npt.assert_array_equal(data.environmental_fields["ch1"], expected)
+        assert data.environmental_fields["ch1"].dtype == np.int16
+        assert stats["samples_lost"] == 0
+        assert stats["bytes_written"] == expected.nbytes
+        assert stats["fsyncs"] > 1
+
+    def test_batches_fit_in_small_ring_buffer(self, tmp_path):
+        """Test a batch larger than the buffer does not wait for max_latency."""
+        ring = RingBuffer(16384, dtype=np.int16)
+        streamer = DiskStreamWriter(
+            tmp_path / "run", {"ch1": ring.add_reader("disk")},
+            sample_rate=1e3, max_latency=60.0  # Default 8 MB batches
+        )
+        streamer.start()
+        expected = np.arange(100000).astype(np.int16)
+        for block in np.array_split(expected, 400):
+            ring.write(block)
+            time.sleep(0.001)
+        stats = streamer.stop()
+
+        npt.assert_array_equal(
+            read_raw_run(tmp_path / "run").environmental_fields["ch1"], expected
+        )
+        assert stats["samples_lost"] == 0
+        assert stats["channels"]["ch1"]["batches"] > 1
+
+    def test_overrun_keeps_samples_aligned(self, tmp_path):
+        """Test lost samples keep their slots and are listed as gaps."""
+        ring = RingBuffer(100)
+        streamer = DiskStreamWriter(
+            tmp_path / "run", {"ch1": ring.add_reader("disk")},
+            sample_rate=1.0
+        )
+        ring.write(np.arange(250.0))  # Overruns before the writer starts
+        streamer.start()
+        stats = streamer.stop()
+
+        data = read_raw_run(tmp_path / "run")
+        samples = np.asarray(data.environmental_fields["ch1"])
+        assert len(samples) == len(data.timestamps) == 250
+        npt.assert_array_equal(samples[150:], np.arange(150.0, 250.0))
+        assert data.metadata["gaps"] == {"ch1": [[0, 150]]}
+        assert stats["channels"]["ch1"]["overruns"] == 1
+
+
+def test_experiment_streams_daq_data(tmp_path):
+    """Test run_experiment streams DAQ data to disk and maps it back."""
+    manager = HardwareManager({})
+    daq = HighSpeedDigitizer("daq1", {"sample_rate": 1e5})
+    daq.connect()
+    manager.data_acquisition["daq1"] = daq
+
+    config = ExperimentConfig(
+        measurement_duration=0.2, auto_calibrate=False,
+        output_directory=str(tmp_path)
+    )
+    assert manager.run_experiment(config)
+
+    channels = manager.measurement_data["daq1"]
+    assert set(channels) == {"1", "2"}
+    assert isinstance(channels["1"], LazyArray)  # Volts computed on access
+    assert len(channels["1"]) > 0
+    assert np.abs(channels["1"][:1000]).max() < 1.0
+    assert manager.stream_stats["daq1"]["samples_lost"] == 0
+    # Raw 14-bit codes on disk
+    codes = np.fromfile(tmp_path / "daq1" / "ch1.bin", dtype="<i2")
+    assert len(codes) == len(channels["1"])
+
+
+def test_saved_run_starts_at_acquisition(tmp_path):
+    """Test runs saved after acquisition keep the acquisition start time."""
+    manager = HardwareManager({})
+    daq = HighSpeedDigitizer("daq1", {"sample_rate": 1e5})
+    daq.connect()
+    manager.data_acquisition["daq1"] = daq
+
+    before = time.time()
+    config = ExperimentConfig(measurement_duration=0.3, auto_calibrate=False)
+    assert manager.run_experiment(config)
+    manager.save_raw_runs(str(tmp_path))
+
+    data = read_raw_run(tmp_path / "daq1")
+    assert before <= data.timestamps[0] < before + 0.1
@@ -0,0 +1,152 @@
+"""
+Import-time checks for the package and the analysis CLI.
+
+Each case runs in a fresh interpreter, so the set of loaded modules is
+not affected by other tests. Timings are measured against a bare
+``import numpy`` in the same environment, so a loaded machine slows both
+sides alike.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+HEAVY_MODULES = ("scipy", "pandas", "matplotlib", "seaborn")
+SIMPLE_SIMULATION = (
+    "from simulations import CHSHExperimentSimulator, "
+    "EnvironmentalFieldSimulator\n"
+    "env = EnvironmentalFieldSimulator(field_mass=1e-6, "
+    "coupling_strength=1e-3, temperature=300.0)\n"
+    "CHSHExperimentSimulator(env).simulate_bell_experiment(n_trials=100)"
+)
+CLI_HELP = (
+    "import runpy, sys\n"
+    "sys.argv = ['analyze_experimental_data.py', '--help']\n"
+    "try:\n"
+    "    runpy.run_path('scripts/analyze_experimental_data.py', "
+    "run_name='__main__')\n"
+    "except SystemExit:\n"
+    "    pass"
+)
+# Allowed start-up cost over the NumPy baseline: a ratio plus a fixed
+# margin, both generous enough for shared CI runners.
+BASELINE_RATIO = 3.0
+BASELINE_MARGIN = 0.5
+# Budget for the self time of the package's own modules.
+PACKAGE_SELF_TIME_BUDGET = 0.25
+
+
+def _run(args):
+    """Run a command from the repository root; return its stdout."""
+    result = subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def _loaded_heavy_modules(statement):
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    return _run(["-c", code])
+
+
+def _wall_time(code, repeats=3):
+    """Best-of-``repeats`` wall-clock time of ``python -c code``."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _run(["-c", code])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _package_self_time(code):
+    """Sum the ``-X importtime`` self times of ``simulations`` modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if fields[-1].strip().startswith("simulations"):
+            total_us += int(fields[0])
+    return total_us / 1e6
+
+
+class TestImportTime:
+    """Test that light entry points do not import heavy dependencies."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import simulations",
+            "from simulations import EnvironmentalFieldSimulator",
+            "from simulations.core import CHSHExperimentSimulator",
+            "import simulations.analysis.experimental_analysis",
+        ],
+    )
+    def test_package_import_is_light(self, statement):
+        """Test package imports pull in NumPy only."""
+        assert _loaded_heavy_modules(statement).strip() == ""
+
+    def test_simple_simulation_is_light(self):
+        """Test a small CHSH simulation runs without SciPy or plotting."""
+        stdout = _loaded_heavy_modules(SIMPLE_SIMULATION)
+
+        assert stdout.strip() == ""
+
+    def test_cli_help_is_light(self):
+        """Test the analysis CLI prints --help without heavy imports."""
+        stdout = _loaded_heavy_modules(CLI_HELP)
+        lines = stdout.splitlines()
+
+        assert "--data-file" in stdout
+        assert lines[-1] == ""
+
+
+class TestImportTimeBenchmark:
+    """Benchmark start-up time of the light entry points."""
+
+    @pytest.mark.parametrize(
+        "name, code",
+        [("simple_simulation", SIMPLE_SIMULATION), ("cli_help", CLI_HELP)],
+    )
+    def test_startup_close_to_numpy_baseline(self, name, code, record_property):
+        """Test start-up stays within a margin of a bare NumPy import."""
+        baseline = _wall_time("import numpy")
+        elapsed = _wall_time(code)
+        record_property(f"{name}_seconds", elapsed)
+        record_property("numpy_baseline_seconds", baseline)
+        print(f"{name}: {elapsed:.3f}s (numpy baseline {baseline:.3f}s)")
+
+        assert elapsed < BASELINE_RATIO * baseline + BASELINE_MARGIN
+
+    def test_package_self_import_time(self, record_property):
+        """Test the package's own modules import well under a second."""
+        self_time = _package_self_time(
+            "import simulations\n"
+            "from simulations import EnvironmentalFieldSimulator\n"
+            "from simulations.core import CHSHExperimentSimulator\n"
+            "import simulations.analysis.experimental_analysis"
+        )
+        record_property("package_self_import_seconds", self_time)
+        print(f"simulations self import time: {self_time:.3f}s")
+
+        assert self_time < PACKAGE_SELF_TIME_BUDGET
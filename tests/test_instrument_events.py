@@ -0,0 +1,89 @@
+"""
+Tests for SRQ/polling instrument event waits.
+"""
+
+import asyncio
+import threading
+import time
+
+from hardware.drivers.events import InstrumentEvent
+from hardware.drivers.temperature_control import LakeShoreTemperatureDriver
+
+
+class Flag:
+    """Condition that becomes true after a delay."""
+
+    def __init__(self, delay: float):
+        self.ready_at = time.perf_counter() + delay
+
+    def __call__(self) -> bool:
+        return time.perf_counter() >= self.ready_at
+
+
+class FakeLakeShore:
+    """Controller stub whose temperature approaches the setpoint."""
+
+    def __init__(self, readings):
+        self.readings = iter(readings)
+
+    def query(self, message):
+        assert message == "KRDG? A"
+        return f"{next(self.readings)}\r\n"
+
+
+class TestInstrumentEvent:
+    """Test wake-ups, timeouts and latency metrics."""
+
+    def test_polling_fallback_and_timeout(self):
+        """Test polling detects the condition and timeouts are counted."""
+        event = InstrumentEvent("poll", Flag(0.1), poll_interval=0.01)
+        assert event.wait(timeout=2.0)
+        assert not InstrumentEvent("never", lambda: False).wait(timeout=0.05)
+
+        stats = event.stats.summary()
+        assert stats["waits"] == 1 and stats["timeouts"] == 0
+        assert stats["polls"] > 2
+        assert 0.1 <= stats["last_wait"] < 0.5
+
+    def test_service_request_wakes_waiter(self):
+        """Test notify() ends a wait long before the safety poll."""
+        state = {"done": False}
+        event = InstrumentEvent("srq", lambda: state["done"], srq_poll_interval=5.0)
+        event.srq_enabled = True
+
+        def fire():
+            time.sleep(0.1)
+            state["done"] = True
+            event.notify()
+
+        threading.Thread(target=fire).start()
+        start = time.perf_counter()
+        assert event.wait(timeout=10.0)
+        assert time.perf_counter() - start < 1.0
+
+        stats = event.stats.summary()
+        assert stats["polls"] == 2 and stats["srq_wakeups"] == 1
+        assert stats["max_wake_latency"] < 0.5
+
+
+def test_instruments_wait_concurrently():
+    """Test many asyncio waits overlap, including temperature settling."""
+    controller = LakeShoreTemperatureDriver(
+        "GPIB::12", {"stable_readings": 3, "settle_poll_interval": 0.05}
+    )
+    controller.instrument = FakeLakeShore([290.0, 299.5, 300.0, 300.0, 300.001])
+    controller.is_connected = True
+    controller.setpoint = 300.0
+    events = [InstrumentEvent(f"dev{i}", Flag(0.3), poll_interval=0.02) for i in range(20)]
+
+    async def main():
+        return await asyncio.gather(
+            controller.wait_for_stable_temperature_async(timeout=5.0),
+            *(event.wait_async(timeout=5.0) for event in events),
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    assert all(results)
+    assert time.perf_counter() - start < 1.5  # 6 s if waited one by one
+    assert controller.settle_event.stats.polls == 5
@@ -0,0 +1,131 @@
+"""
+Tests for the simulated SCPI instrument backend.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.drivers.oscilloscope import KeysightOscilloscopeDriver
+from hardware.drivers.signal_generator import KeysightSignalGeneratorDriver
+from hardware.drivers.temperature_control import LakeShoreTemperatureDriver
+from hardware.hardware_manager import ExperimentConfig, HardwareManager
+from hardware.instrument_simulator import (
+    LinkProfile,
+    SimulatedOscilloscope,
+    SimulatedSignalGenerator,
+    SimulatedTemperatureController,
+    SimulatedVisaError,
+    default_simulator,
+)
+
+
+@pytest.fixture
+def simulator():
+    """The process-wide simulator, emptied and restored around each test."""
+    simulator = default_simulator()
+    profile = simulator.profile
+    simulator.clear()
+    yield simulator
+    simulator.clear()
+    simulator.profile = profile
+
+
+class TestSimulatedInstruments:
+    """Test the drivers against simulated instruments."""
+
+    def test_drivers_round_trip(self, simulator):
+        """Test waveform transfer, settings and settling through the drivers."""
+        scope = simulator.add(
+            "SIM::scope::roundtrip",
+            SimulatedOscilloscope(LinkProfile(throughput=50e6), points=100_000),
+        )
+        simulator.add(
+            "SIM::tempctl::roundtrip", SimulatedTemperatureController(time_constant=0.02)
+        )
+
+        driver = KeysightOscilloscopeDriver("SIM::scope::roundtrip", {})
+        assert driver.connect() and driver.configure_channel(1, 2.0)
+        waveform = driver.acquire_waveform([1])["CH1"]
+        assert waveform["record_length"] == 100_000
+        assert abs(np.ptp(waveform["voltage"]) - 0.8 * 2.0) < 0.2
+        # WORD samples plus block header and terminator
+        assert scope.stats.bytes_read >= 200_000
+
+        generator = KeysightSignalGeneratorDriver("SIM::siggen::roundtrip", {})
+        assert generator.connect() and generator.set_frequency(1, 2.5e6)
+        assert generator.enable_output(1)
+        channel = generator.get_status()["channels"][1]
+        assert channel["actual_frequency"] == 2.5e6 and channel["actual_enabled"]
+
+        controller = LakeShoreTemperatureDriver(
+            "SIM::tempctl::roundtrip", {"settle_poll_interval": 0.01, "stable_readings": 3}
+        )
+        assert controller.connect() and controller.enable_control()
+        assert controller.set_temperature(77.0)
+        assert controller.wait_for_stable_temperature(timeout=5.0)
+        assert abs(controller.get_temperature() - 77.0) < 0.01
+
+    def test_fault_injection(self, simulator):
+        """Test injected errors, lost responses and dropped links."""
+        simulator.add(
+            "SIM::siggen::flaky", SimulatedSignalGenerator(LinkProfile(error_rate=1.0))
+        )
+        assert not KeysightSignalGeneratorDriver("SIM::siggen::flaky", {}).connect()
+
+        simulator.add(
+            "SIM::tempctl::lossy",
+            SimulatedTemperatureController(LinkProfile(timeout_rate=1.0)),
+        )
+        session = simulator.open_resource("SIM::tempctl::lossy")
+        session.timeout = 50
+        start = time.perf_counter()
+        with pytest.raises(SimulatedVisaError, match="timeout"):
+            session.query("KRDG? A")
+        assert time.perf_counter() - start >= 0.05
+
+        simulator.add(
+            "SIM::tempctl::unplugged",
+            SimulatedTemperatureController(LinkProfile(disconnect_after=6)),
+        )
+        controller = LakeShoreTemperatureDriver("SIM::tempctl::unplugged", {})
+        assert controller.connect()
+        assert controller.get_status()["connected"]
+        assert np.isnan(controller.get_temperature())
+
+
+def test_run_experiment_end_to_end(simulator):
+    """Test bring-up, a run, status polling and shutdown without hardware."""
+    simulator.profile = LinkProfile(latency=0.005)
+    config = {
+        "quantum_sensors": {"spad": {"type": "single_photon_detector"}},
+        "data_acquisition": {"daq": {"type": "high_speed_digitizer", "sample_rate": 1e5}},
+        "drivers": {},
+    }
+    for i in range(4):
+        config["drivers"][f"scope{i}"] = {"type": "oscilloscope", "address": f"SIM::scope::e2e{i}"}
+        config["drivers"][f"gen{i}"] = {"type": "signal_generator", "address": f"SIM::siggen::e2e{i}"}
+        config["drivers"][f"temp{i}"] = {
+            "type": "temperature_controller", "address": f"SIM::tempctl::e2e{i}"
+        }
+
+    manager = HardwareManager(config)
+    try:
+        start = time.perf_counter()
+        assert manager.initialize_hardware()
+        assert time.perf_counter() - start < 3.0  # 4 s of scope resets if serial
+        assert len(manager.drivers) == 12
+
+        experiment = ExperimentConfig(measurement_duration=0.2, channels_to_record=[0, 1])
+        assert manager.run_experiment(experiment)
+        assert "daq" in manager.measurement_data
+
+        status = manager.get_system_status()
+        assert status["system_health"] == "healthy"
+        assert status["drivers"]["temp0"]["current_temperature"] == pytest.approx(300, abs=0.1)
+        assert manager.drivers["scope0"].acquire_waveform([1])["CH1"]["record_length"] == 10_000
+    finally:
+        assert manager.shutdown_hardware()
+    assert len(simulator.instruments) == 12
+    assert all(inst.stats.writes > 0 for inst in simulator.instruments.values())
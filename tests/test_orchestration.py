@@ -0,0 +1,133 @@
+"""
+Tests for concurrent device orchestration.
+"""
+
+import asyncio
+import time
+
+from hardware.hardware_manager import HardwareManager
+from hardware.interfaces.field_generators import ElectromagneticFieldGenerator
+from hardware.orchestration import DeviceOrchestrator
+
+
+class SlowDevice:
+    """Device whose blocking calls take a fixed time."""
+
+    def __init__(self, delay: float, connected: bool = True):
+        self.delay = delay
+        self.connected = connected
+        self.disconnected = False
+
+    def get_status(self):
+        time.sleep(self.delay)
+        return {"connected": self.connected}
+
+    def disconnect(self):
+        time.sleep(self.delay)
+        self.disconnected = True
+        return True
+
+    def calibrate(self):
+        time.sleep(self.delay)
+        return True
+
+
+class TestDeviceOrchestrator:
+    """Test bounded, timed-out concurrent device calls."""
+
+    def test_calls_run_concurrently(self):
+        """Test a group of calls takes as long as the slowest one."""
+        orchestrator = DeviceOrchestrator(max_workers=10)
+        calls = {f"dev{i}": (time.sleep, (0.2,), None) for i in range(10)}
+
+        start = time.perf_counter()
+        results = asyncio.run(orchestrator.gather(calls))
+        elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in results.values())
+        assert elapsed < 1.0  # 2 s if run one after another
+
+    def test_timeout_and_fail_fast(self):
+        """Test timeouts are reported and fail-fast cancels queued calls."""
+        orchestrator = DeviceOrchestrator(max_workers=1)
+        ran = []
+        calls = {
+            "hung": (time.sleep, (1.0,), 0.1),
+            "queued": (ran.append, ("queued",), None),
+        }
+
+        results = asyncio.run(orchestrator.gather(calls, fail_fast=True))
+
+        assert results["hung"].timed_out and not results["hung"].success
+        assert results["queued"].cancelled
+        time.sleep(1.0)  # Let the abandoned call finish
+        assert ran == []
+
+    def test_timeout_excludes_queueing(self):
+        """Test queued calls get their full timeout once they start."""
+        orchestrator = DeviceOrchestrator(max_workers=1)
+        calls = {
+            "first": (time.sleep, (0.3,), None),
+            "second": (time.sleep, (0.1,), 0.25),  # Queued for 0.3 s
+        }
+
+        results = asyncio.run(orchestrator.gather(calls))
+
+        assert all(r.success for r in results.values())
+        assert results["second"].elapsed > 0.35
+
+
+def test_manager_polls_and_disconnects_concurrently():
+    """Test status polling and shutdown overlap device latencies."""
+    manager = HardwareManager({"status_timeout": 0.5})
+    for i in range(5):
+        manager.drivers[f"drv{i}"] = SlowDevice(0.2)
+    manager.drivers["hung"] = SlowDevice(2.0)
+
+    start = time.perf_counter()
+    status = manager.get_system_status()
+    assert time.perf_counter() - start < 1.5
+
+    assert status["system_health"] == "degraded"
+    assert status["unhealthy_devices"] == ["drivers.hung"]
+    assert status["drivers"]["drv0"] == {"connected": True}
+
+    del manager.drivers["hung"]
+    assert manager.shutdown_hardware()
+    assert all(d.disconnected for d in manager.drivers.values())
+
+
+def test_hung_device_does_not_exhaust_pool():
+    """Test a hung device is reported busy instead of being queried again."""
+    manager = HardwareManager({"status_timeout": 0.2, "max_workers": 4})
+    for i in range(3):
+        manager.drivers[f"ok{i}"] = SlowDevice(0.01)
+    manager.drivers["hung"] = SlowDevice(2.0)
+
+    for _ in range(6):
+        status = manager.get_system_status()
+        assert status["unhealthy_devices"] == ["drivers.hung"]
+    assert status["drivers"]["hung"]["busy"]
+    assert not status["drivers"]["ok0"].get("busy")
+
+
+
+def test_calibration_runs_concurrently_in_event_loop():
+    """Test sensors and field generators calibrate concurrently when awaited."""
+    manager = HardwareManager(
+        {"field_calibration": {"field_references": {"em0": 1e-6, "em1": 1e-6}}}
+    )
+    for i in range(2):
+        manager.quantum_sensors[f"spad{i}"] = SlowDevice(0.5)
+        manager.field_generators[f"em{i}"] = ElectromagneticFieldGenerator(
+            f"em{i}", {}
+        )
+
+    async def calibrate():
+        start = time.perf_counter()
+        assert await manager._perform_calibration_async()
+        return time.perf_counter() - start
+
+    assert asyncio.run(calibrate()) < 1.8  # 3 s one device at a time
+    assert len(manager.field_calibration.calibration_history) == 2
+    assert manager.last_calibration_time > 0
@@ -0,0 +1,119 @@
+"""
+Tests for Keysight oscilloscope waveform transfer.
+"""
+
+import asyncio
+
+import numpy as np
+import numpy.testing as npt
+
+from hardware.drivers.oscilloscope import KeysightOscilloscopeDriver
+
+PREAMBLE = dict(xinc=1e-9, xorig=-5e-7, xref=0.0, yinc=2e-4, yorig=0.1, yref=0.0)
+
+
+class FakeScope:
+    """Instrument stub serving binary waveform blocks and recording traffic."""
+
+    def __init__(self, codes):
+        self.codes = codes  # Channel -> int16 sample codes
+        self.preamble = dict(PREAMBLE)
+        self.commands = []
+        self.state = {}
+        self._pending = b""
+
+    def write(self, message):
+        self.commands.append(message)
+        for command in message.split(";"):
+            header, _, value = command.partition(" ")
+            if header == ":WAV:DATA?":
+                codes = self.codes[int(self.state[":WAV:SOUR"][4:])]
+                dtype = "<i2" if self.state[":WAV:FORM"] == "WORD" else "i1"
+                body = codes.astype(dtype).tobytes()
+                length = str(len(body)).encode()
+                self._pending = b"#" + str(len(length)).encode() + length + body + b"\n"
+            elif value:
+                self.state[header] = value
+
+    def query(self, message):
+        self.commands.append(message)
+        if message == ":OPER:COND?":
+            return "8"
+        if message == ":WAV:PRE?":
+            p = self.preamble
+            return ",".join(str(v) for v in (
+                0, 0, len(self.codes[int(self.state[":WAV:SOUR"][4:])]), 1,
+                p["xinc"], p["xorig"], p["xref"], p["yinc"], p["yorig"], p["yref"]
+            ))
+        raise AssertionError(f"Unexpected query {message}")
+
+    def read_bytes(self, count):
+        data, self._pending = self._pending[:count], self._pending[count:]
+        return data
+
+
+def _driver(codes, fmt="WORD"):
+    driver = KeysightOscilloscopeDriver("TCPIP::scope", {"waveform_format": fmt})
+    driver.instrument = FakeScope(codes)
+    driver.is_connected = True
+    return driver
+
+
+class TestAcquireWaveform:
+    """Test binary block decoding and cached transfer state."""
+
+    def test_scaling_and_time_axis(self):
+        """Test codes are scaled with the preamble for every channel."""
+        rng = np.random.default_rng(0)
+        codes = {ch: rng.integers(-32768, 32767, 1000) for ch in (1, 2)}
+        waveforms = _driver(codes).acquire_waveform([1, 2])
+
+        for ch in (1, 2):
+            wf = waveforms[f"CH{ch}"]
+            npt.assert_allclose(wf["voltage"], codes[ch] * 2e-4 + 0.1)
+            npt.assert_allclose(wf["time"], np.arange(1000) * 1e-9 - 5e-7)
+            assert wf["record_length"] == 1000
+            npt.assert_allclose(wf["sample_rate"], 1e9)
+        # One time axis shared by both channels, protected from writes
+        assert waveforms["CH1"]["time"] is waveforms["CH2"]["time"]
+        assert not waveforms["CH1"]["time"].flags.writeable
+
+    def test_repeat_acquisition_reuses_cached_state(self):
+        """Test format and preamble are only sent once, buffers are reused."""
+        codes = {1: np.arange(-500, 500), 2: np.arange(1000) % 100}
+        driver = _driver(codes, fmt="BYTE")
+        first = driver.acquire_waveform([1, 2])
+        driver.instrument.commands.clear()
+
+        out = {"CH1": np.empty(1000), "CH2": np.empty(1000)}
+        second = driver.acquire_waveform([1, 2], out=out)
+
+        assert driver.instrument.commands == [
+            ":SING", ":OPER:COND?",
+            ":WAV:SOUR CHAN1;:WAV:DATA?", ":WAV:SOUR CHAN2;:WAV:DATA?",
+        ]
+        assert second["CH1"]["voltage"] is out["CH1"]
+        npt.assert_allclose(out["CH2"], first["CH2"]["voltage"])
+        npt.assert_allclose(out["CH1"], codes[1].astype(np.int8) * 2e-4 + 0.1)
+
+    def test_record_length_change_refreshes_preamble(self):
+        """Test a changed record length on the instrument is picked up."""
+        driver = _driver({1: np.zeros(1000, dtype=int)})
+        driver.acquire_waveform([1])
+
+        driver.instrument.codes[1] = np.ones(400, dtype=int)
+        driver.instrument.preamble["xinc"] = 4e-9
+        wf = driver.acquire_waveform([1])["CH1"]
+
+        assert wf["record_length"] == 400
+        npt.assert_allclose(wf["sample_rate"], 2.5e8)
+        npt.assert_allclose(wf["time"][1] - wf["time"][0], 4e-9)
+        npt.assert_allclose(wf["voltage"], 0.1 + 2e-4)
+
+    def test_async_acquisition(self):
+        """Test the awaitable acquisition returns the same waveforms."""
+        driver = _driver({1: np.arange(1000)})
+        waveforms = asyncio.run(driver.acquire_waveform_async([1]))
+
+        npt.assert_allclose(waveforms["CH1"]["voltage"], np.arange(1000) * 2e-4 + 0.1)
+        assert driver.trigger_event.stats.waits == 1
@@ -0,0 +1,90 @@
+"""
+Tests for streaming g2(tau) photon correlation.
+"""
+
+import numpy as np
+import numpy.testing as npt
+
+from hardware.interfaces.photon_correlation import G2Correlator
+
+BIN = 1e-9
+TAU_MAX = 50e-9
+
+
+def _tags(seed=0, n=3_000, duration=1e-3, delay=5e-9):
+    """Detector 'a' and detector 'b' seeing a third of 'a's photons late."""
+    rng = np.random.default_rng(seed)
+    a = np.sort(rng.uniform(0, duration, n))
+    b = np.sort(np.concatenate([
+        a[::3] + delay + rng.normal(0, 0.1e-9, len(a[::3])),
+        rng.uniform(0, duration, 2 * n // 3),
+    ]))
+    return {"a": a, "b": b}
+
+
+def _brute_force(start, stop, exclude_self=False):
+    """Reference histogram from all pairwise differences."""
+    diff = stop[None, :] - start[:, None]
+    if exclude_self:
+        np.fill_diagonal(diff, np.inf)
+    diff = diff[np.abs(diff) < (TAU_MAX / BIN + 0.5) * BIN]
+    n_side = int(round(TAU_MAX / BIN))
+    index = np.floor(diff / BIN + 0.5).astype(int) + n_side
+    return np.bincount(index, minlength=2 * n_side + 1)
+
+
+class TestG2Correlator:
+    """Test g2 histograms against brute force and chunked streaming."""
+
+    def test_histograms_match_brute_force(self):
+        """Test cross- and autocorrelation histograms equal all pairs."""
+        tags = _tags()
+        correlator = G2Correlator([("a", "b"), ("a", "a")], TAU_MAX, BIN)
+        correlator.process(tags)
+        correlator.flush()
+
+        npt.assert_array_equal(
+            correlator.histograms[("a", "b")], _brute_force(tags["a"], tags["b"])
+        )
+        npt.assert_array_equal(
+            correlator.histograms[("a", "a")],
+            _brute_force(tags["a"], tags["a"], exclude_self=True),
+        )
+        npt.assert_allclose(correlator.tau[[0, -1]], [-TAU_MAX, TAU_MAX])
+
+    def test_chunked_stream_matches_single_pass(self):
+        """Test carried tags make block-wise histograms exact."""
+        tags = _tags(seed=1, n=20_000)
+        pairs = [("a", "b"), ("b", "a"), ("b", "b")]
+        expected = G2Correlator(pairs, TAU_MAX, BIN)
+        expected.process(tags)
+        expected.flush()
+
+        correlator = G2Correlator(pairs, TAU_MAX, BIN)
+        edges = np.append(np.sort(np.random.default_rng(2).uniform(0, 1e-3, 40)), np.inf)
+        start = -np.inf
+        for end in edges:
+            correlator.process(
+                {k: v[(start <= v) & (v < end)] for k, v in tags.items()}, until=end
+            )
+            start = end
+        correlator.flush()
+
+        for pair in pairs:
+            npt.assert_array_equal(correlator.histograms[pair], expected.histograms[pair])
+
+    def test_g2_normalization(self):
+        """Test g2 is ~1 for accidentals and peaks at the pair delay."""
+        rng = np.random.default_rng(3)
+        a = np.sort(rng.uniform(0, 1.0, 200_000))
+        b = np.sort(np.concatenate([a[::10] + 20e-9, rng.uniform(0, 1.0, 180_000)]))
+        correlator = G2Correlator([("a", "b")], 100e-9, 2e-9)
+        correlator.process({"a": a, "b": b})
+        correlator.flush()
+
+        g2 = correlator.g2(("a", "b"))
+        peak = np.argmax(g2)
+        assert np.isclose(correlator.tau[peak], 20e-9)
+        background = np.delete(g2, peak)
+        assert abs(background.mean() - 1) < 0.05
+        assert g2[peak] > 100
@@ -0,0 +1,158 @@
+"""
+Tests for the real-time DAQ processing pipeline.
+"""
+
+import time
+
+import numpy as np
+import numpy.testing as npt
+
+from hardware.hardware_manager import ExperimentConfig, HardwareManager
+from hardware.interfaces.data_acquisition import HighSpeedDigitizer
+from hardware.interfaces.ring_buffer import RingBuffer
+from hardware.processing_pipeline import (
+    DataBlock,
+    Decimator,
+    LowPassFilter,
+    ProcessingPipeline,
+    chsh_pipeline,
+)
+from simulations.analysis.experimental_analysis import CHSHAnalyzer
+
+DETECTORS = {"A+": "ap", "A-": "am", "B+": "bp", "B-": "bm"}
+SETTINGS = {"A": "sa", "B": "sb"}
+
+
+def _bell_pulses(bell_trials, n_gates, gate, window, seed=0):
+    """Detector pulse channels of maximally entangled pairs, plus true counts."""
+    rng = np.random.default_rng(seed)
+    sa, sb, a, b = bell_trials(n_gates, rng)
+    detected = rng.random(n_gates) < 0.3
+
+    n = n_gates * gate
+    channels = {name: np.zeros(n) for name in ("ap", "am", "bp", "bm")}
+    pulse = np.arange(n_gates) * gate + 1
+    for name, side, outcome in (("ap", a, 0), ("am", a, 1), ("bp", b, 0), ("bm", b, 1)):
+        channels[name][pulse[detected & (side == outcome)]] = 1.0
+    channels["sa"] = np.repeat(sa, gate).astype(float)
+    channels["sb"] = np.repeat(sb, gate).astype(float)
+    channels["field"] = np.sin(np.arange(n) / 5000.0)
+
+    counts = np.zeros((n // window, 4, 4), dtype=np.int64)
+    window_of_gate = np.arange(n_gates) // (window // gate)
+    np.add.at(
+        counts,
+        (window_of_gate, 2 * sa + sb, 2 * a + b),
+        detected.astype(np.int64),
+    )
+    return channels, counts
+
+
+def _feed(pipeline, channels, block_size, sample_rate=1e6):
+    n = len(next(iter(channels.values())))
+    for i, lo in enumerate(range(0, n, block_size)):
+        pipeline.submit(
+            DataBlock(
+                sequence=i,
+                first_sample=lo,
+                sample_rate=sample_rate,
+                channels={k: v[lo : lo + block_size].copy() for k, v in channels.items()},
+                acquired_at=time.perf_counter(),
+            )
+        )
+
+
+class TestProcessingPipeline:
+    """Test stage results against batch processing of the whole stream."""
+
+    def test_chsh_matches_batch_analysis(self, bell_trials):
+        """Test streamed coincidence counts and S(t) equal the batch result."""
+        gate, window = 4, 4000
+        channels, counts = _bell_pulses(bell_trials, 50_000, gate, window)
+        pipeline = ProcessingPipeline(
+            chsh_pipeline(
+                DETECTORS, SETTINGS, window, gate,
+                fields=["field"], variance_window=10
+            ),
+            queue_size=2,
+        )
+        pipeline.start()
+        _feed(pipeline, channels, block_size=7_001)  # Splits gates and windows
+        stats = pipeline.stop()
+        results = pipeline.results()
+
+        expected = CHSHAnalyzer().analyze_count_array(counts)
+        npt.assert_allclose(results["chsh"]["chsh_values"], expected["chsh_values"])
+        assert abs(np.mean(results["chsh"]["chsh_values"]) - 2 * np.sqrt(2)) < 0.1
+        assert results["correlation"]["summary"]["n_samples"] == len(counts)
+        assert "field" in results["correlation"]["field_correlations"]
+        assert stats["blocks_completed"] == stats["blocks_submitted"]
+
+    def test_filter_and_decimation_carry_state(self):
+        """Test block-wise filtering and decimation equal one-shot processing."""
+        from scipy import signal
+
+        x = np.random.default_rng(1).normal(size=10_000)
+        pipeline = ProcessingPipeline([LowPassFilter(1e4), Decimator(7)])
+        outputs = []
+        pipeline.on_result = lambda block: outputs.append(block.channels["x"])
+        pipeline.start()
+        _feed(pipeline, {"x": x}, block_size=999)
+        pipeline.stop()
+
+        sos = signal.butter(4, 1e4, fs=1e6, output="sos")
+        filtered, _ = signal.sosfilt(sos, x, zi=signal.sosfilt_zi(sos) * x[0])
+        n = len(x) // 7 * 7
+        npt.assert_allclose(
+            np.concatenate(outputs), filtered[:n].reshape(-1, 7).mean(axis=1)
+        )
+
+    def test_overrun_keeps_channels_aligned(self):
+        """Test readers caught up to different samples are realigned."""
+        rings = {"a": RingBuffer(100), "b": RingBuffer(100)}
+        readers = {name: ring.add_reader("pipeline") for name, ring in rings.items()}
+        rings["a"].write(np.arange(250.0))
+        rings["b"].write(np.arange(230.0))  # Producer part way through a block
+        blocks = []
+        pipeline = ProcessingPipeline([Decimator(1)])
+        pipeline.on_result = blocks.append
+        pipeline.start(readers, sample_rate=1.0, poll_interval=0.01)
+        time.sleep(0.05)
+        rings["b"].write(np.arange(230.0, 250.0))
+        pipeline.stop()
+
+        for block in blocks:
+            npt.assert_array_equal(block.channels["a"], block.channels["b"])
+            assert block.channels["a"][0] == block.first_sample
+        assert sum(len(block.channels["a"]) for block in blocks) == 100
+        assert pipeline.samples_lost == 150 + 150
+
+
+def test_experiment_processes_daq_blocks_live():
+    """Test run_experiment feeds DAQ blocks through the pipeline."""
+    manager = HardwareManager({})
+    daq = HighSpeedDigitizer("daq1", {"sample_rate": 1e6})
+    daq.connect()
+    manager.data_acquisition["daq1"] = daq
+    roles = {"A+": "0", "A-": "1", "B+": "2", "B-": "3"}
+    manager.configure_processing(
+        "daq1",
+        lambda: chsh_pipeline(
+            roles, {"A": "0", "B": "1"}, window_samples=1000,
+            threshold=0.05, fields=["0"], variance_window=5
+        ),
+    )
+
+    config = ExperimentConfig(
+        measurement_duration=0.3, auto_calibrate=False,
+        channels_to_record=[0, 1, 2, 3]
+    )
+    assert manager.run_experiment(config)
+
+    results = manager.analysis_results["daq1"]
+    assert len(results["chsh"]["chsh_values"]) > 0
+    stats = manager.processing_stats["daq1"]
+    assert stats["blocks_completed"] > 1
+    assert stats["latency"]["max"] < 1.0
+    # Readers are detached once the run is over
+    assert [r.name for r in daq.data_buffer["0"].readers] == ["get_data"]
@@ -0,0 +1,68 @@
+"""
+Tests for the incremental HTML report builder.
+"""
+
+import numpy as np
+
+from simulations.analysis.report_builder import (
+    ReportBuilder,
+    svg_histogram,
+    svg_line_chart,
+)
+
+
+class TestReportBuilder:
+    """Test section caching, live refresh and embedded charts."""
+
+    def test_only_changed_sections_rerender(self, tmp_path):
+        """Test sections re-render only when their key changes."""
+        calls = []
+
+        def _render(name, text):
+            def render():
+                calls.append(name)
+                return f"<p>{text}</p>"
+
+            return render
+
+        builder = ReportBuilder(tmp_path)
+        builder.section("a", "A", 1, _render("a", "first"))
+        builder.section("b", "B", 1, _render("b", "static"))
+        page = builder.write()
+        assert calls == ["a", "b"]
+
+        # A new builder on the same directory reuses stored fragments
+        builder = ReportBuilder(tmp_path)
+        assert builder.section("a", "A", 2, _render("a", "second"))
+        assert not builder.section("b", "B", 1, _render("b", "static"))
+        builder.write()
+
+        assert calls == ["a", "b", "a"]
+        html = page.read_text()
+        assert html.index("second") < html.index("static")
+        assert "first" not in html
+
+    def test_live_refresh_until_finalized(self, tmp_path):
+        """Test live pages auto-refresh and final pages do not."""
+        builder = ReportBuilder(tmp_path, refresh_interval=2)
+        builder.section("a", "A", 1, lambda: "<p>x</p>")
+
+        assert 'http-equiv="refresh" content="2"' in builder.write().read_text()
+        assert "http-equiv" not in builder.finalize().read_text()
+
+    def test_embedded_charts_stay_small(self):
+        """Test SVG size is bounded independently of series length."""
+        rng = np.random.default_rng(0)
+        t = np.arange(1_000_000, dtype=float)
+        s = 2.4 + 0.05 * rng.normal(size=len(t))
+
+        svg = svg_line_chart(
+            {"CHSH": (t, s)},
+            reference_lines={"Classical bound": (2.0, "red")},
+            max_points=1000,
+        )
+        counts, edges = np.histogram(s, bins=50)
+
+        assert svg.startswith("<svg") and len(svg) < 40_000
+        assert svg.count("<polyline") == 1
+        assert len(svg_histogram(counts, edges)) < 10_000
@@ -0,0 +1,87 @@
+"""
+Tests for the content-addressed analysis result cache.
+"""
+
+import os
+import time
+
+import numpy as np
+import numpy.testing as npt
+
+from simulations.analysis.experimental_analysis import comprehensive_analysis
+from simulations.analysis.physics_validator import ValidationResult
+from simulations.analysis.result_cache import (
+    ResultCache,
+    cache_key,
+    fingerprint_data,
+)
+
+
+class TestResultCache:
+    """Test cache storage, keys and eviction."""
+
+    def test_round_trip_without_pickle(self, tmp_path):
+        """Test nested results with arrays and dataclasses round-trip."""
+        cache = ResultCache(tmp_path)
+        value = {
+            "fit": {"S0": np.float64(2.4), "fitted": np.arange(5.0)},
+            "validation": ValidationResult(True, [], ["w"], {"tsirelson": True}),
+            "interval": (0.1, 0.2),
+            "image": b"\x89PNG",
+        }
+        cache.put("k", value)
+        loaded = cache.get("k")
+
+        npt.assert_array_equal(loaded["fit"]["fitted"], np.arange(5.0))
+        assert loaded["validation"] == value["validation"]
+        assert loaded["interval"] == (0.1, 0.2)
+        assert loaded["image"] == b"\x89PNG"
+        assert cache.get("missing") is None
+
+    def test_lru_eviction_by_entry_count(self, tmp_path):
+        """Test least-recently-used entries are evicted first."""
+        cache = ResultCache(tmp_path, max_entries=2)
+        cache.put("a", np.zeros(10))
+        cache.put("b", np.zeros(10))
+        old = time.time() - 100
+        os.utime(tmp_path / "a.json", (old, old))
+        os.utime(tmp_path / "b.json", (old - 50, old - 50))
+        cache.get("b")  # b becomes most recently used
+        cache.put("c", np.zeros(10))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_data_fingerprint_tracks_content(self, make_run_data):
+        """Test equal data hashes equal and any change alters the key."""
+        data = make_run_data()
+        assert fingerprint_data(data) == fingerprint_data(make_run_data())
+
+        data.environmental_fields["magnetic_field"][0] += 1e-12
+        assert fingerprint_data(data) != fingerprint_data(make_run_data())
+        assert cache_key("a", {"x": 1}) == cache_key("a", {"x": 1})
+
+
+class TestCachedAnalysis:
+    """Test stage caching in comprehensive_analysis."""
+
+    def test_cached_results_match_and_config_change_is_partial(
+        self, tmp_path, make_run_data
+    ):
+        """Test hits reproduce results and config edits recompute one stage."""
+        data = make_run_data()
+        cache = ResultCache(tmp_path)
+        config = {"amplification_fitting": {"enable": True, "max_iterations": 5000}}
+
+        first = comprehensive_analysis(data, config=config, cache=cache)
+        misses = cache.misses
+        second = comprehensive_analysis(data, config=config, cache=cache)
+
+        assert cache.misses == misses
+        assert second.correlation_coefficients == first.correlation_coefficients
+        assert second.validation_results == first.validation_results
+
+        config["amplification_fitting"]["max_iterations"] = 6000
+        comprehensive_analysis(data, config=config, cache=cache)
+        assert cache.misses == misses + 1
@@ -0,0 +1,93 @@
+"""
+Tests for the schema-versioned HDF5 results store.
+"""
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from simulations.analysis.experimental_analysis import comprehensive_analysis
+from simulations.analysis.results_store import (
+    append_results,
+    list_runs,
+    read_results,
+    read_results_index,
+)
+
+
+class TestResultsStore:
+    """Test appending, indexing and reading back analysis results."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pytest.importorskip("h5py")
+
+    def test_append_runs_and_query_index(self, tmp_path, make_run_data):
+        """Test runs accumulate in one store with a summary index."""
+        store = tmp_path / "results.h5"
+        runs = [make_run_data(seed) for seed in range(3)]
+        for seed, data in enumerate(runs):
+            results = comprehensive_analysis(data)
+            append_results(store, data, results, run_id=f"run/{seed}")
+
+        index = read_results_index(store)
+
+        assert list_runs(store) == ["run/0", "run/1", "run/2"]
+        assert list(index["source_file"]) == [
+            "run_0.csv",
+            "run_1.csv",
+            "run_2.csv",
+        ]
+        npt.assert_allclose(
+            index["chsh_mean"], [np.mean(d.chsh_values) for d in runs]
+        )
+        assert index["n_samples"].tolist() == [2000] * 3
+
+        with pytest.raises(ValueError):
+            append_results(store, runs[0], results, run_id="run/0")
+
+    def test_results_round_trip(self, tmp_path, make_run_data):
+        """Test arrays, nested dicts, lists and None survive a round trip."""
+        store = tmp_path / "results.h5"
+        data = make_run_data()
+        results = comprehensive_analysis(data)
+        results.statistical_tests["extra"] = {
+            "none": None,
+            "empty": [],
+            "labels": ["a", "b"],
+            "mixed": [1, "x", {"y": 2.0}],
+        }
+
+        append_results(store, data, results, run_id="r")
+        run = read_results(store, "r", lazy=False)
+        stored = run["results"]
+
+        npt.assert_array_equal(
+            stored["amplification_params"]["fitted_values"],
+            results.amplification_params["fitted_values"],
+        )
+        assert stored["validation_results"]["is_valid"] is (
+            results.validation_results.is_valid
+        )
+        assert stored["validation_results"]["violations"] == []
+        assert stored["statistical_tests"]["extra"] == {
+            "none": None,
+            "empty": [],
+            "labels": ["a", "b"],
+            "mixed": [1, "x", {"y": 2.0}],
+        }
+        npt.assert_array_equal(run["data"].chsh_values, data.chsh_values)
+        assert run["metadata"]["source_file"] == "run_0.csv"
+
+    def test_schema_version_checked(self, tmp_path, make_run_data):
+        """Test stores with an unknown schema version are rejected."""
+        import h5py
+
+        store = tmp_path / "results.h5"
+        data = make_run_data()
+        append_results(store, data, comprehensive_analysis(data), run_id="r")
+        with h5py.File(store, "a") as f:
+            f.attrs["schema_version"] = 99
+
+        with pytest.raises(ValueError, match="schema version"):
+            read_results_index(store)
@@ -0,0 +1,130 @@
+"""
+Tests for incremental (streaming) analysis stages.
+"""
+
+import numpy as np
+import numpy.testing as npt
+from scipy import stats
+
+from simulations.analysis.experimental_analysis import (
+    EnvironmentalCorrelationAnalyzer,
+    ExperimentalData,
+    StatisticalValidator,
+)
+from simulations.analysis.streaming_analysis import (
+    RollingVariance,
+    StreamingAnalyzer,
+)
+
+
+def _chunks(data, chunk_size):
+    """Split experimental data into consecutive chunks."""
+    for start in range(0, len(data.timestamps), chunk_size):
+        stop = start + chunk_size
+        yield ExperimentalData(
+            timestamps=data.timestamps[start:stop],
+            chsh_values=data.chsh_values[start:stop],
+            correlations={},
+            environmental_fields={
+                k: v[start:stop] for k, v in data.environmental_fields.items()
+            },
+            detector_counts={},
+            analyzer_settings={},
+        )
+
+
+class TestStreamingAnalyzer:
+    """Test streaming stages against their batch counterparts."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(3)
+        n_points = 10000
+        field = rng.normal(0, 1, n_points) * np.linspace(0.5, 2.0, n_points)
+        self.data = ExperimentalData(
+            timestamps=np.arange(n_points) * 0.01,
+            chsh_values=2.4 + 0.05 * rng.standard_normal(n_points),
+            correlations={},
+            environmental_fields={"magnetic_field": field},
+            detector_counts={},
+            analyzer_settings={},
+        )
+
+    def test_rolling_variance_matches_batch(self):
+        """Test chunked rolling variance equals the centred pandas window."""
+        field = self.data.environmental_fields["magnetic_field"]
+        batch = EnvironmentalCorrelationAnalyzer().calculate_field_variance(
+            field, window_size=100
+        )
+
+        rolling = RollingVariance(100)
+        labels, values = [], []
+        for start in range(0, len(field), 333):
+            first, variance = rolling.update(field[start : start + 333])
+            labels.extend(range(first, first + len(variance)))
+            values.extend(variance)
+
+        npt.assert_allclose(values, batch[labels], rtol=1e-8)
+        assert len(values) == len(field) - 99
+
+    def test_summary_matches_batch_statistics(self):
+        """Test chunked Bell test and field correlation match full-array results."""
+        analyzer = StreamingAnalyzer(window_size=100)
+        for chunk in _chunks(self.data, 777):
+            summary = analyzer.update(chunk)
+
+        bell = StatisticalValidator().bell_inequality_test(self.data.chsh_values)
+        npt.assert_allclose(summary["bell_test"]["mean_chsh"], bell["mean_chsh"])
+        npt.assert_allclose(summary["bell_test"]["std_chsh"], bell["std_chsh"])
+        npt.assert_allclose(
+            summary["bell_test"]["classical_p_value"],
+            bell["classical_p_value"],
+            atol=1e-300,
+        )
+
+        field = self.data.environmental_fields["magnetic_field"]
+        variance = EnvironmentalCorrelationAnalyzer().calculate_field_variance(
+            field, window_size=100
+        )
+        r, _ = stats.pearsonr(self.data.chsh_values[50:-49], variance[50:-49])
+        corr = summary["field_correlations"]["magnetic_field"]
+        npt.assert_allclose(corr["correlation_coefficient"], r, rtol=1e-8)
+        assert summary["n_samples"] == len(self.data.timestamps)
+
+
+class TestCampaignStatistics:
+    """Test cross-run aggregation from per-run summaries."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(11)
+        self.runs = [
+            2.4 + 0.05 * rng.standard_normal(n) for n in (500, 1200, 800)
+        ]
+        self.validator = StatisticalValidator()
+
+    def test_pooled_bell_test_matches_concatenated_runs(self):
+        """Test pooling run moments equals testing the concatenated series."""
+        pooled = self.validator.pooled_bell_test(
+            [len(r) for r in self.runs],
+            [np.mean(r) for r in self.runs],
+            [np.sum((r - np.mean(r)) ** 2) for r in self.runs],
+        )
+        combined = self.validator.bell_inequality_test(np.concatenate(self.runs))
+
+        npt.assert_allclose(pooled["mean_chsh"], combined["mean_chsh"])
+        npt.assert_allclose(pooled["std_chsh"], combined["std_chsh"])
+        assert pooled["n_runs"] == 3
+        assert pooled["heterogeneity_p_value"] > 0.001
+
+    def test_meta_analysis_of_identical_correlations(self):
+        """Test identical per-run correlations pool to the same value."""
+        meta = self.validator.correlation_meta_analysis(
+            [0.2, 0.2, 0.2], [1000, 2000, 500]
+        )
+
+        npt.assert_allclose(meta["correlation"], 0.2)
+        assert meta["i_squared"] == 0.0
+        assert meta["is_significant"]
+        lower, upper = meta["confidence_interval"]
+        assert lower < 0.2 < upper
@@ -0,0 +1,130 @@
+"""
+Tests for streaming (online) validation of acquisition data.
+"""
+
+import numpy as np
+import numpy.testing as npt
+from scipy import stats
+
+from simulations.analysis.physics_validator import ExperimentalValidator
+from simulations.analysis.streaming_validator import RunningMoments
+
+
+def _feed(detector, data, time_stamps, block_size=1000):
+    """Feed data to a streaming detector in fixed-size blocks."""
+    for start in range(0, len(data), block_size):
+        stop = start + block_size
+        detector.update(data[start:stop], time_stamps[start:stop])
+
+
+class TestOnlineDriftDetector:
+    """Test online drift and step detection."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.validator = ExperimentalValidator()
+        self.rng = np.random.default_rng(42)
+        self.n_points = 20000
+        self.time_stamps = np.arange(self.n_points) * 1e-3
+
+    def test_incremental_regression_matches_linregress(self):
+        """Test block-merged regression equals a full-array fit."""
+        data = 0.01 * self.time_stamps + self.rng.normal(0, 1, self.n_points)
+        moments = RunningMoments()
+        for start in range(0, self.n_points, 777):
+            moments.update(
+                self.time_stamps[start : start + 777],
+                data[start : start + 777],
+            )
+
+        fit = moments.linear_fit()
+        reference = stats.linregress(self.time_stamps, data)
+
+        npt.assert_allclose(fit["slope"], reference.slope, rtol=1e-9)
+        npt.assert_allclose(fit["r_value"], reference.rvalue, rtol=1e-9)
+        npt.assert_allclose(fit["p_value"], reference.pvalue, rtol=1e-6)
+
+    def test_stationary_noise_raises_no_events(self):
+        """Test white noise passes all online checks."""
+        detector = self.validator.create_drift_monitor()
+        data = self.rng.normal(0, 1, self.n_points)
+        _feed(detector, data, self.time_stamps)
+
+        assert detector.events == []
+        assert detector.summary().is_valid
+
+    def test_step_change_detected_promptly(self):
+        """Test a mean shift is reported shortly after it occurs."""
+        events = []
+        detector = self.validator.create_drift_monitor(on_event=events.append)
+        data = self.rng.normal(0, 1, self.n_points)
+        data[self.n_points // 2 :] += 3.0
+        _feed(detector, data, self.time_stamps)
+
+        shifts = [e for e in events if e.kind == "mean_shift"]
+        assert shifts
+        assert 0 <= shifts[0].sample_index - self.n_points // 2 < 1000
+
+    def test_linear_drift_flagged(self):
+        """Test linear drift matches the batch drift criterion."""
+        detector = self.validator.create_drift_monitor()
+        data = self.rng.normal(0, 1, self.n_points) + np.linspace(
+            0, 2, self.n_points
+        )
+        _feed(detector, data, self.time_stamps)
+
+        batch = self.validator.detect_systematic_drifts(data, self.time_stamps)
+        summary = detector.summary()
+
+        assert not summary.bounds_checked["linear_drift"]
+        assert (
+            summary.bounds_checked["linear_drift"]
+            == batch.bounds_checked["linear_drift"]
+        )
+
+
+class TestStreamingCountValidator:
+    """Test streaming Poisson statistics validation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.validator = ExperimentalValidator()
+        self.rng = np.random.default_rng(7)
+        self.detectors = ["A_plus", "A_minus", "B_plus", "B_minus"]
+
+    def test_running_moments_match_full_array(self):
+        """Test streamed dispersion index equals the batch variance/mean."""
+        monitor = self.validator.create_count_monitor(
+            self.detectors, expected_rate=1e4, measurement_time=1e-2
+        )
+        counts = self.rng.poisson(100, (4, 5000))
+        for start in range(0, 5000, 1234):
+            monitor.update(counts[:, start : start + 1234])
+
+        expected = np.var(counts, axis=1) / np.mean(counts, axis=1)
+        npt.assert_allclose(
+            list(monitor.dispersion_index.values()), expected, rtol=1e-10
+        )
+        assert monitor.n_windows == 5
+        assert monitor.summary().is_valid
+
+    def test_non_poisson_detector_flagged_live(self):
+        """Test afterpulsing and saturation are flagged per window."""
+        events = []
+        monitor = self.validator.create_count_monitor(
+            self.detectors,
+            expected_rate=1e4,
+            measurement_time=1e-2,
+            window_size=500,
+            on_event=events.append,
+        )
+        counts = self.rng.poisson(100, (4, 500))
+        counts[1] = (counts[1] * 1.5).astype(int)  # Over-dispersed
+        counts[2] = np.minimum(counts[2], 100)  # Saturated
+
+        monitor.update(dict(zip(self.detectors, counts)))
+
+        kinds = {(e.detector, e.kind) for e in events}
+        assert ("A_minus", "overdispersion") in kinds
+        assert ("B_plus", "underdispersion") in kinds
+        assert not any(e.detector == "A_plus" for e in events)